@@ -1,25 +1,40 @@
-import os
+import argparse
 
 from canvas.canvas_manager import CanvasManager
-import canvas.utils.json_util as json_util
+from canvasutils.httputil.response_cache import ResponseCache # type: ignore
+from canvasutils.jsonutil import json_util # type: ignore
 
-def generate_json_file(file_name):
-    canvas_manager = CanvasManager()
-    res = canvas_manager.get_all_courses_json()
-    print(len(res))
-    print(json_util.store_json_object(res, file_name))
+CACHE_FILE = '.canvas_cache.sqlite'
+
+def generate_json_file(file_name, response_cache):
+    # Courses are written page by page as they arrive, never held all at once.
+    # Pages still fresh in the response cache are not requested again.
+    with CanvasManager(response_cache=response_cache) as canvas_manager:
+        courses = canvas_manager.iter_items('courses')
+        # Written to a temporary file, renamed over file_name once complete:
+        # an interrupted download never leaves a truncated courses.json
+        saved = json_util.store_json_items(courses, file_name, write_count=True)
+        print(saved)
+        return saved
 
 def main():
+    parser = argparse.ArgumentParser(description="Download all Canvas courses to a JSON file")
+    parser.add_argument('--refresh', action='store_true',
+                        help="ignore cached responses and download everything again")
+    args = parser.parse_args()
+
     file_name = 'courses.json'
-    if not os.path.exists(file_name):
-        print(f"{file_name} not found. Generating...")
-        generate_json_file(file_name)
-    else:
-        print(f"{file_name} already exists.")
+    response_cache = ResponseCache(CACHE_FILE, refresh=args.refresh)
+    print(f"Generating {file_name}{' (refreshing cache)' if args.refresh else ''}...")
+    saved = generate_json_file(file_name, response_cache)
+    print(f"Cache: {response_cache.hits} fresh, {response_cache.stale_hits} stale, "
+          f"{response_cache.misses} requested")
+    response_cache.close()
+    if saved is None:
+        return
 
     count = json_util.count_elements_in_json(file_name)
     print(f"Number of courses found: {count}")
 
 if __name__ == "__main__":
     main()
-
@@ -21,10 +21,19 @@ from dotenv import load_dotenv
 import requests
 import json
 import os
-from typing import Dict, List, Optional
+import sys
+from typing import Dict, Iterator, List, Optional, Tuple
 import logging
 import re
 
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from canvasutils.httputil import http_session, projection # type: ignore
+from canvasutils.jsonutil import json_util # type: ignore
+from canvasutils.jsonutil.course_records import CourseDetails # type: ignore
+from canvasutils.httputil.pagination import PaginationError # type: ignore
+from canvasutils.httputil.retry import RetryPolicy, install_retry # type: ignore
+from canvasutils.httputil.throttle import install_throttle # type: ignore
+
 # Configure logging for educational purposes
 logging.basicConfig(
     level=logging.INFO,
@@ -33,6 +42,9 @@ logging.basicConfig(
 filename='canvas_mapper.log'  # Add this line if you want to log to a file
 logger = logging.getLogger(__name__)
 
+# The only course fields the mapping reads; everything else is dropped on arrival
+COURSE_MAPPING_FIELDS = ('id', 'name', 'course_code')
+
 
 class CanvasCourseMapper:
     """
@@ -41,13 +53,17 @@ class CanvasCourseMapper:
     This demonstrates object-oriented programming concepts and encapsulation.
     """
     
-    def __init__(self, canvas_url: str, api_token: str):
+    def __init__(self, canvas_url: str, api_token: str, throttle=None, retry=None):
         """
         Initialize the Canvas API client.
         
         Args:
             canvas_url (str): Your Canvas instance URL (e.g., 'https://youruniversity.instructure.com')
             api_token (str): Your Canvas API token
+            throttle: Optional RateLimitThrottle (canvasutils.httputil.throttle) shared
+                      with the other Canvas clients that use the same token
+            retry: RetryPolicy (canvasutils.httputil.retry) for failed pages;
+                   a default policy is used if None
         """
         self.canvas_url = canvas_url.rstrip('/')  # Remove trailing slash if present
         self.api_token = api_token
@@ -55,21 +71,44 @@ class CanvasCourseMapper:
             'Authorization': f'Bearer {api_token}',
             'Content-Type': 'application/json'
         }
+        # Pooled keep-alive session; the throttle paces it by the rate-limit headers
+        self.session = http_session.create_session(self.headers)
+        if throttle:
+            install_throttle(self.session, throttle)
+        # Transient errors (429, 5xx, resets, timeouts) retry the same page
+        install_retry(self.session, retry or RetryPolicy())
+        # Bytes received versus kept after pruning courses to the requested fields
+        self.projection_stats = projection.ProjectionStats()
         
         logger.info("Canvas API client initialized")
     
-    def get_all_courses(self, per_page: int = 100) -> List[Dict]:
+    def iter_courses(self, per_page: int = 100, start_page: int = 1,
+                     fields: Optional[Tuple[str, ...]] = None) -> Iterator[Dict]:
         """
-        Retrieve all courses from Canvas API.
+        Yield courses from Canvas API one page at a time, as each page arrives.
+        
+        Only the current page is held in memory, so the courses can be
+        processed or written out incrementally.
         
         Args:
             per_page (int): Number of courses to retrieve per API call
+            start_page (int): Page to start from (to resume an interrupted run)
+            fields (tuple): Course fields to keep (e.g. 'term.name'); only the
+                include[] values they need are requested. None (the default)
+                keeps the full course objects with the term included;
+                COURSE_MAPPING_FIELDS is all create_course_mapping needs.
             
-        Returns:
-            List[Dict]: List of course dictionaries
+        Yields:
+            Dict: One course dictionary at a time
+
+        Raises:
+            PaginationError: A page failed even after retries; its page
+                attribute is the start_page to resume from.
         """
-        courses = []
-        page = 1
+        count = 0
+        page = start_page
+        tree = projection.field_tree(fields) if fields else None
+        includes = projection.includes_for(fields) if fields else ['term']
         
         while True:
             # Construct API endpoint URL
@@ -79,43 +118,81 @@ class CanvasCourseMapper:
             params = {
                 'per_page': per_page,
                 'page': page,
-                'include[]': ['course_code', 'name', 'term'],  # Include additional course info
+                'include[]': includes,  # Only the additional course info that is used
                 'state[]': ['available', 'completed', 'unpublished']  # Include different course states
             }
             
             try:
                 logger.info(f"Fetching page {page} of courses...")
-                response = requests.get(url, headers=self.headers, params=params)
+                response = self.session.get(url, params=params)
                 
                 # Check if request was successful
                 response.raise_for_status()
                 
-                # Parse JSON response
-                page_courses = response.json()
+                # Parse JSON response, keeping only the requested fields
+                if tree is None:
+                    page_courses = response.json()
+                else:
+                    page_courses = projection.project_response(response, tree, self.projection_stats)
                 
                 # If no courses returned, we've reached the end
                 if not page_courses:
                     break
                 
-                courses.extend(page_courses)
                 page += 1
                 
                 logger.info(f"Retrieved {len(page_courses)} courses from page {page-1}")
                 
             except requests.exceptions.RequestException as e:
                 logger.error(f"Error fetching courses: {e}")
-                break
+                raise PaginationError(url, [], e, page=page) from e
             except json.JSONDecodeError as e:
                 logger.error(f"Error parsing JSON response: {e}")
-                break
+                raise PaginationError(url, [], e, page=page) from e
+
+            yield from page_courses
+            count += len(page_courses)
         
-        logger.info(f"Total courses retrieved: {len(courses)}")
+        logger.info(f"Total courses retrieved: {count}")
+    
+    def get_all_courses(self, per_page: int = 100, start_page: int = 1,
+                        fields: Optional[Tuple[str, ...]] = None) -> List[Dict]:
+        """
+        Retrieve all courses from Canvas API.
+        
+        Args:
+            per_page (int): Number of courses to retrieve per API call
+            start_page (int): Page to start from (to resume an interrupted run)
+            fields (tuple): Course fields to keep (see iter_courses)
+            
+        Returns:
+            List[Dict]: List of course dictionaries
+
+        Raises:
+            PaginationError: A page failed even after retries. It carries the
+                courses fetched so far (results) and the failed page (page):
+                courses = e.results + mapper.get_all_courses(start_page=e.page)
+        """
+        courses = []
+        try:
+            courses.extend(self.iter_courses(per_page, start_page, fields))
+        except PaginationError as e:
+            e.results = courses
+            raise
         return courses
     
-    def create_course_mapping(self, courses) -> Dict[str, Dict[str, str]]:
+    def iter_course_mapping(self, courses, compact: bool = False) -> Iterator[Tuple[str, Dict[str, str]]]:
         """
-        Create a mapping with course_id as key and course details as dictionary.
+        Yield (course_id, course details) pairs one course at a time.
         Extract year and semester from course_name.
+        
+        Works on any iterable of courses, e.g. iter_courses(), so a mapping
+        can be written out without holding every course in memory.
+        
+        With compact=True the details are read-only CourseDetails records
+        (canvasutils.jsonutil.course_records) instead of dicts: same keys and
+        dict API, a fraction of the memory, with repeated strings such as the
+        year and semester shared.
         """
         def _parse_year_semester_from_name(course_name):
             """
@@ -185,8 +262,6 @@ class CanvasCourseMapper:
             
             return title, year, semester
 
-        course_map = {}
-        
         for course in courses:
             # Extract basic course information
             course_id = str(course.get('id', 'Unknown'))
@@ -204,10 +279,18 @@ class CanvasCourseMapper:
                 "year": year,
                 "semester": semester
             }
+            if compact:
+                course_details = CourseDetails(**course_details)
             
-            course_map[course_id] = course_details
-        
-        return course_map
+            yield course_id, course_details
+    
+    def create_course_mapping(self, courses, compact: bool = False) -> Dict[str, Dict[str, str]]:
+        """
+        Create a mapping with course_id as key and course details as dictionary.
+        Extract year and semester from course_name.
+        compact=True keeps the details as CourseDetails records (see iter_course_mapping).
+        """
+        return dict(self.iter_course_mapping(courses, compact))
 
     
     def save_mapping_to_file(self, course_map: Dict[str, str], filename: str = 'course_mapping.json'):
@@ -220,13 +303,29 @@ class CanvasCourseMapper:
         """
         try:
             with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(course_map, f, indent=2, ensure_ascii=False)
+                # default=dict writes CourseDetails records like the dicts they replace
+                json.dump(course_map, f, indent=2, ensure_ascii=False, default=dict)
             
             logger.info(f"Course mapping saved to {filename}")
             
         except IOError as e:
             logger.error(f"Error saving to file: {e}")
     
+    def export_course_mapping(self, filename: str = 'course_mapping.json', per_page: int = 100):
+        """
+        Fetch every course and write its mapping entry as each page arrives.
+        
+        Unlike get_all_courses + create_course_mapping + save_mapping_to_file,
+        memory use does not grow with the number of courses.
+        
+        Args:
+            filename (str): Output filename
+            per_page (int): Number of courses to retrieve per API call
+        """
+        pairs = self.iter_course_mapping(self.iter_courses(per_page, fields=COURSE_MAPPING_FIELDS))
+        if json_util.store_json_pairs(pairs, filename):
+            logger.info(f"Course mapping saved to {filename}")
+    
     def print_course_mapping(self, course_map: Dict[str, str], limit: Optional[int] = None):
         """
         Print the course mapping in a readable format.
@@ -298,7 +397,9 @@ def main():
         
         # Retrieve courses from Canvas
         print("\nFetching courses from Canvas...")
-        courses = mapper.get_all_courses()
+        # Only the fields the mapping reads are kept
+        courses = mapper.get_all_courses(fields=COURSE_MAPPING_FIELDS)
+        mapper.projection_stats.report()
         
         if not courses:
             print("No courses found or error occurred during retrieval.")
@@ -1,6 +1,11 @@
 import json
+import os
+import sys
 from typing import Dict, List, Any, Optional
 
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from canvasutils.jsonutil.jsonl_snapshot import JsonlSnapshot # type: ignore
+
 class CourseDataAnalyzer:
     """
     A class to analyze course data stored in JSON format.
@@ -10,10 +15,12 @@ class CourseDataAnalyzer:
     - JSON data processing
     - Data filtering and searching
     - Error handling
+    - Random access to a JSON Lines snapshot
     """
     
     def __init__(self):
         self.courses_data = {}
+        self.snapshot = None
     
     def read_json_file(self, file_path: str) -> bool:
         """
@@ -45,6 +52,45 @@ class CourseDataAnalyzer:
             print(f"Error reading file: {e}")
             return False
     
+    def save_snapshot(self, file_path: str) -> bool:
+        """
+        Save the loaded course data as a JSON Lines snapshot: one
+        [course_id, course_info] line per course, plus an id -> offset
+        index (file_path.idx).
+        
+        Args:
+            file_path (str): Path to the snapshot file
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        with JsonlSnapshot(file_path, key=0) as snapshot:
+            return snapshot.write(self.courses_data.items()) is not None
+    
+    def open_snapshot(self, file_path: str) -> bool:
+        """
+        Open a JSON Lines snapshot for find_course_by_id without loading it:
+        only its offset index is read.
+        
+        Args:
+            file_path (str): Path to the snapshot file
+            
+        Returns:
+            bool: True if successful, False otherwise
+            
+        Example:
+            analyzer = CourseDataAnalyzer()
+            analyzer.open_snapshot("courses.jsonl")
+            course = analyzer.find_course_by_id("81929")
+        """
+        try:
+            self.snapshot = JsonlSnapshot(file_path, key=0)
+            print(f"Successfully opened snapshot of {len(self.snapshot)} courses from {file_path}")
+            return True
+        except Exception as e:
+            print(f"Error opening snapshot: {e}")
+            return False
+    
     def find_courses_by_year_semester(self, year: str, semester: str) -> Dict[str, Any]:
         """
         Find all courses matching the specified year and semester.
@@ -77,8 +123,14 @@ class CourseDataAnalyzer:
             
         Returns:
             Optional[Dict[str, Any]]: Course information or None if not found
+        
+        With a snapshot open (open_snapshot) the course not loaded is read
+        alone from it.
         """
-        return self.courses_data.get(course_id)
+        if self.snapshot is None or course_id in self.courses_data:
+            return self.courses_data.get(course_id)
+        record = self.snapshot.get(course_id)
+        return record[1] if record else None
     
     def get_all_years(self) -> List[str]:
         """
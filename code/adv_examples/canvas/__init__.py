@@ -1 +1,6 @@
-from .utils.json_processor import JsonProcessor
+import os
+import sys
+
+# canvasutils lives next to adv_examples (code/canvasutils)
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from canvasutils.jsonutil.json_processor import JsonProcessor
@@ -0,0 +1,217 @@
+# Asyncio Canvas API client
+# Same make_request / get_all_courses_json surface as CanvasManager, but one
+# event loop can sweep hundreds of courses at the same time.
+
+import asyncio
+import itertools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+from canvasutils.httputil import pagination, projection
+from .canvas_manager import CanvasManager
+
+# Requests in flight across all hosts
+DEFAULT_MAX_CONCURRENCY = 32
+# Requests in flight to a single Canvas host (also the per-host pool size)
+DEFAULT_LIMIT_PER_HOST = 8
+
+class AsyncCanvasManager:
+    """
+    Asyncio front-end for CanvasManager.
+
+    This is a thread-pool wrapper, not asyncio I/O: each HTTP request is a
+    blocking requests call on the pooled CanvasManager session, run in a
+    worker thread (at most max_concurrency of them), so the event loop is
+    never blocked. A global semaphore bounds the total number of requests in
+    flight and a semaphore per host bounds the connections opened to each
+    Canvas instance.
+
+    Example:
+        async with AsyncCanvasManager() as manager:
+            courses = await manager.get_all_courses_json()
+            listings = await manager.make_requests(
+                [f"courses/{c['id']}/assignments" for c in courses])
+
+    Existing blocking scripts can use the *_sync wrappers instead:
+        with AsyncCanvasManager() as manager:
+            courses = manager.get_all_courses_json_sync()
+    """
+
+    def __init__(self, api_url=None, api_key=None,
+                 max_concurrency=DEFAULT_MAX_CONCURRENCY,
+                 limit_per_host=DEFAULT_LIMIT_PER_HOST, timeout=30, throttle=None,
+                 retry=None, conditional_cache=None, single_flight=None, response_cache=None,
+                 cassette=None):
+        self.manager = CanvasManager(api_url, api_key, pool_maxsize=limit_per_host,
+                                     timeout=timeout, throttle=throttle, retry=retry,
+                                     conditional_cache=conditional_cache,
+                                     single_flight=single_flight,
+                                     response_cache=response_cache,
+                                     cassette=cassette)
+        self.max_concurrency = max_concurrency
+        self.limit_per_host = limit_per_host
+        self.executor = ThreadPoolExecutor(max_workers=max_concurrency)
+
+        # Semaphores belong to one event loop; they are created on first use
+        self._loop = None
+        self._semaphore = None
+        self._host_semaphores = {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        # close() waits for the workers; in another thread, so the loop runs meanwhile
+        await asyncio.to_thread(self.close)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Stop the worker threads and close the pooled session"""
+        self.executor.shutdown(wait=True)
+        self.manager.close()
+
+    def _limits(self, url):
+        """Return the (global, per-host) semaphores for a request to url"""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._host_semaphores = {}
+
+        host = urlparse(url).netloc
+        if host not in self._host_semaphores:
+            self._host_semaphores[host] = asyncio.Semaphore(self.limit_per_host)
+        return self._semaphore, self._host_semaphores[host]
+
+    def _fetch(self, method, url, data=None, params=None, tree=None):
+        """Blocking request and JSON decoding (and projection), run in a worker thread"""
+        response = self.manager._send(method, url, data=data, params=params)
+        return self.manager._page_items(response, tree), response.links
+
+    async def _send(self, method, url, data=None, params=None, tree=None):
+        """Run one request in the worker pool within the concurrency limits"""
+        semaphore, host_semaphore = self._limits(url)
+        # Wait for the host slot first so a busy host does not hold global slots
+        async with host_semaphore, semaphore:
+            return await self._loop.run_in_executor(
+                self.executor, self._fetch, method, url, data, params, tree)
+
+    async def _get_page(self, url, tree=None):
+        items, _ = await self._send('GET', url, tree=tree)
+        return items
+
+    async def iter_pages(self, endpoint, method='GET', data=None, params=None, parallel=False,
+                         start_url=None, fields=None):
+        """
+        Async generator over the items of each page, as each page arrives
+
+        Behaves like CanvasManager.iter_pages, including PaginationError,
+        start_url and fields. With parallel=True the pages announced by the
+        rel="last" link are requested concurrently and yielded in page order.
+        """
+        url = start_url or f"{self.manager.url}/{endpoint}"
+        tree = projection.field_tree(fields) if fields else None
+        if start_url:
+            params = None  # already part of the page URL
+        elif fields:
+            params = projection.with_includes(params, fields)
+
+        while url:
+            try:
+                items, links = await self._send(method, url, data=data, params=params, tree=tree)
+                yield items
+
+                page_urls = None
+                if parallel and method == 'GET':
+                    page_urls = pagination.remaining_page_urls(links)
+                    parallel = False  # only the first response decides
+
+                if page_urls:
+                    # Like pagination.fetch_pages: the listing's pages share one
+                    # host, so at most limit_per_host are in flight and twice
+                    # that many are held waiting for the consumer
+                    window = 2 * self.limit_per_host
+                    urls = iter(page_urls)
+                    pending = deque((u, asyncio.ensure_future(self._get_page(u, tree)))
+                                    for u in itertools.islice(urls, window))
+                    try:
+                        while pending:
+                            # url is the page being waited for, should it fail
+                            url, task = pending.popleft()
+                            items = await task
+                            for u in itertools.islice(urls, 1):
+                                pending.append((u, asyncio.ensure_future(self._get_page(u, tree))))
+                            yield items
+                    finally:
+                        for _, task in pending:
+                            task.cancel()
+                    url = None
+                elif 'next' in links:
+                    url = links['next']['url']
+                    params = None  # only needed for the first request
+                else:
+                    url = None
+            except Exception as e:
+                # The failed page with its params, so start_url resumes it as sent
+                raise pagination.PaginationError(pagination.page_url(url, params), [], e) from e
+
+    async def iter_items(self, endpoint, **kwargs):
+        """Async generator over the items of a listing one by one"""
+        async for items in self.iter_pages(endpoint, **kwargs):
+            for item in items:
+                yield item
+
+    async def make_request(self, endpoint, method='GET', data=None, params=None, parallel=False,
+                           start_url=None, fields=None):
+        """
+        Make a request to the Canvas API and handle pagination
+
+        Behaves like CanvasManager.make_request, including PaginationError,
+        start_url and fields.
+        """
+        results = []
+        try:
+            async for items in self.iter_pages(endpoint, method=method, data=data, params=params,
+                                               parallel=parallel, start_url=start_url,
+                                               fields=fields):
+                results.extend(items)
+        except pagination.PaginationError as e:
+            e.results = results
+            raise
+
+        return results
+
+    async def make_requests(self, endpoints, **kwargs):
+        """
+        Fetch several endpoints concurrently; results are in endpoint order.
+        The first PaginationError is raised once every endpoint has finished.
+        """
+        listings = await asyncio.gather(*(self.make_request(endpoint, **kwargs)
+                                          for endpoint in endpoints),
+                                        return_exceptions=True)
+        for listing in listings:
+            if isinstance(listing, Exception):
+                raise listing
+        return listings
+
+    async def get_all_courses_json(self, parallel=False):
+        """Fetch all courses and return as JSON"""
+        courses = await self.make_request('courses', parallel=parallel)
+        return courses
+
+    # Sync wrappers for scripts that are not written with asyncio
+
+    def make_request_sync(self, *args, **kwargs):
+        return asyncio.run(self.make_request(*args, **kwargs))
+
+    def make_requests_sync(self, endpoints, **kwargs):
+        return asyncio.run(self.make_requests(endpoints, **kwargs))
+
+    def get_all_courses_json_sync(self, parallel=False):
+        return asyncio.run(self.get_all_courses_json(parallel=parallel))
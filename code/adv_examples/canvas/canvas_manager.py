@@ -3,16 +3,78 @@
 
 import os
 from dotenv import load_dotenv
-import requests
+
+from canvasutils import counting
+from canvasutils.httputil import http_session, pagination, projection
+from canvasutils.httputil.cassette import install_cassette
+from canvasutils.httputil.etag_cache import install_conditional_cache
+from canvasutils.httputil.response_cache import install_response_cache
+from canvasutils.httputil.retry import RetryPolicy, install_retry
+from canvasutils.httputil.single_flight import install_single_flight
+from canvasutils.httputil.throttle import install_throttle
 
 class CanvasManager:
-    def __init__(self):
-        self.load_environment()
+    def __init__(self, api_url=None, api_key=None,
+                 pool_connections=http_session.DEFAULT_POOL_CONNECTIONS,
+                 pool_maxsize=http_session.DEFAULT_POOL_MAXSIZE,
+                 timeout=30, max_workers=pagination.DEFAULT_MAX_WORKERS, throttle=None,
+                 retry=None, conditional_cache=None, single_flight=None, response_cache=None,
+                 cassette=None):
+        # One pooled keep-alive session is reused for every request
+        self.session = http_session.create_session(pool_connections=pool_connections,
+                                                   pool_maxsize=pool_maxsize)
+        # Optional Cassette: record all traffic to a file, or replay it without the network
+        if cassette:
+            install_cassette(self.session, cassette)
+        # Optional RateLimitThrottle shared with the other clients of this token
+        if throttle:
+            install_throttle(self.session, throttle)
+        # 429/5xx responses, resets and timeouts are retried with jittered backoff
+        self.retry = retry or RetryPolicy()
+        install_retry(self.session, self.retry)
+        # Optional ConditionalCache: unchanged GETs come back as 304 and are served from disk
+        if conditional_cache:
+            install_conditional_cache(self.session, conditional_cache)
+        # Optional SingleFlight: identical GETs in flight at once share one request
+        if single_flight:
+            install_single_flight(self.session, single_flight)
+        # Optional ResponseCache: GETs within their endpoint's TTL never reach Canvas
+        if response_cache:
+            install_response_cache(self.session, response_cache)
+        self.timeout = timeout
+        # Upper bound on concurrent page fetches in parallel mode (keep <= pool_maxsize)
+        self.max_workers = max_workers
+        # Bytes received versus kept by listings fetched with fields=
+        self.projection_stats = projection.ProjectionStats()
+
+        if api_url and api_key:
+            self.set_credentials(api_url, api_key)
+        else:
+            self.load_environment()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Close the session and release its pooled connections"""
+        self.session.close()
 
     def get_canvas_instance(self):
         """Returns the Canvas instance"""
         return self.canvas
 
+    def set_credentials(self, api_url, api_key):
+        """Set the Canvas URL and the API key used for every request"""
+        self.headers = {
+            'Authorization': f'Bearer {api_key}',
+            'Content-Type': 'application/json'
+        }
+        self.url = f'{api_url.rstrip("/")}/api/v1'
+        self.graphql_url = f'{api_url.rstrip("/")}/api/graphql'
+
     def load_environment(self):
         """Check if .env file exists and has required variables"""
         if not os.path.exists('.env'):
@@ -36,48 +98,142 @@ class CanvasManager:
                 print(f"   - {var}")
             return False
 
-        self.headers = {
-            'Authorization': f'Bearer {os.getenv(required_vars[0])}',
-            'Content-Type': 'application/json'
-        }
-        self.url = f'{os.getenv(required_vars[1])}/api/v1'
+        self.set_credentials(os.getenv(required_vars[1]), os.getenv(required_vars[0]))
 
         print("✅ Environment variables configured")
         return True
 
-    def make_request(self, endpoint, method='GET', data=None, params=None):
-        """Make a request to the Canvas API and handle pagination"""
-        url = f"{self.url}/{endpoint}"
-        results = []
+    def _send(self, method, url, data=None, params=None):
+        """Send one request with the pooled session and check its status"""
+        if method == 'GET':
+            response = self.session.get(url, headers=self.headers, params=params,
+                                        timeout=self.timeout)
+        elif method == 'POST':
+            response = self.session.post(url, headers=self.headers, json=data,
+                                         timeout=self.timeout)
+        else:
+            raise ValueError("Invalid HTTP method")
+
+        response.raise_for_status()
+        return response
+
+    def graphql(self, query, variables=None):
+        """Run one GraphQL query (POST /api/graphql) and return the response JSON"""
+        data = {'query': query, 'variables': variables or {}}
+        return self._send('POST', self.graphql_url, data=data).json()
+
+    def _page_items(self, response, tree=None):
+        """Items of a page, pruned to the field tree on arrival if there is one"""
+        if tree is None:
+            return response.json()
+        return projection.project_response(response, tree, self.projection_stats)
+
+    def _get_page(self, url, tree=None):
+        """Fetch one page URL and return its items"""
+        return self._page_items(self._send('GET', url), tree)
+
+    def iter_pages(self, endpoint, method='GET', data=None, params=None, parallel=False,
+                   start_url=None, fields=None):
+        """
+        Yield the items of each page of a Canvas API listing as it arrives
+
+        Only the current page is held in memory, so a listing of any size
+        can be processed or written out incrementally.
+
+        With parallel=True (GET only) the page count is read from the first
+        response's rel="last" link and the remaining pages are fetched
+        concurrently by up to max_workers threads, still yielded in page
+        order. Listings paginated with opaque bookmarks are walked page by page.
+
+        Each page is retried according to self.retry. If a page still fails,
+        PaginationError is raised with the URL of the failed page; pass it
+        as start_url to resume from there.
+
+        With fields (e.g. ['id', 'name', 'term.name']) only the include[]
+        values those fields need are requested, every item is pruned to
+        them as its page arrives, and the bytes saved are counted in
+        self.projection_stats.
+        """
+        url = start_url or f"{self.url}/{endpoint}"
+        tree = projection.field_tree(fields) if fields else None
+        if start_url:
+            params = None  # already part of the page URL
+        elif fields:
+            params = projection.with_includes(params, fields)
 
         while url:
             try:
-                if method == 'GET':
-                    response = requests.get(url, headers=self.headers, params=params)
-                elif method == 'POST':
-                    response = requests.post(url, headers=self.headers, json=data)
-                else:
-                    raise ValueError("Invalid HTTP method")
+                response = self._send(method, url, data=data, params=params)
+                yield self._page_items(response, tree)
 
-                response.raise_for_status()
-                results.extend(response.json())
+                page_urls = None
+                if parallel and method == 'GET':
+                    page_urls = pagination.remaining_page_urls(response.links)
+                    parallel = False  # only the first response decides
 
+                if page_urls:
+                    # Numbered pages: fetch the remaining pages concurrently
+                    pages = pagination.fetch_pages(lambda u: self._get_page(u, tree), page_urls,
+                                                   self.max_workers)
+                    for url in page_urls:
+                        # url is the page being waited for, should it fail
+                        yield next(pages)
+                    url = None
                 # Look for pagination in Link header
                 # link: 
                 # <https://nku.instructure.com/api/v1/courses?page=2&per_page=10>; rel="next",
-                if 'next' in response.links:
+                elif 'next' in response.links:
                     url = response.links['next']['url'] # python parses the link
                     params = None  # only needed for the first request
                 else:
                     url = None
             except Exception as e:
-                print(f"❌ Error making request to {url}: {e}")
-                break
+                # The failed page with its params, so start_url resumes it as sent
+                raise pagination.PaginationError(pagination.page_url(url, params), [], e) from e
+
+    def count(self, endpoint, params=None):
+        """
+        Number of items of a listing without downloading them: one per_page=1
+        request and the rel="last" page number, or a page-by-page count when
+        the listing has no numbered last page
+        """
+        def get(url, params):
+            response = self._send('GET', url, params=params)
+            return response.json(), response.links
+
+        return counting.count_listing(get, f"{self.url}/{endpoint}", params)
+
+    def iter_items(self, endpoint, **kwargs):
+        """Yield the items of a Canvas API listing one by one (see iter_pages)"""
+        for items in self.iter_pages(endpoint, **kwargs):
+            yield from items
+
+    def make_request(self, endpoint, method='GET', data=None, params=None, parallel=False,
+                     start_url=None, fields=None):
+        """
+        Make a request to the Canvas API and handle pagination
+
+        Collects every page of iter_pages into one list. If a page fails,
+        PaginationError is raised with the items fetched so far and the URL
+        of the failed page; pass that URL as start_url to resume from it:
+
+            try:
+                courses = manager.make_request('courses')
+            except PaginationError as e:
+                courses = e.results + manager.make_request('courses', start_url=e.url)
+        """
+        results = []
+        try:
+            for items in self.iter_pages(endpoint, method=method, data=data, params=params,
+                                         parallel=parallel, start_url=start_url, fields=fields):
+                results.extend(items)
+        except pagination.PaginationError as e:
+            e.results = results
+            raise
 
         return results
 
-    def get_all_courses_json(self):
+    def get_all_courses_json(self, parallel=False):
         """Fetch all courses and return as JSON"""
-        courses = self.make_request('courses')
+        courses = self.make_request('courses', parallel=parallel)
         return courses
-    
\ No newline at end of file
@@ -0,0 +1,60 @@
+"""
+Benchmark: per-assignment submission rates of whole courses from one
+submissions listing per assignment versus one multi-student
+/courses/:id/students/submissions stream per course.
+
+Both must give the same rates for every assignment.
+
+Usage:
+    python benchmarks/bench_analytics.py [--courses 20] [--latency 0.02]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'adv_examples')))
+from canvas.canvas_manager import CanvasManager # type: ignore
+from canvasutils import analytics # type: ignore
+from fake_canvas import FakeCanvasServer
+
+def per_assignment_rates(manager, course_id):
+    assignments = manager.make_request(f"courses/{course_id}/assignments", params={'per_page': 100})
+    submissions = []
+    for assignment in assignments:
+        submissions.extend(manager.iter_items(
+            f"courses/{course_id}/assignments/{assignment['id']}/submissions", params={'per_page': 100}))
+    return analytics.submission_rates(submissions, assignments)
+
+def matrix_rates(manager, course_id):
+    assignments = manager.make_request(f"courses/{course_id}/assignments", params={'per_page': 100})
+    return analytics.submission_rates(analytics.iter_submission_matrix(manager, course_id), assignments)
+
+def run(name, server, course_ids, fetch):
+    requests_before = server.requests
+    start = time.perf_counter()
+    rates = [fetch(course_id) for course_id in course_ids]
+    elapsed = time.perf_counter() - start
+    print(f"{name:<26} {sum(map(len, rates)):>5} assignments {server.requests - requests_before:>5} requests "
+          f"{elapsed:>8.3f}s")
+    return rates
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--courses', type=int, default=20)
+    parser.add_argument('--latency', type=float, default=0.02)
+    args = parser.parse_args()
+
+    with FakeCanvasServer(course_count=args.courses, latency=args.latency) as server, \
+         CanvasManager(api_url=server.url, api_key='benchmark') as manager:
+        course_ids = [course['id'] for course in server.courses]
+        print(f"Fake Canvas at {server.url}: submission rates of {args.courses} courses")
+
+        separate = run('one listing per assignment', server, course_ids,
+                       lambda c: per_assignment_rates(manager, c))
+        bulk = run('submission matrix', server, course_ids, lambda c: matrix_rates(manager, c))
+        print(f"\nsame rates: {'✅' if separate == bulk else '❌'}")
+
+if __name__ == "__main__":
+    main()
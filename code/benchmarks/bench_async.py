@@ -0,0 +1,58 @@
+"""
+Benchmark: sweeping the assignments of every course one course at a time with
+CanvasManager versus concurrently with AsyncCanvasManager on one event loop.
+
+Usage:
+    python benchmarks/bench_async.py [--courses 200] [--latency 0.02] [--concurrency 32]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'adv_examples')))
+from canvas.async_canvas_manager import AsyncCanvasManager # type: ignore
+from canvas.canvas_manager import CanvasManager # type: ignore
+from fake_canvas import FakeCanvasServer
+
+def sweep_blocking(server):
+    with CanvasManager(api_url=server.url, api_key='benchmark') as manager:
+        courses = manager.get_all_courses_json()
+        return [manager.make_request(f"courses/{c['id']}/assignments") for c in courses]
+
+async def sweep_async(server, concurrency, limit_per_host):
+    async with AsyncCanvasManager(api_url=server.url, api_key='benchmark',
+                                  max_concurrency=concurrency,
+                                  limit_per_host=limit_per_host) as manager:
+        courses = await manager.get_all_courses_json(parallel=True)
+        return await manager.make_requests([f"courses/{c['id']}/assignments" for c in courses])
+
+def run(name, sweep):
+    start = time.perf_counter()
+    listings = sweep()
+    elapsed = time.perf_counter() - start
+    print(f"{name:<32} {len(listings):>5} courses {sum(map(len, listings)):>6} assignments {elapsed:>8.3f}s")
+    return elapsed, listings
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--courses', type=int, default=200)
+    parser.add_argument('--latency', type=float, default=0.02,
+                        help='simulated server time per request (seconds)')
+    parser.add_argument('--concurrency', type=int, default=32)
+    parser.add_argument('--limit-per-host', type=int, default=16)
+    args = parser.parse_args()
+
+    with FakeCanvasServer(course_count=args.courses, latency=args.latency) as server:
+        print(f"Fake Canvas at {server.url}: {args.courses} courses, {args.latency * 1000:.0f} ms per request")
+        blocking, expected = run('CanvasManager (blocking)', lambda: sweep_blocking(server))
+        concurrent, listings = run(f'AsyncCanvasManager ({args.limit_per_host}/host)',
+                                   lambda: asyncio.run(sweep_async(server, args.concurrency,
+                                                                   args.limit_per_host)))
+
+    print(f"Same results: {'✅' if listings == expected else '❌'}  Speedup: {blocking / concurrent:.1f}x")
+
+if __name__ == "__main__":
+    main()
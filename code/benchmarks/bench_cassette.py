@@ -0,0 +1,80 @@
+"""
+Benchmark: record a semester export against the fake Canvas server, then
+replay it from the cassette with the original timing and at zero latency.
+
+The workload mixes both clients: CanvasManager walks the course listing
+(parallel pages), canvasapi picks the semester's courses and reads the
+assignments and one folder of files of some of them. Replays must return the
+same data without a single request reaching the server.
+
+Usage:
+    python benchmarks/bench_cassette.py [--courses 300] [--latency 0.02] [--export 10]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'adv_examples')))
+from canvas.canvas_manager import CanvasManager # type: ignore
+from canvasapi import Canvas # type: ignore
+from canvasutils import _courses # type: ignore
+from canvasutils.folder import folder_util # type: ignore
+from canvasutils.httputil import http_session # type: ignore
+from canvasutils.httputil.cassette import (Cassette, install_cassette, RECORD, REPLAY, # type: ignore
+                                           ORIGINAL_TIMING, ZERO_LATENCY)
+from fake_canvas import FakeCanvasServer
+import bench_suite
+
+def semester_export(server_url, cassette, export, workdir):
+    """What a semester export does; returns everything it read"""
+    with CanvasManager(api_url=server_url, api_key='benchmark', cassette=cassette) as manager:
+        courses = manager.make_request('courses', params={'per_page': 100}, parallel=True)
+
+    canvas = Canvas(server_url, 'benchmark')
+    install_cassette(http_session.get_canvas_session(canvas), cassette)
+    semester = _courses.get_courses(canvas, '2025', 'Fall')[:export]
+    assignments = {}
+    files = {}
+    for course in semester:
+        assignments[course.id] = [a.name for a in course.get_assignments()]
+        folder = folder_util.get_course_folder(course, 'Lectures')
+        for file in folder.get_files():
+            path = os.path.join(workdir, file.filename)
+            file.download(path)
+            with open(path, 'rb') as f:
+                files[(course.id, file.filename)] = f.read()
+    return courses, assignments, files
+
+def run(name, server, cassette, args, workdir):
+    requests_before = server.requests
+    start = time.perf_counter()
+    result = semester_export(server.url, cassette, args.export, workdir)
+    elapsed = time.perf_counter() - start
+    cassette.close()
+    print(f"{name:<20} {server.requests - requests_before:>6} server requests {elapsed:>8.3f}s")
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--courses', type=int, default=300)
+    parser.add_argument('--latency', type=float, default=0.02)
+    parser.add_argument('--export', type=int, default=10, help='courses whose assignments and files are read')
+    args = parser.parse_args()
+    bench_suite.quiet()
+
+    with tempfile.TemporaryDirectory() as workdir, \
+         FakeCanvasServer(course_count=args.courses, latency=args.latency, files_per_folder=3) as server:
+        path = os.path.join(workdir, 'export.jsonl')
+        recorded = run('record', server, Cassette(path, mode=RECORD), args, workdir)
+        original = run('replay (original)', server, Cassette(path, mode=REPLAY, timing=ORIGINAL_TIMING),
+                       args, workdir)
+        instant = run('replay (zero)', server, Cassette(path, mode=REPLAY, timing=ZERO_LATENCY),
+                      args, workdir)
+        print(f"\nCassette: {os.path.getsize(path):,} bytes; "
+              f"same results: {'✅' if recorded == original == instant else '❌'}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Benchmark: memory held by the loaded courses and the course mapping, with
+dicts versus compact records (canvasutils.jsonutil.course_records).
+
+- JsonProcessor(file)                           full Canvas course dicts
+- JsonProcessor(file, fields=SUMMARY_FIELDS)    pruned dicts
+- JsonProcessor(file, compact=True)             CourseRecord slots
+- create_course_mapping(courses)                details dicts
+- create_course_mapping(courses, compact=True)  CourseDetails slots
+
+Memory is what tracemalloc still sees allocated once the object is built.
+
+Usage:
+    python benchmarks/bench_compact_records.py [--courses 100000]
+"""
+
+import argparse
+import importlib.util
+import logging
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from canvasutils.jsonutil import json_util # type: ignore
+from canvasutils.jsonutil.json_processor import JsonProcessor # type: ignore
+from fake_canvas import make_course
+from bench_runner import Silenced
+
+def load_mapper_module():
+    """3_list_courses_example.py (its name is not importable)"""
+    path = os.path.join(os.path.dirname(__file__), '..', 'adv_examples', '3_list_courses_example.py')
+    spec = importlib.util.spec_from_file_location('list_courses_example', path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def measure(name, build, count):
+    start = time.perf_counter()
+    tracemalloc.start()
+    result = build()
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    elapsed = time.perf_counter() - start
+    print(f"{name:<34} {held / 2**20:>9.1f} MB {held / count:>8,.0f} B/course {elapsed:>8.2f}s")
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--courses', type=int, default=100000)
+    args = parser.parse_args()
+    mapper_module = load_mapper_module()
+    logging.disable(logging.INFO)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        file_name = os.path.join(workdir, 'courses.json')
+        with Silenced():
+            json_util.store_json_object([make_course(i) for i in range(args.courses)], file_name)
+
+        full = measure('JsonProcessor dicts', lambda: JsonProcessor(file_name), args.courses)
+        summary = measure('JsonProcessor SUMMARY_FIELDS', lambda: JsonProcessor(
+            file_name, fields=JsonProcessor.SUMMARY_FIELDS), args.courses)
+        compact = measure('JsonProcessor compact', lambda: JsonProcessor(file_name, compact=True),
+                          args.courses)
+        same_processor = ([c['id'] for c in compact.filter_courses_regex('2025', 'Fall')]
+                          == [c['id'] for c in summary.filter_courses_regex('2025', 'Fall')]
+                          and compact.semester_courses.keys() == full.semester_courses.keys()
+                          and all(dict(record) == {k: course[k] for k in record}
+                                  for record, course in zip(compact.courses, full.courses)))
+        del full, summary
+
+        mapper = mapper_module.CanvasCourseMapper('https://canvas.example.edu', 'benchmark')
+        courses = compact.courses
+        mapping = measure('course mapping dicts', lambda: mapper.create_course_mapping(courses),
+                          args.courses)
+        compact_mapping = measure('course mapping compact',
+                                  lambda: mapper.create_course_mapping(courses, compact=True), args.courses)
+        print(f"\nsame results: {'✅' if same_processor and mapping == compact_mapping else '❌'}")
+
+if __name__ == "__main__":
+    main()
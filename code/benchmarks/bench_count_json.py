@@ -0,0 +1,58 @@
+"""
+Benchmark: json_util.count_elements_in_json on a synthetic course export.
+
+- load + len       the old implementation: parse the whole file
+- streaming        scan the file for top-level commas, no Python objects
+- metadata         the count stored by store_json_items(write_count=True)
+
+Memory is the tracemalloc peak while counting, in a second run (tracemalloc
+slows the counting down).
+
+Usage:
+    python benchmarks/bench_count_json.py [--courses 100000]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from canvasutils.jsonutil import json_util # type: ignore
+from fake_canvas import make_course
+from bench_runner import Silenced
+
+def measure(name, count):
+    start = time.perf_counter()
+    result = count()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    count()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:<12} {result:>8} {elapsed:>9.4f}s {peak / 2**20:>9.1f} MB")
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--courses', type=int, default=100000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        file_name = os.path.join(workdir, 'courses.json')
+        with Silenced():
+            json_util.store_json_items((make_course(i) for i in range(args.courses)), file_name,
+                                       write_count=True)
+        print(f"{args.courses} courses, {os.path.getsize(file_name) / 2**20:.1f} MB of JSON\n")
+
+        counts = [
+            measure('load + len', lambda: len(json_util.load_json_file(file_name))),
+            measure('streaming', lambda: json_util.count_elements_in_json(file_name, use_metadata=False)),
+            measure('metadata', lambda: json_util.count_elements_in_json(file_name)),
+        ]
+        print(f"\nsame results: {'✅' if counts == [args.courses] * 3 else '❌'}")
+
+if __name__ == "__main__":
+    main()
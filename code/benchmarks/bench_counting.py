@@ -0,0 +1,67 @@
+"""
+Benchmark: counting Canvas listings by downloading them versus the
+canvasutils.counting API (per_page=1 + rel="last" arithmetic, the
+total_students field, and the page-by-page fallback for bookmark listings).
+
+Usage:
+    python benchmarks/bench_counting.py [--courses 5000] [--latency 0.01]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'adv_examples')))
+from canvas.canvas_manager import CanvasManager # type: ignore
+from canvasapi import Canvas # type: ignore
+from canvasutils import counting # type: ignore
+from fake_canvas import FakeCanvasServer
+
+def run(name, server, count):
+    requests_before = server.requests
+    start = time.perf_counter()
+    total = count()
+    elapsed = time.perf_counter() - start
+    print(f"{name:<44} {total:>7} {server.requests - requests_before:>5} requests {elapsed:>8.3f}s")
+    return total
+
+def compare(server, label, download, fast):
+    downloaded = run(f"{label}: download and len()", server, download)
+    counted = run(f"{label}: count", server, fast)
+    print(f"{'':<44} {'✅' if downloaded == counted else '❌'}\n")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--courses', type=int, default=5000)
+    parser.add_argument('--latency', type=float, default=0.01)
+    args = parser.parse_args()
+
+    for bookmarks in (False, True):
+        with FakeCanvasServer(course_count=args.courses, latency=args.latency, bookmarks=bookmarks) as server, \
+             CanvasManager(api_url=server.url, api_key='benchmark') as manager:
+            print(f"Fake Canvas at {server.url}: {args.courses} courses"
+                  f"{', bookmark pages (no rel=last)' if bookmarks else ''}\n")
+            compare(server, 'CanvasManager courses',
+                    lambda: len(manager.make_request('courses', params={'per_page': 100})),
+                    lambda: manager.count('courses'))
+
+            canvas = Canvas(server.url, 'benchmark')
+            compare(server, 'canvasapi courses',
+                    lambda: len(list(canvas.get_courses())),
+                    lambda: counting.count_paginated(canvas.get_courses()))
+            if bookmarks:
+                continue
+
+            course = canvas.get_course(server.courses[-1]['id'])
+            compare(server, 'canvasapi assignments',
+                    lambda: len(list(course.get_assignments())),
+                    lambda: counting.count_paginated(course.get_assignments()))
+            compare(server, 'canvasapi students',
+                    lambda: len(list(course.get_users(enrollment_type=['student']))),
+                    lambda: counting.count_students(course))
+
+if __name__ == "__main__":
+    import warnings
+    warnings.filterwarnings('ignore', message='Canvas may respond unexpectedly')
+    main()
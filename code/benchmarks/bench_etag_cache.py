@@ -0,0 +1,71 @@
+"""
+Benchmark: a nightly re-download of unchanged listings with and without the
+ETag / If-None-Match ConditionalCache.
+
+The first run fills the cache; the second run sends conditional requests,
+gets "304 Not Modified" for every page and serves the bodies from disk.
+Both CanvasManager and canvasapi's Canvas (getinfo-style) are shown.
+
+Usage:
+    python benchmarks/bench_etag_cache.py [--courses 5000] [--per-page 100] [--latency 0.005] [--bandwidth 2000000]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'adv_examples')))
+from canvas.canvas_manager import CanvasManager # type: ignore
+from canvasapi import Canvas # type: ignore
+from canvasutils.httputil import http_session # type: ignore
+from canvasutils.httputil.etag_cache import ConditionalCache, install_conditional_cache # type: ignore
+from fake_canvas import FakeCanvasServer
+
+def run(name, server, fetch):
+    requests_before, not_modified_before = server.requests, server.not_modified
+    start = time.perf_counter()
+    count = fetch()
+    elapsed = time.perf_counter() - start
+    print(f"{name:<34} {count:>6} items {server.requests - requests_before:>4} requests "
+          f"{server.not_modified - not_modified_before:>4} x 304 {elapsed:>8.3f}s")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--courses', type=int, default=5000)
+    parser.add_argument('--per-page', type=int, default=100)
+    parser.add_argument('--latency', type=float, default=0.005)
+    parser.add_argument('--bandwidth', type=float, default=2_000_000,
+                        help='simulated bytes per second of a response body')
+    args = parser.parse_args()
+
+    params = {'per_page': args.per_page}
+    with tempfile.TemporaryDirectory() as directory, \
+         FakeCanvasServer(course_count=args.courses, latency=args.latency,
+                          bandwidth=args.bandwidth) as server:
+        print(f"Fake Canvas at {server.url}: {args.courses} courses, per_page={args.per_page}")
+
+        def manager_fetch(cache):
+            with CanvasManager(api_url=server.url, api_key='benchmark', conditional_cache=cache) as manager:
+                return len(manager.make_request('courses', params=dict(params)))
+
+        cache = ConditionalCache(os.path.join(directory, 'manager'))
+        run('CanvasManager, no cache', server, lambda: manager_fetch(None))
+        run('CanvasManager, cold cache', server, lambda: manager_fetch(cache))
+        run('CanvasManager, warm cache', server, lambda: manager_fetch(cache))
+
+        def canvas_fetch(cache):
+            canvas = Canvas(server.url, 'benchmark')
+            install_conditional_cache(http_session.get_canvas_session(canvas), cache)
+            return len(list(canvas.get_courses(per_page=args.per_page)))
+
+        cache = ConditionalCache(os.path.join(directory, 'canvasapi'))
+        run('canvasapi Canvas, cold cache', server, lambda: canvas_fetch(cache))
+        run('canvasapi Canvas, warm cache', server, lambda: canvas_fetch(cache))
+        print(f"\ncanvasapi cache: {cache.hits} hits, {cache.misses} misses, {cache.stores} stored")
+
+if __name__ == "__main__":
+    import warnings
+    warnings.filterwarnings('ignore', message='Canvas may respond unexpectedly')
+    main()
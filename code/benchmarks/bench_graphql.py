@@ -0,0 +1,72 @@
+"""
+Check: course analytics data (students, assignments, submissions) over REST
+versus the GraphQL batch fetcher, against the fake Canvas GraphQL stand-in.
+
+REST needs one listing for the students, one for the assignments and one per
+assignment for its submissions. GraphQL gets the assignments with their
+submissions in a few cursor-paginated queries. Both must return the same dicts.
+
+Usage:
+    python benchmarks/bench_graphql.py [--courses 10] [--latency 0.02] [--submissions-page-size 100]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'adv_examples')))
+from canvas.canvas_manager import CanvasManager # type: ignore
+from canvasapi import Canvas # type: ignore
+from canvasutils.httputil import graphql # type: ignore
+from fake_canvas import FakeCanvasServer
+
+def rest_analytics(manager, course_id):
+    students = manager.make_request(f"courses/{course_id}/users",
+                                    params={'enrollment_type[]': 'student', 'per_page': 100})
+    assignments = manager.make_request(f"courses/{course_id}/assignments", params={'per_page': 100})
+    submissions = {a['id']: manager.make_request(f"courses/{course_id}/assignments/{a['id']}/submissions",
+                                                 params={'per_page': 100})
+                   for a in assignments}
+    return students, assignments, submissions
+
+def graphql_analytics(run, course_id, submissions_page_size):
+    students = graphql.fetch_course_students(run, course_id)
+    assignments, submissions = graphql.fetch_course_assignments(
+        run, course_id, submissions_page_size=submissions_page_size)
+    return students, assignments, submissions
+
+def run(name, server, course_ids, fetch):
+    requests_before = server.requests
+    start = time.perf_counter()
+    results = [fetch(course_id) for course_id in course_ids]
+    elapsed = time.perf_counter() - start
+    print(f"{name:<20} {server.requests - requests_before:>5} requests {elapsed:>8.3f}s")
+    return results
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--courses', type=int, default=10)
+    parser.add_argument('--latency', type=float, default=0.02)
+    parser.add_argument('--submissions-page-size', type=int, default=100)
+    args = parser.parse_args()
+
+    with FakeCanvasServer(course_count=args.courses, latency=args.latency) as server, \
+         CanvasManager(api_url=server.url, api_key='benchmark') as manager:
+        course_ids = [course['id'] for course in server.courses]
+        print(f"Fake Canvas at {server.url}: analytics of {args.courses} courses")
+
+        rest = run('REST', server, course_ids, lambda c: rest_analytics(manager, c))
+        batched = run('GraphQL', server, course_ids,
+                      lambda c: graphql_analytics(manager.graphql, c, args.submissions_page_size))
+        canvas = Canvas(server.url, 'benchmark')
+        via_canvasapi = run('GraphQL (canvasapi)', server, course_ids,
+                            lambda c: graphql_analytics(canvas.graphql, c, args.submissions_page_size))
+
+        same = rest == batched == via_canvasapi
+        print(f"\nsame students, assignments and submissions: {'✅' if same else '❌'}")
+
+if __name__ == "__main__":
+    import warnings
+    warnings.filterwarnings('ignore', message='Canvas may respond unexpectedly')
+    main()
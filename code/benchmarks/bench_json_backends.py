@@ -0,0 +1,53 @@
+"""
+Benchmark: json_util store/load of a synthetic course export with every
+available JSON backend (json, orjson if installed), pretty and compact.
+
+Usage:
+    python benchmarks/bench_json_backends.py [--sizes 10000 100000] [--repeat 3]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from canvasutils.jsonutil import json_util # type: ignore
+from fake_canvas import make_course
+from bench_runner import Silenced
+
+def best_of(repeat, run):
+    """Fastest of repeat runs, in seconds"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'Backend':<8} {'Mode':<8} {'Courses':>8} {'MB':>7} {'Store s':>8} {'Load s':>8} {'Same':>5}")
+    with tempfile.TemporaryDirectory() as workdir:
+        for size in args.sizes:
+            courses = [make_course(i) for i in range(size)]
+            for name in json_util.BACKENDS:
+                previous = json_util.set_backend(name)
+                for compact in (False, True):
+                    file_name = os.path.join(workdir, f"courses_{name}_{compact}.json")
+                    with Silenced():
+                        store = best_of(args.repeat, lambda: json_util.store_json_object(courses, file_name, compact))
+                    load = best_of(args.repeat, lambda: json_util.load_json_file(file_name))
+                    same = json_util.load_json_file(file_name) == courses
+                    print(f"{name:<8} {'compact' if compact else 'pretty':<8} {size:>8} "
+                          f"{os.path.getsize(file_name) / 2**20:>7.1f} {store:>8.3f} {load:>8.3f} "
+                          f"{'✅' if same else '❌':>5}")
+                json_util.set_backend(previous)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmark: peak memory and time of loading a courses export into JsonProcessor.
+
+- json.load + second pass   what JsonProcessor did before: load_json_file of the
+                            whole file, then analyze_available_semesters
+- JsonProcessor(file)       one backend.loads of the file, semester map built
+                            in a single pass over the courses
+- streaming + filter        JsonProcessor(file, course_filter=semester_filter(...)):
+                            only one semester's courses are kept
+
+Usage:
+    python benchmarks/bench_json_stream.py [--courses 100000]
+"""
+
+import argparse
+import gc
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from canvasutils.jsonutil import json_util # type: ignore
+from canvasutils.jsonutil.json_processor import JsonProcessor # type: ignore
+from fake_canvas import make_course
+from bench_runner import Silenced
+
+def load_then_analyze(file_name):
+    # A processor built from an empty export, so every attribute is set up
+    # as usual, then given the whole file the old way
+    empty_file = os.path.join(os.path.dirname(file_name), 'empty.json')
+    with open(empty_file, 'w', encoding='utf-8') as f:
+        f.write('[]')
+    processor = JsonProcessor(empty_file)
+    processor.courses = json_util.load_json_file(file_name)
+    processor.semester_courses = processor.analyze_available_semesters()
+    return processor
+
+def run(name, load, file_name):
+    """Time one untraced load, then trace a second one for its peak memory"""
+    # Without the collector, so the processors kept for the comparison below
+    # do not slow down the loads that come after them
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        load(file_name)
+        elapsed = time.perf_counter() - start
+    finally:
+        gc.enable()
+    tracemalloc.start()
+    processor = load(file_name)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{name:<26} {len(processor.courses):>8} courses {elapsed:>8.3f}s {peak / 2**20:>9.1f} MB peak")
+    return processor
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--courses', type=int, default=100000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        file_name = os.path.join(workdir, 'courses.json')
+        with Silenced():
+            json_util.store_json_object([make_course(i) for i in range(args.courses)], file_name)
+        print(f"{args.courses} courses, {os.path.getsize(file_name) / 2**20:.1f} MB of JSON")
+
+        before = run('json.load + second pass', load_then_analyze, file_name)
+        streamed = run('JsonProcessor(file)', JsonProcessor, file_name)
+        fall = JsonProcessor.semester_filter('2025', 'Fall')
+        filtered = run('streaming + filter', lambda f: JsonProcessor(f, course_filter=fall), file_name)
+
+        same = (before.courses == streamed.courses
+                and before.semester_courses == streamed.semester_courses
+                and filtered.courses == before.filter_courses_regex('2025', 'Fall'))
+        print(f"\nsame courses and semester map: {'✅' if same else '❌'}")
+
+if __name__ == "__main__":
+    main()
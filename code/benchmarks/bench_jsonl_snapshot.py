@@ -0,0 +1,69 @@
+"""
+Benchmark: saving and reading one course with a JSON array file versus a
+JSON Lines snapshot with an offset index (canvasutils.jsonutil.jsonl_snapshot).
+
+- rewrite array      store_json_object of every course, to change one
+- append line        JsonlSnapshot.append of the changed course
+- load + lookup      load_json_file, then find the course by id
+- open snapshot      read the offset index (file_name.idx)
+- get one            JsonlSnapshot.get: one record through the memory map
+
+Usage:
+    python benchmarks/bench_jsonl_snapshot.py [--courses 100000] [--lookups 1000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from canvasutils.jsonutil import json_util # type: ignore
+from canvasutils.jsonutil.jsonl_snapshot import JsonlSnapshot # type: ignore
+from fake_canvas import make_course
+from bench_runner import Silenced
+
+def timed(name, run, count=1):
+    start = time.perf_counter()
+    result = run()
+    elapsed = time.perf_counter() - start
+    print(f"{name:<16} {elapsed / count * 1000:>10.3f} ms" + (f" (x{count})" if count > 1 else ""))
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--courses', type=int, default=100000)
+    parser.add_argument('--lookups', type=int, default=1000)
+    args = parser.parse_args()
+
+    courses = [make_course(i) for i in range(args.courses)]
+    ids = [course['id'] for course in random.Random(0).choices(courses, k=args.lookups)]
+    with tempfile.TemporaryDirectory() as workdir:
+        array_file = os.path.join(workdir, 'courses.json')
+        snapshot_file = os.path.join(workdir, 'courses.jsonl')
+        with Silenced():
+            JsonlSnapshot(snapshot_file).write(courses)
+        changed = dict(courses[0], name='Renamed course')
+        courses[0] = changed
+
+        def rewrite_array():
+            with Silenced():
+                json_util.store_json_object(courses, array_file)
+
+        timed('rewrite array', rewrite_array)
+        snapshot = timed('open snapshot', lambda: JsonlSnapshot(snapshot_file))
+        timed('append line', lambda: snapshot.append([changed]))
+        snapshot.close()
+
+        loaded = timed('load + lookup', lambda: {course['id']: course
+                                                 for course in json_util.load_json_file(array_file)})
+        snapshot = timed('open snapshot', lambda: JsonlSnapshot(snapshot_file))
+        found = timed('get one', lambda: [snapshot.get(course_id) for course_id in ids], args.lookups)
+        same = found == [loaded[course_id] for course_id in ids] and snapshot.get(changed['id']) == changed
+        snapshot.close()
+        print(f"\n{args.courses} courses; same results: {'✅' if same else '❌'}")
+
+if __name__ == "__main__":
+    main()
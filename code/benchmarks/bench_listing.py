@@ -0,0 +1,63 @@
+"""
+Benchmark: reading the first items of canvasapi listings with indexing or
+list(...)[0] versus canvasutils.listing.first / take / exists, which request
+only as many items per page as needed.
+
+Usage:
+    python benchmarks/bench_listing.py [--courses 5000] [--latency 0.01]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from canvasapi import Canvas # type: ignore
+from canvasutils import listing # type: ignore
+from fake_canvas import FakeCanvasServer
+
+def run(name, server, read):
+    requests_before = server.requests
+    start = time.perf_counter()
+    result = read()
+    elapsed = time.perf_counter() - start
+    print(f"{name:<44} {server.requests - requests_before:>4} requests {elapsed:>8.3f}s")
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--courses', type=int, default=5000)
+    parser.add_argument('--latency', type=float, default=0.01)
+    args = parser.parse_args()
+
+    with FakeCanvasServer(course_count=args.courses, latency=args.latency) as server:
+        print(f"Fake Canvas at {server.url}: {args.courses} courses\n")
+        canvas = Canvas(server.url, 'benchmark')
+        course = canvas.get_course(server.courses[-1]['id'])
+        assignment = course.get_assignments()[0]
+
+        checks = []
+        a = run('course.get_users()[0]', server, lambda: course.get_users()[0])
+        b = run('listing.first(course.get_users())', server, lambda: listing.first(course.get_users()))
+        checks.append(a.id == b.id)
+
+        a = run('list(assignment.get_submissions())[0]', server,
+                lambda: list(assignment.get_submissions())[0])
+        b = run('listing.first(assignment.get_submissions())', server,
+                lambda: listing.first(assignment.get_submissions()))
+        checks.append(a.id == b.id)
+
+        a = run('list(canvas.get_courses())[:5]', server, lambda: list(canvas.get_courses())[:5])
+        b = run('listing.take(canvas.get_courses(), 5)', server,
+                lambda: listing.take(canvas.get_courses(), 5))
+        checks.append([c.id for c in a] == [c.id for c in b])
+
+        checks.append(run('listing.exists(canvas.get_courses())', server,
+                          lambda: listing.exists(canvas.get_courses())))
+        print(f"\nsame items: {'✅' if all(checks) else '❌'}")
+
+if __name__ == "__main__":
+    import warnings
+    warnings.filterwarnings('ignore', message='Canvas may respond unexpectedly')
+    main()
@@ -0,0 +1,63 @@
+"""
+Benchmark: course listings with full objects versus field projection.
+
+With fields= only the include[] values those fields need are requested, and
+every course is pruned to the fields as its page arrives. The per-endpoint
+report shows the bytes received and the bytes kept in memory.
+
+Usage:
+    python benchmarks/bench_projection.py [--courses 10000] [--per-page 100]
+"""
+
+import argparse
+import importlib
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'adv_examples')))
+from canvas.canvas_manager import CanvasManager # type: ignore
+from fake_canvas import FakeCanvasServer
+
+list_courses_example = importlib.import_module('3_list_courses_example')
+
+def run(name, fetch):
+    start = time.perf_counter()
+    courses = fetch()
+    elapsed = time.perf_counter() - start
+    size = len(json.dumps(courses).encode('utf-8'))
+    print(f"{name:<40} {len(courses):>6} courses {size:>12,} bytes kept {elapsed:>8.3f}s")
+    return courses
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--courses', type=int, default=10000)
+    parser.add_argument('--per-page', type=int, default=100)
+    args = parser.parse_args()
+    list_courses_example.logger.setLevel('WARNING')
+
+    with FakeCanvasServer(course_count=args.courses) as server:
+        print(f"Fake Canvas at {server.url}: {args.courses} courses, per_page={args.per_page}\n")
+
+        mapper = list_courses_example.CanvasCourseMapper(server.url, 'benchmark')
+        full = run('CanvasCourseMapper, full objects + term',
+                   lambda: mapper.get_all_courses(args.per_page, fields=None))
+        projected = run('CanvasCourseMapper, mapping fields',
+                        lambda: mapper.get_all_courses(
+                            args.per_page, fields=list_courses_example.COURSE_MAPPING_FIELDS))
+        same = mapper.create_course_mapping(full) == mapper.create_course_mapping(projected)
+        print(f"same course mapping: {'✅' if same else '❌'}\n")
+
+        with CanvasManager(api_url=server.url, api_key='benchmark') as manager:
+            params = {'per_page': args.per_page}
+            run('CanvasManager, full objects', lambda: manager.make_request('courses', params=dict(params)))
+            run('CanvasManager, id/name/term.name', lambda: manager.make_request(
+                'courses', params=dict(params), fields=['id', 'name', 'term.name']))
+
+        print()
+        mapper.projection_stats.report()
+        manager.projection_stats.report()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Benchmark: repeated course exports with the persistent SQLite ResponseCache.
+
+- cold:    empty cache, every page is requested and stored
+- fresh:   within the TTL, no request reaches Canvas
+- stale:   past the TTL but within stale-while-revalidate, cached pages are
+           served at once and refreshed in the background
+- refresh: the --refresh override, every page is requested again
+- offline: Canvas is down, stored pages are served whatever their age
+
+Usage:
+    python benchmarks/bench_response_cache.py [--courses 5000] [--per-page 100] [--latency 0.02]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'adv_examples')))
+from canvas.canvas_manager import CanvasManager # type: ignore
+from canvasutils.httputil.response_cache import ResponseCache # type: ignore
+from canvasutils.httputil.retry import RetryPolicy # type: ignore
+from fake_canvas import FakeCanvasServer
+
+def run(name, server, url, cache, per_page):
+    requests_before = server.requests
+    hits, stale, offline, misses = cache.hits, cache.stale_hits, cache.offline_hits, cache.misses
+    start = time.perf_counter()
+    with CanvasManager(api_url=url, api_key='benchmark', response_cache=cache,
+                       retry=RetryPolicy(max_attempts=1)) as manager:
+        count = len(manager.make_request('courses', params={'per_page': per_page}))
+    elapsed = time.perf_counter() - start
+    print(f"{name:<9} {count:>6} items {server.requests - requests_before:>4} requests "
+          f"{cache.hits - hits:>4} fresh {cache.stale_hits - stale:>4} stale "
+          f"{cache.offline_hits - offline:>4} offline {cache.misses - misses:>4} missed {elapsed:>8.3f}s")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--courses', type=int, default=5000)
+    parser.add_argument('--per-page', type=int, default=100)
+    parser.add_argument('--latency', type=float, default=0.02)
+    args = parser.parse_args()
+    logging.getLogger('canvasutils.httputil.response_cache').setLevel(logging.ERROR)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'cache.sqlite')
+        server = FakeCanvasServer(course_count=args.courses, latency=args.latency).start()
+        url = server.url
+        print(f"Fake Canvas at {url}: {args.courses} courses, per_page={args.per_page}")
+
+        cache = ResponseCache(path)
+        run('cold', server, url, cache, args.per_page)
+        run('fresh', server, url, cache, args.per_page)
+
+        # Expire everything, but stay within the stale-while-revalidate window
+        policies, default_ttl = cache.ttl_policies, cache.default_ttl
+        cache.ttl_policies, cache.default_ttl = [], 0.001
+        time.sleep(0.01)
+        run('stale', server, url, cache, args.per_page)
+        time.sleep(args.latency * 4 + 0.2)  # let the background refreshes land
+        cache.ttl_policies, cache.default_ttl = policies, default_ttl
+
+        cache.refresh = True
+        run('refresh', server, url, cache, args.per_page)
+        cache.refresh = False
+
+        server.stop()
+        cache.default_ttl = 0.001
+        cache.ttl_policies, cache.stale_while_revalidate = [], 0
+        run('offline', server, url, cache, args.per_page)
+        print(f"\nhit rate over all runs: {cache.hit_rate():.0%}")
+        cache.close()
+
+if __name__ == "__main__":
+    main()
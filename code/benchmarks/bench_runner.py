@@ -0,0 +1,345 @@
+"""
+Benchmark runner with a stored baseline and a regression gate.
+
+Runs the hot paths the Canvas scripts depend on, several times each, and
+records per case: throughput (records/s of the median run), p50/p95 latency of one
+run and the peak RSS of the process running the case. Every case runs in its
+own forked process, so its peak RSS is not hidden by an earlier, bigger case.
+
+Cases (records are courses):
+- analyze_available_semesters  JsonProcessor.analyze_available_semesters
+- to_safe_filename             _files.to_safe_filename on every course name
+- make_serializable            _files.make_serializable on canvasapi-like objects
+- pagination_loop              CanvasManager.make_request('courses') against the fake Canvas
+- json_store                   json_util.store_json_object of the course list
+- json_load                    json_util.load_json_file of that file
+
+Absolute numbers depend on the machine (and on what else runs on it), so
+they are not what is compared. Every timed run is paired with a run of a
+fixed calibration workload (JSON encoding, decoding and sorting in pure
+Python) in the same process, and the case is normalized against it:
+- throughput_norm  records per calibration run (median of the paired ratios)
+- p95_norm         p95 of run time / calibration time
+- rss_growth_mb    peak RSS minus the RSS of the process before the case was
+                   set up, i.e. the memory the case itself adds
+
+The normalized results are compared with the baseline file
+(benchmarks/baseline.json): a case regresses when its normalized throughput
+drops, or its normalized p95 or RSS growth grows, by more than --threshold
+(0.2 = 20%); RSS changes under RSS_TOLERANCE_MB are ignored. The exit status
+is 1 on any regression, so the runner can gate a CI job. --save-baseline
+writes the results as the new baseline instead.
+
+Normalization absorbs most of the difference between machines, not all of
+it (e.g. disk or network speed relative to CPU). For a CI gate, create the
+baseline on the CI runner itself, once, and commit it:
+    python benchmarks/bench_runner.py --save-baseline
+Record it with a Python the project supports (requires-python >= 3.12):
+the runner warns when the baseline was recorded with another Python
+version, since interpreter releases change these numbers by themselves.
+
+Usage:
+    python benchmarks/bench_runner.py [--size 10000] [--repeat 7] [--threshold 0.2]
+                                      [--baseline benchmarks/baseline.json]
+                                      [--cases json_load json_store] [--save-baseline]
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import types
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'adv_examples')))
+from canvas.canvas_manager import CanvasManager # type: ignore
+from canvasutils import _files # type: ignore
+from canvasutils.jsonutil import json_util # type: ignore
+from canvasutils.jsonutil.json_processor import JsonProcessor # type: ignore
+from fake_canvas import FakeCanvasServer
+import bench_suite
+
+# Bump when the layout of the baseline file changes; older baselines are ignored
+BASELINE_VERSION = 2
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+DEFAULT_SIZE = 10000
+DEFAULT_REPEAT = 7
+DEFAULT_THRESHOLD = 0.2
+# RSS growth changes smaller than this are noise, whatever their ratio
+RSS_TOLERANCE_MB = 5.0
+# Calibration: CALIBRATION_ROUNDS passes over CALIBRATION_RECORDS small records,
+# long enough to time steadily, small enough to add little RSS
+CALIBRATION_RECORDS = 5000
+CALIBRATION_ROUNDS = 5
+
+# Compared metric: True if bigger is better
+METRICS = {'throughput_norm': True, 'p95_norm': False, 'rss_growth_mb': False}
+
+
+class Silenced(object):
+    """Send stdout to /dev/null (the json_util helpers print on every call)"""
+
+    def __enter__(self):
+        self.devnull = open(os.devnull, 'w')
+        self.stdout, sys.stdout = sys.stdout, self.devnull
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        sys.stdout = self.stdout
+        self.devnull.close()
+
+
+def build_cases(server, workdir):
+    """
+    {name: setup} for one fake server. setup() runs in the case's process and
+    returns the function timed on every repeat.
+    """
+    json_file = os.path.join(workdir, 'courses.json')
+    with Silenced():
+        json_util.store_json_object(server.courses, json_file)
+
+    def analyze_available_semesters():
+        processor = JsonProcessor(json_file)
+        return processor.analyze_available_semesters
+
+    def to_safe_filename():
+        names = [course['name'] for course in server.courses]
+        return lambda: [_files.to_safe_filename(name) for name in names]
+
+    def make_serializable():
+        # canvasapi objects: the JSON fields plus a requester that cannot be serialized
+        requester = object()
+        objects = [types.SimpleNamespace(_requester=requester, **course) for course in server.courses]
+        return lambda: [_files.make_serializable(obj) for obj in objects]
+
+    def pagination_loop():
+        def run():
+            with CanvasManager(api_url=server.url, api_key='benchmark') as manager:
+                return manager.make_request('courses', params={'per_page': 100})
+        return run
+
+    def json_store():
+        courses = json_util.load_json_file(json_file)
+        output = os.path.join(workdir, f"store_{os.getpid()}.json")
+        def run():
+            with Silenced():
+                return json_util.store_json_object(courses, output)
+        return run
+
+    def json_load():
+        return lambda: json_util.load_json_file(json_file)
+
+    return {
+        'analyze_available_semesters': analyze_available_semesters,
+        'to_safe_filename': to_safe_filename,
+        'make_serializable': make_serializable,
+        'pagination_loop': pagination_loop,
+        'json_store': json_store,
+        'json_load': json_load,
+    }
+
+def calibration():
+    """The calibration workload: the same work on every machine, scales with its speed"""
+    records = [{'id': i, 'name': f"Course {i}", 'tags': [i % 7, i % 11]}
+               for i in range(CALIBRATION_RECORDS)]
+    def run():
+        for _ in range(CALIBRATION_ROUNDS):
+            json.loads(json.dumps(records))
+            sorted(records, key=lambda record: record['name'])
+    return run
+
+def timed(run):
+    start = time.perf_counter()
+    run()
+    return time.perf_counter() - start
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a list of numbers"""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(fraction * len(ordered) + 0.5) - 1))
+    return ordered[index]
+
+def peak_rss_mb():
+    """Peak resident set size of this process (ru_maxrss is KB on Linux, bytes on macOS)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+def measure(setup, records, repeat):
+    """
+    Run one case (one warm-up run, then repeat timed runs) and return its
+    metrics, raw and normalized: each timed run directly follows a
+    calibration run, so both see the same machine load.
+    """
+    calibrate = calibration()
+    calibrate()
+    base_rss = peak_rss_mb()
+    run = setup()
+    run()
+    latencies = []
+    ratios = []
+    for _ in range(repeat):
+        reference = timed(calibrate)
+        latency = timed(run)
+        latencies.append(latency)
+        ratios.append(latency / reference)
+    p50 = statistics.median(latencies)
+    peak = peak_rss_mb()
+    return {
+        'records': records,
+        'repeat': repeat,
+        'throughput': records / p50,
+        'p50': p50,
+        'p95': percentile(latencies, 0.95),
+        'peak_rss_mb': peak,
+        'throughput_norm': records / statistics.median(ratios),
+        'p95_norm': percentile(ratios, 0.95),
+        'rss_growth_mb': peak - base_rss,
+    }
+
+def _measure_child(connection, setup, records, repeat):
+    bench_suite.quiet()
+    try:
+        connection.send(measure(setup, records, repeat))
+    except Exception as e:
+        connection.send({'error': f"{type(e).__name__}: {e}"})
+    finally:
+        connection.close()
+
+def measure_in_process(setup, records, repeat):
+    """measure() in a forked process, so peak RSS belongs to this case alone"""
+    context = multiprocessing.get_context('fork')
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(target=_measure_child, args=(sender, setup, records, repeat))
+    process.start()
+    sender.close()
+    try:
+        result = receiver.recv()
+    except EOFError:
+        result = {'error': f"process exited with code {process.exitcode}"}
+    process.join()
+    return result
+
+def git_commit():
+    """Current git commit of the repository, or None outside a git checkout"""
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, check=True, cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def load_baseline(file_name):
+    """The baseline file's cases, or None if it is missing or of another version"""
+    if not os.path.exists(file_name):
+        return None
+    with open(file_name, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    if baseline.get('version') != BASELINE_VERSION:
+        print(f"❌ {file_name} is baseline version {baseline.get('version')}, "
+              f"expected {BASELINE_VERSION}; run with --save-baseline to replace it")
+        return None
+    return baseline
+
+def same_python(version):
+    """Whether version (e.g. '3.12.1') is the running Python's major.minor"""
+    return bool(version) and version.split('.')[:2] == platform.python_version().split('.')[:2]
+
+def save_baseline(file_name, results, args):
+    baseline = {
+        'version': BASELINE_VERSION,
+        'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'machine': f"{platform.system()} {platform.machine()}",
+        'size': args.size,
+        'cases': results,
+    }
+    with open(file_name, 'w', encoding='utf-8') as f:
+        json.dump(baseline, f, indent=4)
+        f.write('\n')
+    print(f"✅ Baseline saved to {file_name}")
+
+def compare(current, baseline, threshold):
+    """
+    Regressions of one case against its baseline entry: a list of
+    (metric, baseline value, current value, relative change)
+    """
+    regressions = []
+    for metric, higher_is_better in METRICS.items():
+        old, new = baseline.get(metric), current.get(metric)
+        if old is None or new is None:
+            continue
+        if metric == 'rss_growth_mb':
+            if new - old < RSS_TOLERANCE_MB:
+                continue
+            old = max(old, RSS_TOLERANCE_MB)  # no ratio to a case that adds almost nothing
+        change = (new - old) / old
+        if (-change if higher_is_better else change) > threshold:
+            regressions.append((metric, old, new, change))
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--size', type=int, default=DEFAULT_SIZE, help='courses in the data set')
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help='timed runs per case')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='relative change that counts as a regression (0.2 = 20%%)')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help='baseline file')
+    parser.add_argument('--cases', nargs='+', help='only run these cases')
+    parser.add_argument('--save-baseline', action='store_true', help='write the results as the new baseline')
+    args = parser.parse_args()
+    bench_suite.quiet()
+
+    baseline = None if args.save_baseline else load_baseline(args.baseline)
+    if baseline and baseline.get('size') != args.size:
+        print(f"❌ Baseline was recorded with --size {baseline.get('size')}; not comparing")
+        baseline = None
+    if baseline and not same_python(baseline.get('python')):
+        print(f"⚠️  Baseline was recorded with Python {baseline.get('python')}, this is "
+              f"{platform.python_version()}; differences may come from the interpreter")
+
+    results = {}
+    failed = []
+    print(f"{'Case':<28} {'Records/s':>12} {'p50 ms':>9} {'p95 ms':>9} {'RSS MB':>8} "
+          f"{'Norm rec':>9} {'Norm p95':>9} {'+RSS MB':>8}  Baseline")
+    with tempfile.TemporaryDirectory() as workdir, FakeCanvasServer(course_count=args.size) as server:
+        cases = build_cases(server, workdir)
+        for name, setup in cases.items():
+            if args.cases and name not in args.cases:
+                continue
+            result = measure_in_process(setup, args.size, args.repeat)
+            if 'error' in result:
+                print(f"{name:<28} ❌ {result['error']}")
+                failed.append(name)
+                continue
+            results[name] = result
+
+            verdict = ''
+            if baseline and name in baseline['cases']:
+                regressions = compare(result, baseline['cases'][name], args.threshold)
+                if regressions:
+                    failed.append(name)
+                    verdict = '❌ ' + ', '.join(f"{metric} {change:+.0%}" for metric, _, _, change in regressions)
+                else:
+                    verdict = '✅'
+            print(f"{name:<28} {result['throughput']:>12,.0f} {result['p50'] * 1000:>9.1f} "
+                  f"{result['p95'] * 1000:>9.1f} {result['peak_rss_mb']:>8.1f} "
+                  f"{result['throughput_norm']:>9.0f} {result['p95_norm']:>9.2f} "
+                  f"{result['rss_growth_mb']:>8.1f}  {verdict}")
+
+    if args.save_baseline:
+        save_baseline(args.baseline, results, args)
+    elif baseline is None:
+        print(f"No baseline to compare with; run with --save-baseline to create {args.baseline}")
+
+    if failed:
+        print(f"❌ Regressed or failed: {', '.join(failed)} (threshold {args.threshold:.0%})")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Benchmark: JsonProcessor startup with and without the persisted semester index.
+
+- no sidecar       stream and parse the whole file, run SEMESTER_PATTERN per course
+- build sidecar    the same, plus writing file_name.semidx (first run)
+- cold start       validate the sidecar (size, mtime) and load it
+- touched file     cold start after the file's mtime changed: its content is
+                   hashed once to confirm it, and the new mtime recorded
+- one semester     get_courses_by_semester on a cold processor: reads that
+                   semester's courses only
+
+Usage:
+    python benchmarks/bench_semester_sidecar.py [--courses 100000]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from canvasutils.jsonutil import json_util # type: ignore
+from canvasutils.jsonutil.json_processor import JsonProcessor # type: ignore
+from canvasutils.jsonutil.semester_index import sidecar_path # type: ignore
+from fake_canvas import make_course
+from bench_runner import Silenced
+
+def timed(name, run):
+    start = time.perf_counter()
+    result = run()
+    print(f"{name:<16} {time.perf_counter() - start:>8.3f}s")
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--courses', type=int, default=100000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        file_name = os.path.join(workdir, 'courses.json')
+        with Silenced():
+            json_util.store_json_object([make_course(i) for i in range(args.courses)], file_name)
+        print(f"{args.courses} courses, {os.path.getsize(file_name) / 2**20:.1f} MB of JSON")
+
+        plain = timed('no sidecar', lambda: JsonProcessor(file_name))
+        timed('build sidecar', lambda: JsonProcessor(file_name, sidecar=True))
+        cold = timed('cold start', lambda: JsonProcessor(file_name, sidecar=True))
+        fall = timed('one semester', lambda: cold.get_courses_by_semester('2025', 'Fall'))
+        os.utime(file_name)
+        touched = timed('touched file', lambda: JsonProcessor(file_name, sidecar=True))
+        timed('cold start', lambda: JsonProcessor(file_name, sidecar=True))
+
+        same = (fall == plain.get_courses_by_semester('2025', 'Fall')
+                and touched.sidecar is not None
+                and cold.semester_counts() == plain.semester_counts())
+        print(f"\nsidecar {os.path.getsize(sidecar_path(file_name)) / 2**20:.1f} MB; "
+              f"same results: {'✅' if same else '❌'}")
+
+if __name__ == "__main__":
+    main()
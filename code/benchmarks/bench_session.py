@@ -0,0 +1,68 @@
+"""
+Benchmark: per-page latency of CanvasManager.make_request with a pooled
+keep-alive session versus a new connection per page (module-level requests.get).
+
+Usage:
+    python benchmarks/bench_session.py [--courses 2000] [--per-page 10] [--connect-latency 0.005]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import requests
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'adv_examples')))
+from canvas.canvas_manager import CanvasManager # type: ignore
+from fake_canvas import FakeCanvasServer
+
+def walk_without_session(base_url, params):
+    """The old make_request loop: one requests.get (and one new connection) per page"""
+    url = f"{base_url}/api/v1/courses"
+    headers = {'Authorization': 'Bearer benchmark'}
+    results = []
+    while url:
+        response = requests.get(url, headers=headers, params=params)
+        response.raise_for_status()
+        results.extend(response.json())
+        url = response.links.get('next', {}).get('url')
+        params = None
+    return results
+
+def walk_with_session(base_url, params):
+    """CanvasManager.make_request using its pooled session"""
+    with CanvasManager(api_url=base_url, api_key='benchmark') as manager:
+        return manager.make_request('courses', params=params)
+
+def run(name, walk, server, params):
+    connections, request_count = server.connections, server.requests
+    start = time.perf_counter()
+    results = walk(server.url, dict(params))
+    elapsed = time.perf_counter() - start
+    pages = server.requests - request_count
+    print(f"{name:<22} {len(results):>7} items {pages:>5} pages "
+          f"{server.connections - connections:>5} connections "
+          f"{elapsed:>8.3f}s total {elapsed / pages * 1000:>8.2f} ms/page")
+    return elapsed / pages
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--courses', type=int, default=2000)
+    parser.add_argument('--per-page', type=int, default=10)
+    parser.add_argument('--connect-latency', type=float, default=0.005,
+                        help='simulated handshake cost per new connection (seconds)')
+    args = parser.parse_args()
+
+    params = {'per_page': args.per_page}
+    with FakeCanvasServer(course_count=args.courses, connect_latency=args.connect_latency) as server:
+        print(f"Fake Canvas at {server.url}: {args.courses} courses, per_page={args.per_page}, "
+              f"connect latency {args.connect_latency * 1000:.1f} ms")
+        baseline = run('requests.get per page', walk_without_session, server, params)
+        pooled = run('pooled session', walk_with_session, server, params)
+
+    print(f"\nPer-page latency: {baseline * 1000:.2f} ms -> {pooled * 1000:.2f} ms "
+          f"({baseline / pooled:.1f}x faster)")
+
+if __name__ == "__main__":
+    main()
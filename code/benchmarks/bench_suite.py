@@ -0,0 +1,141 @@
+"""
+Benchmark suite: the main Canvas data paths against the local fake Canvas
+server, at 1k, 10k and 100k courses.
+
+Cases (records are courses unless noted):
+- make_request            CanvasManager.make_request('courses'), page by page
+- make_request_parallel   the same with parallel=True
+- download_json           CanvasManager.iter_items -> json_util.store_json_items
+                          (what 1_download_all_classes_json.py does)
+- json_processor          JsonProcessor: load the JSON file and build the semester map
+- filter_courses_regex    JsonProcessor.filter_courses_regex for one semester
+- get_courses             canvasutils._courses.get_courses through canvasapi
+                          (only up to --canvasapi-max courses: canvasapi parses every
+                          field of every object and takes ~10 ms per course)
+- file_download           canvasapi File.download of one folder (records: files)
+- file_upload             folder_util.upload_file_to_folder (records: files)
+
+Usage:
+    python benchmarks/bench_suite.py [--sizes 1000 10000 100000] [--latency 0]
+                                     [--canvasapi-max 1000] [--files 20]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'adv_examples')))
+from canvas.canvas_manager import CanvasManager # type: ignore
+from canvasapi import Canvas # type: ignore
+from canvasutils import _courses # type: ignore
+from canvasutils.folder import folder_util # type: ignore
+from canvasutils.jsonutil import json_util # type: ignore
+from canvasutils.jsonutil.json_processor import JsonProcessor # type: ignore
+from fake_canvas import FakeCanvasServer
+
+DEFAULT_SIZES = (1000, 10000, 100000)
+
+def build_cases(server, workdir, args):
+    """
+    The benchmark cases for one fake server: (name, records, run) tuples.
+    run() does the work once; cases run in order, so later cases may use the
+    files earlier ones wrote.
+    """
+    size = len(server.courses)
+    params = {'per_page': 100}
+    json_file = os.path.join(workdir, 'courses.json')
+
+    def make_request(parallel):
+        def run():
+            with CanvasManager(api_url=server.url, api_key='benchmark') as manager:
+                return manager.make_request('courses', params=dict(params), parallel=parallel)
+        return run
+
+    def download_json():
+        with CanvasManager(api_url=server.url, api_key='benchmark') as manager:
+            with open(os.devnull, 'w') as devnull:
+                stdout, sys.stdout = sys.stdout, devnull
+                try:
+                    return json_util.store_json_items(manager.iter_items('courses', params=dict(params)),
+                                                      json_file)
+                finally:
+                    sys.stdout = stdout
+
+    def json_processor():
+        return JsonProcessor(json_file)
+
+    processor = {}
+    def filter_courses_regex():
+        if 'instance' not in processor:
+            processor['instance'] = JsonProcessor(json_file)
+        return processor['instance'].filter_courses_regex('2025', 'Fall')
+
+    canvas = Canvas(server.url, 'benchmark')
+    def get_courses():
+        return _courses.get_courses(canvas, '2025', 'Fall')
+
+    course = canvas.get_course(server.courses[0]['id'])
+    def file_download():
+        folder = folder_util.get_course_folder(course, 'Lectures')
+        for file in folder.get_files():
+            file.download(os.path.join(workdir, file.filename))
+
+    upload_path = os.path.join(workdir, 'upload.pdf')
+    with open(upload_path, 'wb') as f:
+        f.write(os.urandom(server.file_size))
+    def file_upload():
+        for _ in range(args.files):
+            folder_util.upload_file_to_folder(course, 'Homework', upload_path)
+
+    cases = [
+        ('make_request', size, make_request(False)),
+        ('make_request_parallel', size, make_request(True)),
+        ('download_json', size, download_json),
+        ('json_processor', size, json_processor),
+        ('filter_courses_regex', size, filter_courses_regex),
+    ]
+    if size <= args.canvasapi_max:
+        cases.append(('get_courses', size, get_courses))
+    cases += [
+        ('file_download', args.files, file_download),
+        ('file_upload', args.files, file_upload),
+    ]
+    return cases
+
+def fake_server(size, args):
+    """Fake Canvas for one record count"""
+    return FakeCanvasServer(course_count=size, latency=args.latency, files_per_folder=args.files)
+
+def add_arguments(parser):
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES))
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--canvasapi-max', type=int, default=1000,
+                        help='largest size the canvasapi get_courses case runs at')
+    parser.add_argument('--files', type=int, default=20, help='files downloaded and uploaded')
+
+def quiet():
+    """Silence the INFO logging of the code under test"""
+    logging.disable(logging.INFO)
+    import warnings
+    warnings.filterwarnings('ignore', message='Canvas may respond unexpectedly')
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    add_arguments(parser)
+    args = parser.parse_args()
+    quiet()
+
+    print(f"{'Case':<24} {'Size':>7} {'Records':>8} {'Seconds':>9} {'Records/s':>11}")
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as workdir, fake_server(size, args) as server:
+            for name, records, run in build_cases(server, workdir, args):
+                start = time.perf_counter()
+                run()
+                elapsed = time.perf_counter() - start
+                print(f"{name:<24} {size:>7} {records:>8} {elapsed:>9.3f} {records / elapsed:>11,.0f}")
+
+if __name__ == "__main__":
+    main()
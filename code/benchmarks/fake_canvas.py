@@ -0,0 +1,554 @@
+"""
+Local Canvas stand-in server for benchmarks.
+
+Serves deterministic synthetic courses (/api/v1/courses), their assignments
+(/api/v1/courses/:id/assignments), single courses (/api/v1/courses/:id, with
+include[]=total_students), students (/api/v1/courses/:id/users) and
+submissions (/api/v1/courses/:id/assignments/:id/submissions, and the
+multi-student /api/v1/courses/:id/students/submissions with student_ids[] and
+assignment_ids[]), folders (/api/v1/courses/:id/folders) and files
+(/api/v1/folders/:id/files, /api/v1/courses/:id/files) with the same
+page/per_page query parameters and Link header pagination that Canvas uses.
+
+Files are downloaded from /files/:id/download (file_size bytes each) and
+uploaded with Canvas's two-step flow: POST /api/v1/folders/:id/files (or
+/api/v1/courses/:id/files) returns an upload_url, and the multipart POST to
+that URL returns the new file object.
+
+POST /api/graphql answers the named queries of canvasutils.httputil.graphql
+(CourseAssignments, AssignmentSubmissions, CourseStudents) from the same data,
+with Relay-style cursor pagination. It is a stand-in, not a GraphQL engine:
+queries are recognised by operation name.
+
+Latency knobs:
+- latency: seconds slept before answering every request
+- connect_latency: seconds slept once per new connection, which stands in for
+  the TCP+TLS handshake cost of a real Canvas host
+- bandwidth: bytes per second a response body takes to send (None: unlimited)
+
+With bookmarks=True pages are addressed by opaque page=bookmark:... tokens and
+no rel="last" link is sent, like Canvas does for some listings.
+
+With rate_limit=<bucket size> every response carries X-Request-Cost and
+X-Rate-Limit-Remaining headers from a leaky bucket, and an empty bucket answers
+"403 Forbidden (Rate Limit Exceeded)" like Canvas.
+
+Every 200 response carries an ETag; a matching If-None-Match is answered
+with "304 Not Modified" and no body.
+
+With error_rate=<0..1> that fraction of requests fails transiently, half with
+"502 Bad Gateway" and half by resetting the connection (seeded, repeatable).
+"""
+
+import base64
+import hashlib
+import json
+import random
+import re
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlencode, urlparse
+
+DEFAULT_PER_PAGE = 10
+MAX_PER_PAGE = 100
+SEMESTERS = ['Spring', 'Summer', 'Fall']
+FOLDER_NAMES = ['course files', 'Lectures', 'Homework', 'Submissions']
+
+def make_course(index):
+    """Build one deterministic synthetic course record"""
+    year = 2015 + index % 11
+    semester = SEMESTERS[index % len(SEMESTERS)]
+    number = 100 + index % 400
+    return {
+        'id': 10000 + index,
+        'name': f"Course {index} ({year} {semester} full term) CSC-{number}-00{index % 5}",
+        'course_code': f"CSC-{number}-00{index % 5}",
+        'workflow_state': 'available' if index % 7 else 'completed',
+        'enrollment_term_id': 2000 + (year - 2015) * 3 + SEMESTERS.index(semester),
+        'account_id': 1,
+        'start_at': f"{year}-08-15T00:00:00Z",
+        'end_at': None,
+        # The rest of the default fields of a Canvas course object
+        'uuid': hashlib.md5(str(index).encode()).hexdigest(),
+        'created_at': f"{year}-05-01T12:00:00Z",
+        'root_account_id': 1,
+        'grading_standard_id': None,
+        'is_public': False,
+        'is_public_to_auth_users': False,
+        'public_syllabus': False,
+        'public_syllabus_to_auth': False,
+        'storage_quota_mb': 500,
+        'license': 'private',
+        'default_view': 'modules',
+        'time_zone': 'America/New_York',
+        'apply_assignment_group_weights': index % 2 == 0,
+        'hide_final_grades': False,
+        'restrict_enrollments_to_course_dates': False,
+        'blueprint': False,
+        'homeroom_course': False,
+        'friendly_name': None,
+        'course_color': None,
+        'calendar': {'ics': f"https://canvas.example.edu/feeds/calendars/course_{index:08d}.ics"},
+        'enrollments': [{'type': 'teacher', 'role': 'TeacherEnrollment', 'role_id': 4,
+                         'user_id': 1, 'enrollment_state': 'active',
+                         'limit_privileges_to_course_section': False}],
+    }
+
+def make_term(course):
+    """Term object of a course, returned with include[]=term"""
+    return {
+        'id': course['enrollment_term_id'],
+        'name': course['name'][course['name'].index('(') + 1:course['name'].index(' full term')],
+        'start_at': course['start_at'],
+        'end_at': None,
+        'created_at': course['created_at'],
+        'workflow_state': 'active',
+        'grading_period_group_id': None,
+    }
+
+def make_assignments(course_id):
+    """Build the deterministic assignments of one course (3 to 12 per course)"""
+    return [{
+        'id': course_id * 100 + i,
+        'course_id': course_id,
+        'name': f"HW{i + 1}",
+        'points_possible': 10 * (i % 5 + 1),
+        'due_at': f"2025-{i % 12 + 1:02d}-15T23:59:59Z",
+        'published': True,
+    } for i in range(3 + course_id % 10)]
+
+def make_students(course_id):
+    """Build the deterministic students of one course (5 to 44 per course)"""
+    return [{
+        'id': 500000 + (course_id * 7 + i) % 20000,
+        'name': f"Student {i + 1} of {course_id}",
+        'sortable_name': f"{course_id}, Student {i + 1}",
+        'short_name': f"Student {i + 1}",
+    } for i in range(5 + course_id % 40)]
+
+def make_submissions(course_id, assignment_id):
+    """Build one submission per student of an assignment; about 3 in 4 are submitted"""
+    submissions = []
+    for student in make_students(course_id):
+        roll = (student['id'] * 31 + assignment_id) % 8
+        submitted = roll < 6
+        graded = roll < 3
+        submissions.append({
+            'id': assignment_id * 1000 + student['id'] % 1000,
+            'user_id': student['id'],
+            'assignment_id': assignment_id,
+            'submitted_at': f"2025-03-{roll + 1:02d}T12:00:00Z" if submitted else None,
+            'workflow_state': 'graded' if graded else 'submitted' if submitted else 'unsubmitted',
+            'score': float(roll) if graded else None,
+            'grade': str(roll) if graded else None,
+            'attempt': 1 if submitted else None,
+            'late': roll == 5,
+            'missing': not submitted,
+        })
+    return submissions
+
+def make_folders(course_id, files_per_folder):
+    """Build the folders of one course: the root 'course files' folder and its subfolders"""
+    root_id = course_id * 10
+    return [{
+        'id': root_id + i,
+        'name': name,
+        'full_name': name if i == 0 else f"course files/{name}",
+        'context_id': course_id,
+        'context_type': 'Course',
+        'parent_folder_id': None if i == 0 else root_id,
+        'files_count': files_per_folder,
+        'folders_count': len(FOLDER_NAMES) - 1 if i == 0 else 0,
+        'position': i + 1,
+        'locked': False,
+        'hidden': False,
+        'files_url': f"/api/v1/folders/{root_id + i}/files",
+    } for i, name in enumerate(FOLDER_NAMES)]
+
+def make_file(file_id, folder_id, base_url, size, name=None):
+    """Build one file object, downloadable from /files/:id/download"""
+    name = name or f"file_{file_id % 1000 + 1}.pdf"
+    return {
+        'id': file_id,
+        'folder_id': folder_id,
+        'display_name': name,
+        'filename': name,
+        'content-type': 'application/pdf',
+        'size': size,
+        'url': f"{base_url}/files/{file_id}/download?download_frd=1",
+        'created_at': '2025-01-10T12:00:00Z',
+        'updated_at': '2025-01-10T12:00:00Z',
+        'locked': False,
+        'hidden': False,
+    }
+
+def make_files(folder_id, base_url, files_per_folder, size):
+    """Build the files of one folder"""
+    return [make_file(folder_id * 1000 + i, folder_id, base_url, size)
+            for i in range(files_per_folder)]
+
+def file_content(file_id, size):
+    """Deterministic body of a file"""
+    block = hashlib.sha256(str(file_id).encode()).digest()
+    return (block * (size // len(block) + 1))[:size]
+
+def make_submission_matrix(course_id, query):
+    """Submissions of GET /courses/:id/students/submissions for the student_ids[] and assignment_ids[] asked"""
+    assignment_ids = {int(i) for i in query.get('assignment_ids[]', [])}
+    student_ids = query.get('student_ids[]', ['all'])
+    student_ids = None if 'all' in student_ids else {int(i) for i in student_ids}
+    return [submission
+            for assignment in make_assignments(course_id)
+            if not assignment_ids or assignment['id'] in assignment_ids
+            for submission in make_submissions(course_id, assignment['id'])
+            if student_ids is None or submission['user_id'] in student_ids]
+
+
+class LeakyBucket(object):
+    """Canvas-style rate-limit bucket: each request costs units, time refills them"""
+
+    def __init__(self, size, refill_rate=10.0, request_cost=20.0):
+        self.size = size
+        self.refill_rate = refill_rate
+        self.request_cost = request_cost
+        self.remaining = float(size)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def charge(self):
+        """Charge one request; returns the remaining units, or None if the bucket is empty"""
+        with self._lock:
+            now = time.monotonic()
+            self.remaining = min(self.size, self.remaining + (now - self._updated_at) * self.refill_rate)
+            self._updated_at = now
+            if self.remaining < self.request_cost:
+                return None
+            self.remaining -= self.request_cost
+            return self.remaining
+
+
+class FakeCanvasHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 keeps the connection open between requests (keep-alive)
+    protocol_version = 'HTTP/1.1'
+    # Headers and body go out in separate writes; avoid delayed-ACK stalls
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+        if self.server.connect_latency:
+            time.sleep(self.server.connect_latency)
+
+    def log_message(self, format, *args):
+        pass
+
+    def begin_request(self):
+        """Apply latency, failure injection and rate limiting; False if already answered"""
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        self.server.requests += 1
+
+        self.extra_headers = {}
+        failure = self.server.next_failure()
+        if failure == 'reset':
+            self.close_connection = True
+            self.connection.shutdown(socket.SHUT_RDWR)
+            return False
+        if failure == 'bad_gateway':
+            self.send_text(502, '502 Bad Gateway')
+            return False
+
+        if self.server.bucket:
+            remaining = self.server.bucket.charge()
+            self.extra_headers['X-Request-Cost'] = str(self.server.bucket.request_cost)
+            self.extra_headers['X-Rate-Limit-Remaining'] = str(remaining or 0.0)
+            if remaining is None:
+                self.server.rejected += 1
+                self.send_text(403, '403 Forbidden (Rate Limit Exceeded)')
+                return False
+        return True
+
+    def do_GET(self):
+        if not self.begin_request():
+            return
+
+        parsed = urlparse(self.path)
+        query = parse_qs(parsed.query)
+        path = parsed.path.rstrip('/')
+        assignments = re.fullmatch(r'/api/v1/courses/(\d+)/assignments', path)
+        users = re.fullmatch(r'/api/v1/courses/(\d+)/(?:search_)?users', path)
+        submissions = re.fullmatch(r'/api/v1/courses/(\d+)/assignments/(\d+)/submissions', path)
+        matrix = re.fullmatch(r'/api/v1/courses/(\d+)/students/submissions', path)
+        course = re.fullmatch(r'/api/v1/courses/(\d+)', path)
+        folders = re.fullmatch(r'/api/v1/courses/(\d+)/folders', path)
+        folder_files = re.fullmatch(r'/api/v1/folders/(\d+)/files', path)
+        course_files = re.fullmatch(r'/api/v1/courses/(\d+)/files', path)
+        download = re.fullmatch(r'/files/(\d+)/download', path)
+        if path == '/api/v1/courses':
+            include_term = 'term' in query.get('include[]', [])
+            self.send_page(parsed.path, query, self.server.courses,
+                           (lambda course: {**course, 'term': make_term(course)}) if include_term else None)
+        elif course and int(course.group(1)) in self.server.courses_by_id:
+            record = self.server.courses_by_id[int(course.group(1))]
+            if 'total_students' in query.get('include[]', []):
+                record = {**record, 'total_students': len(make_students(record['id']))}
+            self.send_json(200, record)
+        elif folders:
+            self.send_page(parsed.path, query, make_folders(int(folders.group(1)),
+                                                            self.server.files_per_folder))
+        elif folder_files:
+            self.send_page(parsed.path, query, self.folder_files(int(folder_files.group(1))))
+        elif course_files:
+            root_id = int(course_files.group(1)) * 10
+            self.send_page(parsed.path, query, [file for i in range(len(FOLDER_NAMES))
+                                                for file in self.folder_files(root_id + i)])
+        elif download:
+            self.server.downloaded_files += 1
+            self.send_payload(200, file_content(int(download.group(1)), self.server.file_size),
+                              'application/octet-stream')
+        elif assignments:
+            self.send_page(parsed.path, query, make_assignments(int(assignments.group(1))))
+        elif users:
+            self.send_page(parsed.path, query, make_students(int(users.group(1))))
+        elif submissions:
+            self.send_page(parsed.path, query, make_submissions(int(submissions.group(1)),
+                                                                int(submissions.group(2))))
+        elif matrix:
+            self.send_page(parsed.path, query, make_submission_matrix(int(matrix.group(1)), query))
+        else:
+            self.send_json(404, {'errors': [{'message': 'The specified resource does not exist.'}]})
+
+    def folder_files(self, folder_id):
+        return make_files(folder_id, self.server.url, self.server.files_per_folder,
+                          self.server.file_size)
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        if not self.begin_request():
+            return
+        path = urlparse(self.path).path.rstrip('/')
+        upload_token = re.fullmatch(r'/api/v1/(folders|courses)/(\d+)/files', path)
+        upload = re.fullmatch(r'/files_api/upload/(\d+)', path)
+        if path == '/api/graphql':
+            request = json.loads(body or b'{}')
+            self.send_json(200, resolve_graphql(request.get('query', ''), request.get('variables') or {}))
+        elif upload_token:
+            # Step 1: hand out the URL the file itself is posted to
+            form = parse_qs(body.decode('utf-8'))
+            folder_id = int(upload_token.group(2)) * (10 if upload_token.group(1) == 'courses' else 1)
+            name = form.get('name', ['upload.bin'])[0]
+            self.send_json(200, {'upload_url': f"{self.server.url}/files_api/upload/{folder_id}",
+                                 'upload_params': {'filename': name, 'content_type': 'application/octet-stream'}})
+        elif upload:
+            # Step 2: the multipart body holds the upload_params and the file
+            name = re.search(rb'name="filename"\r\n\r\n([^\r]*)', body)
+            name = name.group(1).decode('utf-8') if name else 'upload.bin'
+            self.server.uploaded_files += 1
+            self.server.uploaded_bytes += len(body)
+            file_id = 900000000 + self.server.uploaded_files
+            self.send_json(201, make_file(file_id, int(upload.group(1)), self.server.url,
+                                          len(body), name))
+        else:
+            self.send_json(404, {'errors': [{'message': 'The specified resource does not exist.'}]})
+
+    def send_page(self, path, query, records, decorate=None):
+        """Send one page of records with a Canvas-style Link header; decorate adds include[] data"""
+        bookmarks = self.server.bookmarks
+        per_page = min(int(query.get('per_page', [DEFAULT_PER_PAGE])[0]), MAX_PER_PAGE)
+        page = query.get('page', ['1'])[0]
+        if page.startswith('bookmark:'):
+            page = base64.urlsafe_b64decode(page[len('bookmark:'):]).decode()
+        page = int(page)
+        last_page = max(1, -(-len(records) // per_page))
+
+        start = (page - 1) * per_page
+        body = records[start:start + per_page]
+        if decorate:
+            body = [decorate(record) for record in body]
+
+        def page_url(number):
+            if bookmarks:
+                number = 'bookmark:' + base64.urlsafe_b64encode(str(number).encode()).decode()
+            params = dict(query)
+            params.update({'page': number, 'per_page': per_page})
+            return f"<{self.server.url}{path}?{urlencode(params, doseq=True)}>"
+
+        links = [f'{page_url(page)}; rel="current"']
+        if page < last_page:
+            links.append(f'{page_url(page + 1)}; rel="next"')
+        if page > 1:
+            links.append(f'{page_url(page - 1)}; rel="prev"')
+        links.append(f'{page_url(1)}; rel="first"')
+        if not bookmarks:
+            links.append(f'{page_url(last_page)}; rel="last"')
+
+        self.send_json(200, body, {'Link': ','.join(links)})
+
+    def send_json(self, status, data, headers=None):
+        self.send_payload(status, json.dumps(data).encode('utf-8'),
+                          'application/json; charset=utf-8', headers)
+
+    def send_text(self, status, text):
+        self.send_payload(status, text.encode('utf-8'), 'text/plain; charset=utf-8')
+
+    def send_payload(self, status, payload, content_type, headers=None):
+        if status == 200:
+            # Canvas-style validator: answer 304 when the client already has this body
+            etag = f'"{hashlib.md5(payload).hexdigest()}"'
+            headers = {**(headers or {}), 'ETag': etag}
+            if self.headers.get('If-None-Match') == etag:
+                self.server.not_modified += 1
+                status, payload = 304, b''
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(payload)))
+        for name, value in {**getattr(self, 'extra_headers', {}), **(headers or {})}.items():
+            self.send_header(name, value)
+        self.end_headers()
+        if self.server.bandwidth and payload:
+            time.sleep(len(payload) / self.server.bandwidth)
+        self.wfile.write(payload)
+
+
+def _connection(records, first, after, to_node):
+    """One Relay-style page: {'pageInfo': ..., 'nodes': [...]}, cursors are offsets"""
+    start = int(base64.b64decode(after).decode()) if after else 0
+    end = start + first
+    return {
+        'pageInfo': {'hasNextPage': end < len(records),
+                     'endCursor': base64.b64encode(str(end).encode()).decode()},
+        'nodes': [to_node(record) for record in records[start:end]],
+    }
+
+def _graphql_submission(submission):
+    return {
+        '_id': str(submission['id']),
+        'userId': str(submission['user_id']),
+        'submittedAt': submission['submitted_at'],
+        'state': submission['workflow_state'],
+        'score': submission['score'],
+        'grade': submission['grade'],
+        'attempt': submission['attempt'],
+        'late': submission['late'],
+        'missing': submission['missing'],
+    }
+
+def resolve_graphql(query, variables):
+    """Answer the known named GraphQL queries from the synthetic data"""
+    operation = re.search(r'query\s+(\w+)', query)
+    operation = operation.group(1) if operation else None
+
+    if operation == 'CourseAssignments':
+        course_id = int(variables['courseId'])
+        submissions_first = variables.get('submissionsFirst', 100)
+
+        def assignment_node(assignment):
+            return {
+                '_id': str(assignment['id']),
+                'name': assignment['name'],
+                'dueAt': assignment['due_at'],
+                'pointsPossible': assignment['points_possible'],
+                'published': assignment['published'],
+                'submissionsConnection': _connection(
+                    make_submissions(course_id, assignment['id']), submissions_first, None,
+                    _graphql_submission),
+            }
+        assignments = _connection(make_assignments(course_id), variables.get('first', 20),
+                                  variables.get('after'), assignment_node)
+        return {'data': {'course': {'_id': str(course_id), 'assignmentsConnection': assignments}}}
+
+    if operation == 'AssignmentSubmissions':
+        assignment_id = int(variables['assignmentId'])
+        submissions = _connection(make_submissions(assignment_id // 100, assignment_id),
+                                  variables.get('first', 100), variables.get('after'),
+                                  _graphql_submission)
+        return {'data': {'assignment': {'_id': str(assignment_id),
+                                        'submissionsConnection': submissions}}}
+
+    if operation == 'CourseStudents':
+        course_id = int(variables['courseId'])
+        users = _connection(make_students(course_id), variables.get('first', 100),
+                            variables.get('after'), lambda student: {
+                                '_id': str(student['id']),
+                                'name': student['name'],
+                                'sortableName': student['sortable_name'],
+                                'shortName': student['short_name'],
+                            })
+        return {'data': {'course': {'_id': str(course_id), 'usersConnection': users}}}
+
+    return {'errors': [{'message': f"Unknown operation {operation!r} (fake Canvas stand-in)"}]}
+
+
+class FakeCanvasServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, course_count=1000, latency=0.0, connect_latency=0.0, bandwidth=None,
+                 bookmarks=False, rate_limit=None, refill_rate=10.0, request_cost=20.0,
+                 error_rate=0.0, seed=0, files_per_folder=5, file_size=64 * 1024,
+                 host='127.0.0.1', port=0):
+        super().__init__((host, port), FakeCanvasHandler)
+        self.courses = [make_course(i) for i in range(course_count)]
+        self.courses_by_id = {course['id']: course for course in self.courses}
+        self.latency = latency
+        self.connect_latency = connect_latency
+        self.bandwidth = bandwidth
+        self.bookmarks = bookmarks
+        self.bucket = LeakyBucket(rate_limit, refill_rate, request_cost) if rate_limit else None
+        self.error_rate = error_rate
+        self.connections = 0
+        self.requests = 0
+        self.rejected = 0
+        self.failures = 0
+        self.not_modified = 0
+        self.files_per_folder = files_per_folder
+        self.file_size = file_size
+        self.downloaded_files = 0
+        self.uploaded_files = 0
+        self.uploaded_bytes = 0
+        self._random = random.Random(seed)
+        self._random_lock = threading.Lock()
+        self._thread = None
+
+    def next_failure(self):
+        """Decide whether the current request fails: None, 'bad_gateway' or 'reset'"""
+        if not self.error_rate:
+            return None
+        with self._random_lock:
+            roll = self._random.random()
+        if roll >= self.error_rate:
+            return None
+        self.failures += 1
+        return 'bad_gateway' if roll < self.error_rate / 2 else 'reset'
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """Serve requests from a background thread"""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+
+if __name__ == "__main__":
+    with FakeCanvasServer() as server:
+        print(f"Fake Canvas serving {len(server.courses)} courses at {server.url}/api/v1/courses")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
@@ -3,6 +3,7 @@ import os
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from canvasutils import getinfo as utils # type: ignore
+from canvasutils import listing # type: ignore
 
 def setup():
   canvas = utils.get_canvas()
@@ -48,7 +49,7 @@ def t2_debugging():
             return
         
         c = canvas.get_course(81929)
-        user = c.get_users()[0]
+        user = listing.first(c.get_users())  # one per_page=1 request
         logger.debug(f"User ID: {user.id}, Name: {user.name}")
         print(f"User ID: {user.id}, Name: {user.name}")
     except Exception as e:
@@ -72,7 +73,7 @@ def t3_simple_debugging_configuration():
             return
         
         c = canvas.get_course(81929)
-        user = c.get_users()[0]
+        user = listing.first(c.get_users())  # one per_page=1 request
         print(f"User ID: {user.id}, Name: {user.name}")
     except Exception as e:
         print(f"❌ An error occurred: {e}")
@@ -101,7 +102,7 @@ def t4_configure_debugging():
             return
         
         c = canvas.get_course(81929)
-        user = c.get_users()[0]
+        user = listing.first(c.get_users())  # one per_page=1 request
         logger.debug(f"User ID: {user.id}, Name: {user.name}")
         print(f"User ID: {user.id}, Name: {user.name}")
     except Exception as e:
@@ -148,7 +149,7 @@ def t5_filtering_logging_information():
             return
         
         c = canvas.get_course(81929)
-        user = c.get_users()[0]
+        user = listing.first(c.get_users())  # one per_page=1 request
         logger.debug(f"User ID: {user.id}, Name: {user.name}")
             # Example usage
         logger.debug("This is a debug message without User ID")  # Will be filtered out
@@ -1,2 +1,3 @@
 from .jsonutil import json_processor, json_util
-from .folder import folder_util
\ No newline at end of file
+from .folder import folder_util
+from .httputil import etag_cache, http_session, pagination, retry, throttle
\ No newline at end of file
@@ -0,0 +1,66 @@
+from collections import Counter
+
+# Canvas caps per_page of the submissions listings at 100
+SUBMISSIONS_PER_PAGE = 100
+
+def submission_matrix_params(assignment_ids=None, per_page=SUBMISSIONS_PER_PAGE):
+    """
+    Query parameters of GET /courses/:id/students/submissions for every student
+    and the given assignments (None: all assignments of the course)
+    """
+    params = {'student_ids[]': 'all', 'per_page': per_page}
+    if assignment_ids:
+        params['assignment_ids[]'] = [str(assignment_id) for assignment_id in assignment_ids]
+    return params
+
+def iter_submission_matrix(manager, course_id, assignment_ids=None, per_page=SUBMISSIONS_PER_PAGE):
+    """
+    Stream the submissions of every student for many assignments at once.
+
+    One paginated listing replaces a submissions listing per assignment.
+
+    Args:
+        manager: Client with iter_items(endpoint, params=...), e.g. CanvasManager
+        course_id: Canvas course id
+        assignment_ids: Assignments to include (None: all of the course)
+    """
+    return manager.iter_items(f"courses/{course_id}/students/submissions",
+                              params=submission_matrix_params(assignment_ids, per_page))
+
+def _field(item, name):
+    """Field of a REST dict or a canvasapi object"""
+    return item.get(name) if isinstance(item, dict) else getattr(item, name, None)
+
+def submission_rates(submissions, assignments, student_count=None):
+    """
+    Per-assignment submission rates from one pass over a submission matrix.
+
+    Args:
+        submissions: Submissions of many assignments (dicts or canvasapi Submission objects)
+        assignments: Assignments to report on, in report order (dicts or canvasapi objects)
+        student_count: Students in the course; None counts the distinct
+                       students found in the submissions
+
+    Returns:
+        One dict per assignment: id, name, submitted, students and rate (percent)
+    """
+    submitted = Counter()
+    students = set()
+    for submission in submissions:
+        students.add(_field(submission, 'user_id'))
+        if _field(submission, 'submitted_at'):
+            submitted[_field(submission, 'assignment_id')] += 1
+
+    if student_count is None:
+        student_count = len(students)
+    rates = []
+    for assignment in assignments:
+        count = submitted[_field(assignment, 'id')]
+        rates.append({
+            'id': _field(assignment, 'id'),
+            'name': _field(assignment, 'name'),
+            'submitted': count,
+            'students': student_count,
+            'rate': (count / student_count) * 100 if student_count else 0,
+        })
+    return rates
@@ -0,0 +1,86 @@
+from .httputil import pagination
+
+# Page size of the fallback that counts a listing page by page
+STREAM_PER_PAGE = 100
+
+def total_from_links(items, links):
+    """
+    Total items of a listing from its first page requested with per_page=1.
+
+    With one item per page, the page number of the rel="last" link is the
+    item count. Returns None when that cannot be known: no rel="last" link
+    (Canvas omits it for expensive listings) or bookmark pages.
+    """
+    if 'next' not in links:
+        return len(items)  # the only page, holding 0 or 1 item
+    last = links.get('last')
+    return pagination.get_page_number(last['url']) if last else None
+
+def count_listing(get, url, params=None, per_page=STREAM_PER_PAGE):
+    """
+    Count the items of a Canvas REST listing without keeping them.
+
+    One per_page=1 request is enough when the rel="last" link is numbered;
+    otherwise the listing is walked page by page, keeping one page in memory.
+
+    Args:
+        get: Function sending a GET: get(url, params) -> (page items, response.links)
+        url: Listing URL
+        params: Query parameters of the listing (per_page is replaced)
+    """
+    params = {key: value for key, value in (params or {}).items() if key != 'per_page'}
+    total = total_from_links(*get(url, {**params, 'per_page': 1}))
+    if total is not None:
+        return total
+
+    count = 0
+    page_params = {**params, 'per_page': per_page}
+    while url:
+        items, links = get(url, page_params)
+        count += len(items)
+        url = links.get('next', {}).get('url')
+        page_params = None  # the next URL carries them
+    return count
+
+def count_paginated(paginated_list, per_page=STREAM_PER_PAGE):
+    """
+    Count a canvasapi PaginatedList (e.g. course.get_assignments()) without
+    materializing it. Works like count_listing, through the list's requester.
+    """
+    requester = paginated_list._requester
+    first_params = dict(paginated_list._first_params)
+    # Requester.request extends _kwargs in place, so every request gets a fresh copy
+    kwargs = [(key, value) for key, value in first_params.pop('_kwargs', None) or []
+              if key != 'per_page']
+    first_params.pop('per_page', None)
+    root = paginated_list._root
+
+    def get(url, params):
+        if params is None:  # an absolute next-page URL
+            response = requester.request(paginated_list._request_method, _url=url)
+        else:
+            response = requester.request(paginated_list._request_method, url,
+                                         _url=paginated_list._url_override,
+                                         _kwargs=list(kwargs), **first_params, **params)
+        items = response.json()
+        # Some listings have their items under a key of the response object
+        return (items[root] if root else items), response.links
+
+    return count_listing(get, paginated_list._first_url, per_page=per_page)
+
+def count_students(course):
+    """
+    Number of students of a canvasapi Course.
+
+    Uses the course's total_students field (asking for include[]=total_students
+    if the course was fetched without it) and falls back to counting the
+    student users.
+    """
+    total = getattr(course, 'total_students', None)
+    if total is None:
+        response = course._requester.request('GET', f"courses/{course.id}",
+                                             _kwargs=[('include[]', 'total_students')])
+        total = response.json().get('total_students')
+    if total is None:
+        total = count_paginated(course.get_users(enrollment_type=['student']))
+    return total
@@ -3,6 +3,13 @@ from canvasapi import Canvas # type: ignore
 import os
 
 from . import logger
+from .httputil import http_session
+from .httputil.cassette import install_cassette
+from .httputil.etag_cache import install_conditional_cache
+from .httputil.response_cache import install_response_cache
+from .httputil.retry import install_retry
+from .httputil.single_flight import install_single_flight
+from .httputil.throttle import install_throttle
 
 def get_logname(pathname, delete=True):
     filename = os.path.basename(pathname)
@@ -59,9 +66,39 @@ def get_api_url():
         return None
     return env["API_URL"]
 
-def get_canvas():
-    """Initialize and return a Canvas instance if environment is valid"""
+def get_canvas(throttle=None, retry=None, conditional_cache=None, single_flight=None,
+               response_cache=None, cassette=None):
+    """
+    Initialize and return a Canvas instance if environment is valid
+
+    Args:
+        throttle: Optional httputil.throttle.RateLimitThrottle that paces every
+                  request of this Canvas by the Canvas rate-limit headers
+        retry: Optional httputil.retry.RetryPolicy for transient failures
+        conditional_cache: Optional httputil.etag_cache.ConditionalCache; GETs send
+                           the stored ETag and a 304 is served from disk
+        single_flight: Optional httputil.single_flight.SingleFlight; identical
+                       concurrent GETs share one request
+        response_cache: Optional httputil.response_cache.ResponseCache; fresh GETs
+                        are answered from SQLite without a request
+        cassette: Optional httputil.cassette.Cassette recording every request
+                  and response of this Canvas, or replaying them from disk
+    """
     env = get_environment()
     if not env:
         return None
-    return Canvas(env["API_URL"], env["API_KEY"])
+    canvas = Canvas(env["API_URL"], env["API_KEY"])
+    session = http_session.get_canvas_session(canvas)
+    if cassette:
+        install_cassette(session, cassette)
+    if throttle:
+        install_throttle(session, throttle)
+    if retry:
+        install_retry(session, retry)
+    if conditional_cache:
+        install_conditional_cache(session, conditional_cache)
+    if single_flight:
+        install_single_flight(session, single_flight)
+    if response_cache:
+        install_response_cache(session, response_cache)
+    return canvas
@@ -0,0 +1,190 @@
+import base64
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import defaultdict, deque
+
+from requests.adapters import BaseAdapter
+
+from . import http_session
+from .etag_cache import normalize_url
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CASSETTE_FILE = 'canvas_cassette.jsonl'
+
+RECORD = 'record'
+REPLAY = 'replay'
+# Replay timing: sleep each response's recorded duration, or answer at once
+ORIGINAL_TIMING = 'original'
+ZERO_LATENCY = 'none'
+
+class CassetteMiss(LookupError):
+    """A replayed request that was never recorded"""
+
+
+def body_digest(body):
+    """sha256 of a request body (None for no body)"""
+    if not body:
+        return None
+    if isinstance(body, str):
+        body = body.encode('utf-8')
+    elif not isinstance(body, bytes):
+        return None  # a streamed upload; matched by method and URL only
+    return hashlib.sha256(body).hexdigest()
+
+def _encode_content(content):
+    """Response body as JSON-friendly text: as is when UTF-8, base64 otherwise"""
+    try:
+        return content.decode('utf-8'), None
+    except UnicodeDecodeError:
+        return base64.b64encode(content).decode('ascii'), 'base64'
+
+def _decode_content(text, encoding):
+    return base64.b64decode(text) if encoding == 'base64' else text.encode('utf-8')
+
+
+class Cassette(object):
+    """
+    Recording of HTTP interactions in a JSON Lines file, one per line.
+
+    In record mode every request sent through a CassetteAdapter goes to the
+    network and its response is appended to the file, with how long it took.
+    In replay mode nothing goes to the network: each request is answered with
+    the next recorded response for the same method, URL (params in any order)
+    and body, so a workload can be profiled offline and repeatably. Requests
+    recorded several times are replayed in recording order; the last response
+    is repeated after that. Credentials are never written to the file.
+    """
+
+    def __init__(self, path=DEFAULT_CASSETTE_FILE, mode=REPLAY, timing=ORIGINAL_TIMING):
+        """
+        Args:
+            path: Cassette file; record mode overwrites it
+            mode: RECORD or REPLAY
+            timing: ORIGINAL_TIMING replays each response after its recorded
+                    duration, ZERO_LATENCY answers immediately
+        """
+        if mode not in (RECORD, REPLAY):
+            raise ValueError(f"Invalid cassette mode: {mode}")
+        if timing not in (ORIGINAL_TIMING, ZERO_LATENCY):
+            raise ValueError(f"Invalid cassette timing: {timing}")
+        self.path = path
+        self.mode = mode
+        self.timing = timing
+        self.recorded = 0
+        self.replayed = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._file = None
+        self._exact = defaultdict(deque)
+        self._by_url = defaultdict(deque)
+        self._last = {}
+
+        if mode == RECORD:
+            self._file = open(path, 'w', encoding='utf-8')
+        else:
+            self._load()
+
+    def _load(self):
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                interaction = json.loads(line)
+                method, url = interaction['method'], interaction['url']
+                self._exact[(method, url, interaction['body'])].append(interaction)
+                self._by_url[(method, url)].append(interaction)
+
+    def record(self, request, response, elapsed):
+        """Append one interaction; the response body must already be read"""
+        content, encoding = _encode_content(response.content)
+        interaction = {
+            'method': request.method,
+            'url': normalize_url(request.url),
+            'body': body_digest(request.body),
+            'status_code': response.status_code,
+            'reason': response.reason,
+            'headers': http_session.storable_headers(response.headers),
+            'content': content,
+            'encoding': encoding,
+            'elapsed': elapsed,
+        }
+        line = json.dumps(interaction, ensure_ascii=False)
+        with self._lock:
+            self._file.write(line + '\n')
+            self._file.flush()
+            self.recorded += 1
+
+    def play(self, request):
+        """
+        The recorded interaction answering request. The exact body is matched
+        first; multipart uploads (random boundaries) fall back to method and URL.
+
+        Raises:
+            CassetteMiss: The request was not recorded
+        """
+        method, url = request.method, normalize_url(request.url)
+        keys = [(method, url, body_digest(request.body)), (method, url)]
+        with self._lock:
+            for key, recordings in zip(keys, (self._exact, self._by_url)):
+                queue = recordings.get(key)
+                if queue:
+                    interaction = queue.popleft()
+                    self._last[key] = interaction
+                    break
+                if key in self._last:
+                    interaction = self._last[key]
+                    break
+            else:
+                self.misses += 1
+                raise CassetteMiss(f"{method} {url} is not in cassette {self.path}")
+            self.replayed += 1
+        return interaction
+
+    def close(self):
+        if self._file:
+            self._file.close()
+            self._file = None
+
+
+class CassetteAdapter(BaseAdapter):
+    """Transport adapter that records the traffic of a session to a Cassette, or replays it"""
+
+    def __init__(self, adapter, cassette):
+        super().__init__()
+        self.adapter = adapter
+        self.cassette = cassette
+
+    def send(self, request, **kwargs):
+        if self.cassette.mode == RECORD:
+            start = time.perf_counter()
+            response = self.adapter.send(request, **kwargs)
+            response.content  # read streamed bodies too, so they can be stored
+            self.cassette.record(request, response, time.perf_counter() - start)
+            return response
+
+        interaction = self.cassette.play(request)
+        if self.cassette.timing == ORIGINAL_TIMING:
+            time.sleep(interaction['elapsed'])
+        response = http_session.build_response(
+            request, interaction['status_code'], interaction['headers'],
+            _decode_content(interaction['content'], interaction['encoding']), interaction['reason'])
+        logger.debug(f"Replayed {request.method} {request.url}")
+        return response
+
+    def close(self):
+        self.adapter.close()
+
+
+def install_cassette(session, cassette):
+    """
+    Record or replay all traffic of a requests.Session. Install it before the
+    other transport features, so it sits next to the network and retries,
+    throttling and caches behave in replay as they did while recording.
+    """
+    for prefix, adapter in list(session.adapters.items()):
+        session.mount(prefix, CassetteAdapter(adapter, cassette))
+    return session
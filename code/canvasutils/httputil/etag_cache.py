@@ -0,0 +1,179 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from requests.adapters import BaseAdapter
+
+from . import http_session
+
+DEFAULT_CACHE_DIR = '.canvas_cache'
+
+def normalize_url(url):
+    """URL with the query parameters sorted, so the same params in any order match"""
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme, parts.netloc.lower(), parts.path, query, ''))
+
+def cache_key(url):
+    """Cache key of a GET request: hash of its normalized URL"""
+    return hashlib.sha256(normalize_url(url).encode('utf-8')).hexdigest()
+
+
+class ConditionalCache(object):
+    """
+    On-disk store of GET responses with their ETag / Last-Modified validators.
+
+    Each entry is a <key>.json metadata file (URL, status, headers) and a
+    <key>.body file. Entries are evicted least recently used first once there
+    are more than max_entries of them or their bodies exceed max_bytes.
+
+    The cache is keyed by URL and params only, so use one directory per
+    Canvas user (access token).
+    """
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_entries=2000, max_bytes=200 * 1024 * 1024):
+        self.directory = directory
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+        # key -> body size, least recently used first (by file modification time)
+        entries = []
+        for name in os.listdir(directory):
+            if name.endswith('.body'):
+                path = os.path.join(directory, name)
+                entries.append((os.path.getmtime(path), name[:-len('.body')], os.path.getsize(path)))
+        self._entries = OrderedDict((key, size) for _, key, size in sorted(entries))
+        self._total_bytes = sum(self._entries.values())
+
+    def _path(self, key, suffix):
+        return os.path.join(self.directory, f"{key}{suffix}")
+
+    def get(self, key):
+        """Return the stored entry (metadata dict with a 'content' body) or None"""
+        with self._lock:
+            if key not in self._entries:
+                return None
+            try:
+                with open(self._path(key, '.json'), 'r', encoding='utf-8') as f:
+                    entry = json.load(f)
+                with open(self._path(key, '.body'), 'rb') as f:
+                    entry['content'] = f.read()
+            except (OSError, ValueError):
+                self._remove(key)
+                return None
+            # Mark as most recently used, in memory and on disk
+            self._entries.move_to_end(key)
+            os.utime(self._path(key, '.body'))
+            return entry
+
+    def put(self, key, response):
+        """Store a 200 response that carries an ETag or Last-Modified validator"""
+        entry = {
+            'url': response.url,
+            'status_code': response.status_code,
+            'headers': http_session.storable_headers(response.headers),
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+        }
+        content = response.content
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            with open(self._path(key, '.body'), 'wb') as f:
+                f.write(content)
+            with open(self._path(key, '.json'), 'w', encoding='utf-8') as f:
+                json.dump(entry, f)
+            self._entries[key] = len(content)
+            self._total_bytes += len(content)
+            self.stores += 1
+            self._evict()
+
+    def record(self, hit):
+        """Count a conditional request answered from the cache (hit) or the network"""
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def _remove(self, key):
+        self._total_bytes -= self._entries.pop(key, 0)
+        for suffix in ('.json', '.body'):
+            try:
+                os.remove(self._path(key, suffix))
+            except FileNotFoundError:
+                pass
+
+    def _evict(self):
+        """Drop least recently used entries until the size limits hold"""
+        while self._entries and (len(self._entries) > self.max_entries or
+                                 self._total_bytes > self.max_bytes):
+            self._remove(next(iter(self._entries)))
+
+    def clear(self):
+        with self._lock:
+            for key in list(self._entries):
+                self._remove(key)
+
+
+class ConditionalCacheAdapter(BaseAdapter):
+    """
+    Transport adapter that sends GETs as conditional requests.
+
+    A stored validator is sent as If-None-Match / If-Modified-Since; a
+    "304 Not Modified" answer is then served from the local copy (marked with
+    response.from_cache = True), and new 200 responses with validators are stored.
+    """
+
+    def __init__(self, adapter, cache):
+        super().__init__()
+        self.adapter = adapter
+        self.cache = cache
+
+    def send(self, request, **kwargs):
+        if request.method != 'GET':
+            return self.adapter.send(request, **kwargs)
+
+        key = cache_key(request.url)
+        entry = self.cache.get(key)
+        if entry:
+            request = request.copy()
+            if entry.get('etag'):
+                request.headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                request.headers['If-Modified-Since'] = entry['last_modified']
+
+        response = self.adapter.send(request, **kwargs)
+
+        if response.status_code == 304 and entry:
+            self.cache.record(hit=True)
+            response.close()
+            cached = http_session.build_response(request, entry['status_code'],
+                                                 entry['headers'], entry['content'])
+            cached.from_cache = True
+            return cached
+
+        self.cache.record(hit=False)
+        if response.status_code == 200 and ('ETag' in response.headers or
+                                            'Last-Modified' in response.headers):
+            self.cache.put(key, response)
+        response.from_cache = False
+        return response
+
+    def close(self):
+        self.adapter.close()
+
+
+def install_conditional_cache(session, cache):
+    """Send the GETs of a requests.Session as conditional requests backed by cache"""
+    for prefix, adapter in list(session.adapters.items()):
+        session.mount(prefix, ConditionalCacheAdapter(adapter, cache))
+    return session
@@ -0,0 +1,163 @@
+DEFAULT_PAGE_SIZE = 20
+DEFAULT_SUBMISSIONS_PAGE_SIZE = 100
+
+PAGE_INFO = 'pageInfo { hasNextPage endCursor }'
+
+SUBMISSION_FIELDS = '_id userId submittedAt state score grade attempt late missing'
+
+COURSE_ASSIGNMENTS_QUERY = f'''
+query CourseAssignments($courseId: ID!, $first: Int, $after: String, $submissionsFirst: Int) {{
+  course(id: $courseId) {{
+    _id
+    assignmentsConnection(first: $first, after: $after) {{
+      {PAGE_INFO}
+      nodes {{
+        _id name dueAt pointsPossible published
+        submissionsConnection(first: $submissionsFirst) {{
+          {PAGE_INFO}
+          nodes {{ {SUBMISSION_FIELDS} }}
+        }}
+      }}
+    }}
+  }}
+}}
+'''
+
+ASSIGNMENT_SUBMISSIONS_QUERY = f'''
+query AssignmentSubmissions($assignmentId: ID!, $first: Int, $after: String) {{
+  assignment(id: $assignmentId) {{
+    _id
+    submissionsConnection(first: $first, after: $after) {{
+      {PAGE_INFO}
+      nodes {{ {SUBMISSION_FIELDS} }}
+    }}
+  }}
+}}
+'''
+
+COURSE_STUDENTS_QUERY = f'''
+query CourseStudents($courseId: ID!, $first: Int, $after: String) {{
+  course(id: $courseId) {{
+    _id
+    usersConnection(first: $first, after: $after, filter: {{enrollmentTypes: [StudentEnrollment]}}) {{
+      {PAGE_INFO}
+      nodes {{ _id name sortableName shortName }}
+    }}
+  }}
+}}
+'''
+
+class GraphQLError(Exception):
+    """A GraphQL response with errors, or without the requested object"""
+
+    def __init__(self, errors):
+        self.errors = errors
+        messages = '; '.join(error.get('message', str(error)) for error in errors)
+        super().__init__(f"GraphQL query failed: {messages}")
+
+
+def execute(run, query, variables):
+    """Run one query and return its data, raising GraphQLError on errors"""
+    result = run(query, variables)
+    if result.get('errors'):
+        raise GraphQLError(result['errors'])
+    return result.get('data') or {}
+
+def iter_connection(run, query, variables, path, page_size, after=None):
+    """
+    Yield every node of a cursor-paginated connection.
+
+    Args:
+        run: Function running a query: run(query, variables) -> response JSON,
+             e.g. canvasapi's canvas.graphql or CanvasManager.graphql
+        query: Query with $first and $after variables
+        variables: The other variables of the query
+        path: Keys leading from data to the connection, e.g. ('course', 'usersConnection')
+        after: Cursor to continue from (None: first page)
+    """
+    while True:
+        connection = execute(run, query, {**variables, 'first': page_size, 'after': after})
+        for key in path:
+            connection = connection.get(key) if connection else None
+        if connection is None:
+            raise GraphQLError([{'message': f"{'.'.join(path)} not found for {variables}"}])
+        yield from connection['nodes']
+        if not connection['pageInfo']['hasNextPage']:
+            return
+        after = connection['pageInfo']['endCursor']
+
+def to_rest_submission(node, assignment_id):
+    """GraphQL submission node as the REST submission dict"""
+    return {
+        'id': int(node['_id']),
+        'user_id': int(node['userId']) if node.get('userId') else None,
+        'assignment_id': assignment_id,
+        'submitted_at': node.get('submittedAt'),
+        'workflow_state': node.get('state'),
+        'score': node.get('score'),
+        'grade': node.get('grade'),
+        'attempt': node.get('attempt'),
+        'late': node.get('late'),
+        'missing': node.get('missing'),
+    }
+
+def to_rest_assignment(node, course_id):
+    """GraphQL assignment node as the REST assignment dict (without submissions)"""
+    return {
+        'id': int(node['_id']),
+        'course_id': course_id,
+        'name': node.get('name'),
+        'points_possible': node.get('pointsPossible'),
+        'due_at': node.get('dueAt'),
+        'published': node.get('published'),
+    }
+
+def to_rest_user(node):
+    """GraphQL user node as the REST user dict"""
+    return {
+        'id': int(node['_id']),
+        'name': node.get('name'),
+        'sortable_name': node.get('sortableName'),
+        'short_name': node.get('shortName'),
+    }
+
+def fetch_course_assignments(run, course_id, page_size=DEFAULT_PAGE_SIZE,
+                             submissions_page_size=DEFAULT_SUBMISSIONS_PAGE_SIZE):
+    """
+    Fetch the assignments of a course with the submissions of each one.
+
+    The first submissions_page_size submissions of every assignment come with
+    the assignment page; only assignments with more submissions than that
+    need follow-up queries.
+
+    Returns:
+        (assignments, submissions) with the fields these queries select: the assignment dicts of
+        GET /courses/:id/assignments, and {assignment id: submission dicts of
+        GET /courses/:id/assignments/:id/submissions}
+    """
+    course_id = int(course_id)
+    assignments = []
+    submissions = {}
+    nodes = iter_connection(run, COURSE_ASSIGNMENTS_QUERY,
+                            {'courseId': str(course_id), 'submissionsFirst': submissions_page_size},
+                            ('course', 'assignmentsConnection'), page_size)
+    for node in nodes:
+        assignment = to_rest_assignment(node, course_id)
+        assignments.append(assignment)
+
+        connection = node['submissionsConnection']
+        submission_nodes = list(connection['nodes'])
+        if connection['pageInfo']['hasNextPage']:
+            submission_nodes.extend(iter_connection(
+                run, ASSIGNMENT_SUBMISSIONS_QUERY, {'assignmentId': str(assignment['id'])},
+                ('assignment', 'submissionsConnection'), submissions_page_size,
+                after=connection['pageInfo']['endCursor']))
+        submissions[assignment['id']] = [to_rest_submission(s, assignment['id'])
+                                         for s in submission_nodes]
+    return assignments, submissions
+
+def fetch_course_students(run, course_id, page_size=DEFAULT_SUBMISSIONS_PAGE_SIZE):
+    """Fetch the students of a course as the user dicts of GET /courses/:id/users"""
+    nodes = iter_connection(run, COURSE_STUDENTS_QUERY, {'courseId': str(course_id)},
+                            ('course', 'usersConnection'), page_size)
+    return [to_rest_user(node) for node in nodes]
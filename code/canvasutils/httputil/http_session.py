@@ -0,0 +1,83 @@
+from http import HTTPStatus
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+# Number of per-host connection pools kept alive by one session
+DEFAULT_POOL_CONNECTIONS = 10
+# Number of keep-alive connections kept in each host pool
+DEFAULT_POOL_MAXSIZE = 10
+
+def create_session(headers=None, pool_connections=DEFAULT_POOL_CONNECTIONS,
+                   pool_maxsize=DEFAULT_POOL_MAXSIZE, pool_block=False):
+    """
+    Create a requests.Session with connection pooling and keep-alive.
+
+    A session reuses the TCP/TLS connection between requests to the same host,
+    so walking hundreds of pages pays for the handshake only once per connection.
+
+    Args:
+        headers: Default headers sent with every request (e.g. Authorization)
+        pool_connections: Number of host pools to keep (one per Canvas host)
+        pool_maxsize: Maximum number of connections kept per host
+        pool_block: Wait for a free connection instead of opening an extra one
+
+    Returns:
+        A configured requests.Session; call close() (or use it as a context
+        manager) to release the pooled connections.
+    """
+    session = requests.Session()
+    if headers:
+        session.headers.update(headers)
+
+    adapter = HTTPAdapter(pool_connections=pool_connections,
+                          pool_maxsize=pool_maxsize,
+                          pool_block=pool_block)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+def get_canvas_session(canvas):
+    """
+    Return the requests.Session a canvasapi Canvas object sends its requests with,
+    so transport features (throttling, caching, ...) can be installed on it.
+    """
+    requester = getattr(canvas, "_Canvas__requester")
+    return requester._session
+
+# Describe the bytes on the wire, not the decoded content that gets stored
+TRANSPORT_HEADERS = frozenset({'content-encoding', 'content-length', 'transfer-encoding', 'connection'})
+# Session cookies (Canvas _csrf_token, canvas_session) and echoed credentials
+CREDENTIAL_HEADERS = frozenset({'set-cookie', 'cookie', 'authorization', 'proxy-authorization'})
+
+def storable_headers(headers):
+    """
+    Headers of a response worth storing next to its decoded content: neither
+    transport headers nor credentials, which must never reach a cache or
+    cassette file
+    """
+    return {k: v for k, v in headers.items()
+            if k.lower() not in TRANSPORT_HEADERS and k.lower() not in CREDENTIAL_HEADERS}
+
+def build_response(request, status_code, headers, content, reason=None):
+    """
+    Build a requests.Response for request from stored parts, so transport
+    adapters can answer from a cache or a recording without the network.
+    """
+    response = requests.Response()
+    response.status_code = status_code
+    if reason is None:
+        try:
+            reason = HTTPStatus(status_code).phrase
+        except ValueError:
+            reason = ''
+    response.reason = reason
+    response.headers = CaseInsensitiveDict(headers)
+    response._content = content
+    response._content_consumed = True  # iter_content() replays content, even with stream=True
+    response.encoding = get_encoding_from_headers(response.headers)
+    response.url = request.url
+    response.request = request
+    return response
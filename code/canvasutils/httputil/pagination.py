@@ -0,0 +1,115 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+
+from requests.models import PreparedRequest
+
+# Default number of pages fetched at the same time
+DEFAULT_MAX_WORKERS = 8
+
+class PaginationError(Exception):
+    """
+    A page of a listing could not be fetched, even after retries.
+
+    Attributes:
+        url: URL of the page that failed; resume the listing from there
+        page: Number of the page that failed, when known
+        results: Items of the pages fetched before the failure
+    """
+
+    def __init__(self, url, results, cause, page=None):
+        super().__init__(f"Error fetching {url}: {cause}")
+        self.url = url
+        self.page = page
+        self.results = results
+
+def get_page_number(url):
+    """
+    Return the numeric page of a Link header URL.
+
+    Canvas uses numbered pages (page=3) for most listings but opaque bookmarks
+    (page=bookmark:WzEyMzRd) for some, which cannot be computed ahead of time.
+
+    Returns:
+        The page number as int, or None if the page is missing or a bookmark
+    """
+    for key, value in parse_qsl(urlparse(url).query):
+        if key == 'page':
+            return int(value) if value.isdigit() else None
+    return None
+
+def set_page_number(url, page):
+    """Return the URL with its page query parameter replaced by page"""
+    parts = urlparse(url)
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k != 'page']
+    query.append(('page', str(page)))
+    return urlunparse(parts._replace(query=urlencode(query)))
+
+def page_url(url, params=None):
+    """
+    Return url with params encoded into its query string, as requests sends it,
+    so a page can be requested again (e.g. resumed) without its params
+    """
+    if not params:
+        return url
+    request = PreparedRequest()
+    request.prepare_url(url, params)
+    return request.url
+
+def remaining_page_urls(links):
+    """
+    Compute the URLs of every page after the first one from its Link header.
+
+    Args:
+        links: response.links of the first page
+
+    Returns:
+        List of page URLs in order (empty if there is only one page), or None
+        if the pages are not numbered and must be walked with rel="next"
+    """
+    if 'next' not in links:
+        return []
+    if 'last' not in links:
+        return None
+
+    next_url = links['next']['url']
+    next_page = get_page_number(next_url)
+    last_page = get_page_number(links['last']['url'])
+    if next_page is None or last_page is None:
+        return None
+
+    return [set_page_number(next_url, page) for page in range(next_page, last_page + 1)]
+
+def fetch_pages(fetch, urls, max_workers=DEFAULT_MAX_WORKERS):
+    """
+    Fetch page URLs concurrently with a bounded worker pool.
+
+    At most max_workers pages are fetched at a time and at most twice that
+    many are held waiting for the consumer, so memory stays bounded however
+    long the listing is.
+
+    Args:
+        fetch: Function taking a URL and returning that page's items
+        urls: Page URLs in page order
+        max_workers: Maximum number of pages in flight at once
+
+    Yields:
+        Each page's items, in the same order as urls. If a page fails its
+        exception is raised here and the pages not yet started are cancelled.
+    """
+    if not urls:
+        return
+    window = 2 * max_workers
+    pending = deque()
+    executor = ThreadPoolExecutor(max_workers=min(max_workers, len(urls)))
+    try:
+        for url in urls:
+            if len(pending) >= window:
+                yield pending.popleft().result()
+            pending.append(executor.submit(fetch, url))
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
@@ -0,0 +1,110 @@
+import json
+import re
+import threading
+from urllib.parse import urlsplit
+
+# Fields Canvas only returns when asked with include[]=<name>; every other
+# field of a course, assignment, submission or user comes back by default
+INCLUDE_FIELDS = {
+    # courses
+    'term': 'term',
+    'total_students': 'total_students',
+    'teachers': 'teachers',
+    'syllabus_body': 'syllabus_body',
+    'public_description': 'public_description',
+    'course_image': 'course_image',
+    'sections': 'sections',
+    'course_progress': 'course_progress',
+    'needs_grading_count': 'needs_grading_count',
+    'total_scores': 'total_scores',
+    'permissions': 'permissions',
+    'is_favorite': 'favorites',
+    # assignments
+    'submission': 'submission',
+    'all_dates': 'all_dates',
+    'overrides': 'overrides',
+    # submissions
+    'submission_comments': 'submission_comments',
+    'rubric_assessment': 'rubric_assessment',
+    'user': 'user',
+    'assignment': 'assignment',
+    # users
+    'enrollments': 'enrollments',
+    'email': 'email',
+    'avatar_url': 'avatar_url',
+}
+
+def field_tree(fields):
+    """
+    Nested dict of the fields to keep; 'term.name' keeps only the name of term.
+    A field mapped to None is kept whole.
+    """
+    tree = {}
+    for field in fields:
+        node = tree
+        *parents, leaf = field.split('.')
+        for name in parents:
+            if node.get(name, {}) is None:
+                break  # the parent is already kept whole
+            node = node.setdefault(name, {})
+        else:
+            node[leaf] = None
+    return tree
+
+def includes_for(fields):
+    """The include[] values needed to get the given fields, nothing more"""
+    return sorted({INCLUDE_FIELDS[f.split('.')[0]] for f in fields if f.split('.')[0] in INCLUDE_FIELDS})
+
+def with_includes(params, fields):
+    """Copy of params whose include[] asks for exactly what the fields need"""
+    params = {key: value for key, value in (params or {}).items() if key not in ('include', 'include[]')}
+    includes = includes_for(fields)
+    if includes:
+        params['include[]'] = includes
+    return params
+
+def project(item, tree):
+    """Prune a record (or a list of records) to the fields of a field tree"""
+    if isinstance(item, list):
+        return [project(element, tree) for element in item]
+    if not isinstance(item, dict):
+        return item
+    return {name: item[name] if subtree is None else project(item[name], subtree)
+            for name, subtree in tree.items() if name in item}
+
+def endpoint_name(url):
+    """Endpoint of a URL with numeric ids folded: /api/v1/courses/1/users -> courses/:id/users"""
+    path = re.sub(r'^/api/v1/', '', urlsplit(url).path.rstrip('/'))
+    return re.sub(r'(?<=/)\d+(?=/|$)', ':id', path)
+
+
+class ProjectionStats(object):
+    """Bytes received and bytes kept after projection, per endpoint"""
+
+    def __init__(self):
+        self.endpoints = {}
+        self._lock = threading.Lock()
+
+    def record(self, url, received, kept):
+        with self._lock:
+            stats = self.endpoints.setdefault(endpoint_name(url), {'responses': 0, 'received': 0, 'kept': 0})
+            stats['responses'] += 1
+            stats['received'] += received
+            stats['kept'] += kept
+
+    def report(self):
+        """Print bytes received, kept and saved for every endpoint"""
+        print(f"{'Endpoint':<40} {'Pages':>6} {'Received':>12} {'Kept':>12} {'Saved':>7}")
+        for endpoint, stats in sorted(self.endpoints.items()):
+            saved = 1 - stats['kept'] / stats['received'] if stats['received'] else 0
+            print(f"{endpoint:<40} {stats['responses']:>6} {stats['received']:>12,} "
+                  f"{stats['kept']:>12,} {saved:>7.1%}")
+
+
+def project_response(response, tree, stats=None):
+    """Decode a JSON response and prune it to a field tree, recording the bytes saved"""
+    items = project(response.json(), tree)
+    if stats is not None:
+        kept = len(json.dumps(items, separators=(',', ':')).encode('utf-8'))
+        stats.record(response.url, len(response.content), kept)
+    return items
@@ -0,0 +1,227 @@
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import BaseAdapter
+
+from . import http_session
+from .etag_cache import normalize_url
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_FILE = '.canvas_cache.sqlite'
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+
+# (regex searched in the URL path, seconds a response stays fresh); first match wins
+DEFAULT_TTL_POLICIES = (
+    (r'/submissions', 5 * MINUTE),
+    (r'/(users|enrollments|students|sections)\b', HOUR),
+    (r'/(assignments|assignment_groups|quizzes|folders|files|pages|modules)\b', HOUR),
+    (r'/courses(/\d+)?$', 6 * HOUR),
+)
+DEFAULT_TTL = 15 * MINUTE
+
+def request_key(request):
+    """
+    Cache key of a GET: its normalized URL, prefixed with a hash of its
+    Authorization header, so users (tokens) sharing a cache file never get
+    each other's responses
+    """
+    authorization = request.headers.get('Authorization')
+    user = (hashlib.sha256(authorization.encode('utf-8')).hexdigest()[:16]
+            if authorization else 'anonymous')
+    return f"{user} {normalize_url(request.url)}"
+
+
+class ResponseCache(object):
+    """
+    Opt-in persistent cache of Canvas GET responses in a SQLite file.
+
+    Each endpoint pattern has its own time to live (courses: hours,
+    submissions: minutes). Within its TTL a response is served without any
+    request. For stale_while_revalidate seconds after that it is still
+    served, while a background request refreshes it. If Canvas cannot be
+    reached, the stored copy is served whatever its age.
+
+    refresh=True ignores stored responses (but still stores new ones), like a
+    --refresh command-line option.
+
+    Responses are keyed by token as well as URL (request_key), so one cache
+    file can be shared by several Canvas users.
+
+    Every cacheable GET is counted once: hits (fresh), stale_hits, offline_hits
+    (stored copy served because Canvas could not be reached) or misses
+    (answered by Canvas, or failed with nothing stored).
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_FILE, ttl_policies=DEFAULT_TTL_POLICIES,
+                 default_ttl=DEFAULT_TTL, stale_while_revalidate=HOUR, refresh=False):
+        """
+        Args:
+            path: SQLite database file
+            ttl_policies: (regex, ttl seconds) pairs matched against the URL path
+            default_ttl: TTL of endpoints no policy matches (0: do not cache)
+            stale_while_revalidate: Seconds past the TTL a stale copy is still served
+            refresh: Always fetch from Canvas instead of reading the cache
+        """
+        self.path = path
+        self.ttl_policies = [(re.compile(pattern), ttl) for pattern, ttl in ttl_policies]
+        self.default_ttl = default_ttl
+        self.stale_while_revalidate = stale_while_revalidate
+        self.refresh = refresh
+        self.hits = 0
+        self.stale_hits = 0
+        self.offline_hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._revalidating = set()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute('''CREATE TABLE IF NOT EXISTS responses (
+                                key TEXT PRIMARY KEY,
+                                status_code INTEGER NOT NULL,
+                                headers TEXT NOT NULL,
+                                content BLOB NOT NULL,
+                                stored_at REAL NOT NULL)''')
+        self._db.commit()
+
+    def ttl_for(self, url):
+        """Seconds a response of this URL stays fresh"""
+        path = urlsplit(url).path.rstrip('/')
+        for pattern, ttl in self.ttl_policies:
+            if pattern.search(path):
+                return ttl
+        return self.default_ttl
+
+    def lookup(self, key):
+        """Return (status_code, headers, content, age in seconds) or None"""
+        with self._lock:
+            row = self._db.execute('SELECT status_code, headers, content, stored_at FROM responses '
+                                   'WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            return None
+        status_code, headers, content, stored_at = row
+        return status_code, json.loads(headers), content, time.time() - stored_at
+
+    def store(self, key, response):
+        headers = json.dumps(http_session.storable_headers(response.headers))
+        with self._lock:
+            self._db.execute('INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)',
+                             (key, response.status_code, headers, response.content, time.time()))
+            self._db.commit()
+
+    def hit_rate(self):
+        """Share of cacheable GETs answered from the cache (fresh, stale or offline)"""
+        with self._lock:
+            hits = self.hits + self.stale_hits + self.offline_hits
+            total = hits + self.misses
+        return hits / total if total else 0.0
+
+    def count(self, name):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def start_revalidation(self, key):
+        """True if the caller should refresh key (no other refresh is running)"""
+        with self._lock:
+            if key in self._revalidating:
+                return False
+            self._revalidating.add(key)
+            return True
+
+    def end_revalidation(self, key):
+        with self._lock:
+            self._revalidating.discard(key)
+
+    def purge(self, older_than=None):
+        """Delete every stored response, or those stored more than older_than seconds ago"""
+        with self._lock:
+            if older_than is None:
+                self._db.execute('DELETE FROM responses')
+            else:
+                self._db.execute('DELETE FROM responses WHERE stored_at < ?',
+                                 (time.time() - older_than,))
+            self._db.commit()
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+class ResponseCacheAdapter(BaseAdapter):
+    """Transport adapter that answers GETs from a ResponseCache when they are fresh enough"""
+
+    def __init__(self, adapter, cache):
+        super().__init__()
+        self.adapter = adapter
+        self.cache = cache
+
+    def send(self, request, **kwargs):
+        ttl = self.cache.ttl_for(request.url) if request.method == 'GET' else 0
+        if not ttl:
+            return self.adapter.send(request, **kwargs)
+
+        key = request_key(request)
+        stored = None if self.cache.refresh else self.cache.lookup(key)
+        if stored:
+            status_code, headers, content, age = stored
+            if age < ttl:
+                self.cache.count('hits')
+                return self._cached(request, stored)
+            if age < ttl + self.cache.stale_while_revalidate:
+                self.cache.count('stale_hits')
+                if self.cache.start_revalidation(key):
+                    threading.Thread(target=self._revalidate, args=(request, key, kwargs),
+                                     daemon=True).start()
+                return self._cached(request, stored)
+
+        try:
+            response = self.adapter.send(request, **kwargs)
+        except requests.exceptions.ConnectionError as e:
+            if not stored:
+                self.cache.count('misses')
+                raise
+            self.cache.count('offline_hits')
+            logger.warning(f"Canvas unreachable, serving cached {request.url}: {e}")
+            return self._cached(request, stored)
+
+        self.cache.count('misses')
+        if response.status_code == 200:
+            self.cache.store(key, response)
+        response.from_cache = False
+        return response
+
+    def _cached(self, request, stored):
+        status_code, headers, content, _ = stored
+        response = http_session.build_response(request, status_code, headers, content)
+        response.from_cache = True
+        return response
+
+    def _revalidate(self, request, key, kwargs):
+        """Refresh one stale entry in the background"""
+        try:
+            response = self.adapter.send(request, **{**kwargs, 'stream': False})
+            if response.status_code == 200:
+                self.cache.store(key, response)
+        except Exception as e:
+            logger.warning(f"Background refresh of {request.url} failed: {e}")
+        finally:
+            self.cache.end_revalidation(key)
+
+    def close(self):
+        self.adapter.close()
+
+
+def install_response_cache(session, cache):
+    """Answer the GETs of a requests.Session from cache while they are fresh"""
+    for prefix, adapter in list(session.adapters.items()):
+        session.mount(prefix, ResponseCacheAdapter(adapter, cache))
+    return session
@@ -0,0 +1,158 @@
+import email.utils
+import logging
+import random
+import time
+
+import requests
+from requests.adapters import BaseAdapter
+
+logger = logging.getLogger(__name__)
+
+# Responses worth another try: rate limiting and transient server errors
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+# Only methods that are safe to send twice are retried
+RETRY_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'})
+# Connection resets, timeouts and bodies cut off mid-transfer
+RETRY_EXCEPTIONS = (requests.exceptions.ConnectionError,
+                    requests.exceptions.Timeout,
+                    requests.exceptions.ChunkedEncodingError)
+
+class RetryPolicy(object):
+    """
+    Retry policy with exponential backoff, full jitter, Retry-After support
+    and a deadline per request.
+
+    The n-th retry waits a random time between 0 and
+    min(backoff_max, backoff_base * 2**n) seconds, unless the server asked for
+    a specific delay with Retry-After. A request is given up when it runs out
+    of attempts or when the next try would start after its deadline.
+    """
+
+    def __init__(self, max_attempts=5, backoff_base=0.5, backoff_max=30.0, deadline=120.0,
+                 statuses=RETRY_STATUSES, methods=RETRY_METHODS):
+        """
+        Args:
+            max_attempts: Total tries per request, including the first one
+            backoff_base: Backoff ceiling of the first retry, in seconds
+            backoff_max: Largest backoff ceiling, in seconds
+            deadline: Seconds one request may take over all its tries (None: no limit)
+            statuses: HTTP status codes that are retried
+            methods: HTTP methods that are retried
+        """
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.deadline = deadline
+        self.statuses = statuses
+        self.methods = methods
+        self.retries = 0
+
+    def backoff(self, retry):
+        """Jittered delay before the given retry (0 for the first retry)"""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** retry))
+
+    def is_retryable(self, method, response=None, error=None):
+        """True if the failed try (a response or an exception) should be repeated"""
+        if method.upper() not in self.methods:
+            return False
+        if error is not None:
+            return isinstance(error, RETRY_EXCEPTIONS)
+        return response.status_code in self.statuses
+
+    def call(self, method, url, send, timeout=None):
+        """
+        Run send(timeout) until it succeeds or the policy gives up.
+
+        Args:
+            method: HTTP method of the request
+            url: Request URL (for logging)
+            send: Function doing one try; takes the timeout for that try
+            timeout: requests timeout of the request, clamped to the deadline
+
+        Returns:
+            The first non-retryable response, or the last response if the
+            policy gave up. The last exception is raised if every try failed.
+        """
+        give_up_at = time.monotonic() + self.deadline if self.deadline else None
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                response, error = send(_clamp_timeout(timeout, give_up_at)), None
+            except Exception as e:
+                if not self.is_retryable(method, error=e):
+                    raise
+                response, error = None, e
+            else:
+                if not self.is_retryable(method, response=response):
+                    return response
+
+            delay = retry_after(response) if response is not None else None
+            if delay is None:
+                delay = self.backoff(attempt - 1)
+
+            out_of_time = give_up_at is not None and time.monotonic() + delay >= give_up_at
+            if attempt >= self.max_attempts or out_of_time:
+                if error is not None:
+                    raise error
+                return response
+
+            reason = error if error is not None else f"HTTP {response.status_code}"
+            logger.warning(f"Retrying {method} {url} in {delay:.2f}s (attempt {attempt}): {reason}")
+            if response is not None:
+                response.close()
+            self.retries += 1
+            time.sleep(delay)
+
+
+def retry_after(response):
+    """Seconds requested by a Retry-After header (delta-seconds or HTTP date), or None"""
+    value = response.headers.get('Retry-After')
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - time.time())
+
+def _clamp_timeout(timeout, give_up_at):
+    """Shorten a requests timeout (number, (connect, read) tuple or None) to the deadline"""
+    if give_up_at is None:
+        return timeout
+    remaining = max(0.001, give_up_at - time.monotonic())
+    if isinstance(timeout, tuple):
+        return tuple(remaining if t is None else min(t, remaining) for t in timeout)
+    return remaining if timeout is None else min(timeout, remaining)
+
+
+class RetryAdapter(BaseAdapter):
+    """Transport adapter that repeats failed requests according to a RetryPolicy"""
+
+    def __init__(self, adapter, policy):
+        super().__init__()
+        self.adapter = adapter
+        self.policy = policy
+
+    def send(self, request, **kwargs):
+        def send_once(timeout):
+            response = self.adapter.send(request, **{**kwargs, 'timeout': timeout})
+            if not kwargs.get('stream'):
+                response.content  # read the body here so a cut-off transfer is retried too
+            return response
+
+        return self.policy.call(request.method, request.url, send_once, kwargs.get('timeout'))
+
+    def close(self):
+        self.adapter.close()
+
+
+def install_retry(session, policy):
+    """Repeat failed requests of a requests.Session according to policy"""
+    for prefix, adapter in list(session.adapters.items()):
+        session.mount(prefix, RetryAdapter(adapter, policy))
+    return session
@@ -0,0 +1,104 @@
+import threading
+
+from requests.adapters import BaseAdapter
+
+from . import http_session
+from .etag_cache import normalize_url
+
+class _Call(object):
+    """One in-flight request and the callers waiting for it"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight(object):
+    """
+    Coalesces identical concurrent GETs into one HTTP call.
+
+    While a GET is in flight, every other thread asking for the same URL
+    (same params in any order, same credentials) waits for it and gets a copy
+    of its response instead of sending its own request.
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.executions = 0
+        self.deduplicated = 0
+        self._lock = threading.Lock()
+        self._in_flight = {}
+
+    def do(self, key, fetch):
+        """
+        Run fetch() once for all concurrent callers with the same key.
+
+        Returns:
+            (result, shared): shared is True for callers that waited on
+            another caller's fetch. Its exception is raised in every caller.
+        """
+        with self._lock:
+            self.calls += 1
+            call = self._in_flight.get(key)
+            leader = call is None
+            if leader:
+                call = self._in_flight[key] = _Call()
+                self.executions += 1
+            else:
+                self.deduplicated += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fetch()
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+            call.done.set()
+        return call.result, False
+
+
+class SingleFlightAdapter(BaseAdapter):
+    """Transport adapter that shares one response between identical concurrent GETs"""
+
+    def __init__(self, adapter, group):
+        super().__init__()
+        self.adapter = adapter
+        self.group = group
+
+    def send(self, request, **kwargs):
+        if request.method != 'GET' or kwargs.get('stream'):
+            return self.adapter.send(request, **kwargs)
+
+        key = (normalize_url(request.url), request.headers.get('Authorization'))
+
+        def fetch():
+            response = self.adapter.send(request, **kwargs)
+            response.content  # read the body once so every caller can have it
+            return response
+
+        response, shared = self.group.do(key, fetch)
+        if not shared:
+            return response
+        copy = http_session.build_response(request, response.status_code,
+                                           http_session.storable_headers(response.headers),
+                                           response.content, response.reason)
+        copy.from_cache = getattr(response, 'from_cache', False)
+        return copy
+
+    def close(self):
+        self.adapter.close()
+
+
+def install_single_flight(session, group):
+    """Coalesce identical concurrent GETs of a requests.Session through group"""
+    for prefix, adapter in list(session.adapters.items()):
+        session.mount(prefix, SingleFlightAdapter(adapter, group))
+    return session
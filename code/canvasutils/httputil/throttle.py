@@ -0,0 +1,176 @@
+import threading
+import time
+
+from requests.adapters import BaseAdapter
+
+# Canvas rate limiting is a leaky bucket per access token:
+# every response reports what is left (X-Rate-Limit-Remaining) and what the
+# request cost (X-Request-Cost). An empty bucket answers
+# "403 Forbidden (Rate Limit Exceeded)".
+CANVAS_BUCKET_SIZE = 700.0
+
+class RateLimitThrottle(object):
+    """
+    Adaptive throttle shared by every client that uses the same access token.
+
+    Concurrency is full while the bucket is above high_water, shrinks linearly
+    as it drains towards reserve, and drops to one request at a time (spaced by
+    the estimated refill time) below reserve. Requests that still hit the rate
+    limit are put back in the queue instead of failing.
+    """
+
+    def __init__(self, max_concurrency=8, high_water=300.0, reserve=50.0,
+                 refill_rate=10.0, max_requeues=10, poll_interval=0.25):
+        """
+        Args:
+            max_concurrency: Requests in flight while the bucket is healthy
+            high_water: Remaining units above which full concurrency is allowed
+            reserve: Remaining units below which requests are serialized
+            refill_rate: Estimated units per second the bucket refills
+            max_requeues: Times one request is re-queued after a rate-limit response
+            poll_interval: Seconds between re-checks of a drained bucket
+        """
+        self.max_concurrency = max_concurrency
+        self.high_water = high_water
+        self.reserve = reserve
+        self.refill_rate = refill_rate
+        self.max_requeues = max_requeues
+        self.poll_interval = poll_interval
+
+        self.remaining = None  # unknown until the first response
+        self.requests = 0
+        self.total_cost = 0.0
+        self.rate_limited = 0
+
+        self._updated_at = time.monotonic()
+        self._resume_at = 0.0
+        self._in_flight = 0
+        self._condition = threading.Condition()
+
+    def estimated_remaining(self):
+        """Last reported bucket level plus the estimated refill since then"""
+        if self.remaining is None:
+            return None
+        refilled = (time.monotonic() - self._updated_at) * self.refill_rate
+        return min(CANVAS_BUCKET_SIZE, self.remaining + refilled)
+
+    def allowed_concurrency(self):
+        """Number of requests allowed in flight for the current bucket level"""
+        remaining = self.estimated_remaining()
+        if remaining is None or remaining >= self.high_water:
+            return self.max_concurrency
+        if remaining <= self.reserve:
+            return 1
+        fraction = (remaining - self.reserve) / (self.high_water - self.reserve)
+        return max(1, round(self.max_concurrency * fraction))
+
+    def _delay(self):
+        """Seconds to wait before the next request may start"""
+        delay = self._resume_at - time.monotonic()
+        remaining = self.estimated_remaining()
+        if remaining is not None and remaining < self.reserve:
+            delay = max(delay, (self.reserve - remaining) / self.refill_rate)
+        return delay
+
+    def acquire(self):
+        """Block until a request may be sent"""
+        with self._condition:
+            while True:
+                delay = self._delay()
+                if delay <= 0 and self._in_flight < self.allowed_concurrency():
+                    self._in_flight += 1
+                    return
+                self._condition.wait(timeout=delay if delay > 0 else self.poll_interval)
+
+    def release(self, response=None):
+        """
+        Record a finished request and update the bucket from its headers.
+
+        Returns:
+            True if the response was a rate-limit rejection and should be re-sent
+        """
+        with self._condition:
+            self._in_flight -= 1
+            limited = False
+            if response is not None:
+                self.requests += 1
+                self.total_cost += _header_float(response, 'X-Request-Cost') or 0.0
+
+                remaining = _header_float(response, 'X-Rate-Limit-Remaining')
+                if remaining is not None:
+                    self.remaining = remaining
+                    self._updated_at = time.monotonic()
+
+                if is_rate_limited(response):
+                    limited = True
+                    self.rate_limited += 1
+                    self.remaining = 0.0
+                    self._updated_at = time.monotonic()
+                    retry_after = _header_float(response, 'Retry-After')
+                    if retry_after:
+                        self._resume_at = max(self._resume_at, time.monotonic() + retry_after)
+            self._condition.notify_all()
+        return limited
+
+
+def is_rate_limited(response):
+    """True for Canvas "403 Forbidden (Rate Limit Exceeded)" and HTTP 429 responses"""
+    if response.status_code == 429:
+        return True
+    return response.status_code == 403 and b'Rate Limit Exceeded' in response.content
+
+def _header_float(response, name):
+    try:
+        return float(response.headers[name])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+class ThrottledAdapter(BaseAdapter):
+    """Transport adapter that sends every request through a RateLimitThrottle"""
+
+    def __init__(self, adapter, throttle):
+        super().__init__()
+        self.adapter = adapter
+        self.throttle = throttle
+
+    def send(self, request, **kwargs):
+        for _ in range(self.throttle.max_requeues + 1):
+            self.throttle.acquire()
+            try:
+                response = self.adapter.send(request, **kwargs)
+            except Exception:
+                self.throttle.release()
+                raise
+            if not self.throttle.release(response):
+                return response
+            # Rate limited: back in the queue once the bucket has refilled
+        return response
+
+    def close(self):
+        self.adapter.close()
+
+
+def install_throttle(session, throttle):
+    """
+    Route every request of a requests.Session through throttle.
+
+    Pass the same throttle to every session that uses the same access token
+    (CanvasManager, CanvasCourseMapper, canvasapi's Canvas) so they share one
+    view of the bucket.
+    """
+    for prefix, adapter in list(session.adapters.items()):
+        session.mount(prefix, ThrottledAdapter(adapter, throttle))
+    return session
+
+
+_shared_throttle = None
+_shared_lock = threading.Lock()
+
+def get_shared_throttle():
+    """Return the process-wide throttle, creating it on first use"""
+    global _shared_throttle
+    with _shared_lock:
+        if _shared_throttle is None:
+            _shared_throttle = RateLimitThrottle()
+        return _shared_throttle
@@ -0,0 +1,140 @@
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+class CourseIndex(object):
+    """
+    Secondary indexes over a list of course dicts, built on demand.
+
+    Every index key is a function course -> value (None: not indexed), e.g.
+    'course_code' or 'year'. The index of a key, or of a combination of keys
+    such as ('year', 'semester'), is built on its first lookup; after that
+    add() and remove() keep every built index up to date.
+
+    find() answers a query on several keys from one combined index if it was
+    built, otherwise by intersecting the single-key indexes, smallest first.
+    Results are in the order the courses were added.
+
+    Example:
+        index = CourseIndex(courses, {'code': lambda c: c.get('course_code')})
+        index.add_key('state', lambda c: c.get('workflow_state'))
+        index.find(code='CSC-101-001', state='available')
+    """
+
+    def __init__(self, courses: Iterable[Dict[Any, Any]] = (),
+                 keys: Optional[Dict[str, Any]] = None):
+        # Courses by id() in insertion order, so an index bucket can be a dict too
+        self._courses: Dict[int, Dict[Any, Any]] = {id(course): course for course in courses}
+        self._keys: Dict[str, Callable] = {}
+        self._normalizers: Dict[str, Callable] = {}
+        # key name or tuple of key names -> {value: {id(course): course}}
+        self._indexes: Dict[Any, Dict[Any, Dict[int, Dict[Any, Any]]]] = {}
+        for name, key in (keys or {}).items():
+            # A key is a function, or a (function, normalize) pair
+            if isinstance(key, tuple):
+                self.add_key(name, *key)
+            else:
+                self.add_key(name, key)
+
+    def add_key(self, name: str, key: Callable, normalize: Optional[Callable] = None):
+        """
+        Register an index key.
+
+        Args:
+            name: Name used in find() and build()
+            key: Function course -> value to index by (None: course not indexed)
+            normalize: Optional function applied to both the indexed values and
+                       the queried ones (e.g. str.lower for case-insensitive keys)
+        """
+        if normalize:
+            self._keys[name] = lambda course: _normalized(key(course), normalize)
+            self._normalizers[name] = normalize
+        else:
+            self._keys[name] = key
+        # A redefined key invalidates every index that uses it
+        for names in [n for n in self._indexes if name in _names(n)]:
+            del self._indexes[names]
+
+    def keys(self) -> List[str]:
+        return list(self._keys)
+
+    def build(self, *names: str):
+        """Build the index of one key, or the combined index of several, if not built yet"""
+        index_name = names[0] if len(names) == 1 else tuple(names)
+        if index_name in self._indexes:
+            return self._indexes[index_name]
+        for name in names:
+            if name not in self._keys:
+                raise KeyError(f"Unknown index key: {name}")
+        index = {}
+        self._indexes[index_name] = index
+        for course in self._courses.values():
+            self._insert(index_name, index, course)
+        return index
+
+    def _value(self, index_name, course):
+        if isinstance(index_name, tuple):
+            values = tuple(self._keys[name](course) for name in index_name)
+            return None if None in values else values
+        return self._keys[index_name](course)
+
+    def _insert(self, index_name, index, course):
+        value = self._value(index_name, course)
+        if value is not None:
+            index.setdefault(value, {})[id(course)] = course
+
+    def add(self, course: Dict[Any, Any]):
+        """Add a course to every built index"""
+        self._courses[id(course)] = course
+        for index_name, index in self._indexes.items():
+            self._insert(index_name, index, course)
+
+    def remove(self, course: Dict[Any, Any]):
+        """Remove a course (the same object that was added) from every built index"""
+        if self._courses.pop(id(course), None) is None:
+            return
+        for index_name, index in self._indexes.items():
+            value = self._value(index_name, course)
+            bucket = index.get(value)
+            if bucket is not None:
+                bucket.pop(id(course), None)
+                if not bucket:
+                    del index[value]
+
+    def find(self, **criteria) -> List[Dict[Any, Any]]:
+        """
+        Courses matching every key=value criterion, e.g. find(year='2025', semester='Fall').
+        No criteria returns every course.
+        """
+        if not criteria:
+            return list(self._courses.values())
+        criteria = {name: _normalized(value, self._normalizers.get(name))
+                    for name, value in criteria.items()}
+
+        names = tuple(criteria)
+        combined = next((n for n in self._indexes
+                         if isinstance(n, tuple) and sorted(n) == sorted(names)), None)
+        if combined:
+            bucket = self._indexes[combined].get(tuple(criteria[name] for name in combined), {})
+            return list(bucket.values())
+
+        buckets = sorted((self.build(name).get(value, {}) for name, value in criteria.items()), key=len)
+        smallest, others = buckets[0], buckets[1:]
+        return [course for key, course in smallest.items() if all(key in other for other in others)]
+
+    def first(self, **criteria) -> Optional[Dict[Any, Any]]:
+        """The first course matching the criteria, or None"""
+        found = self.find(**criteria)
+        return found[0] if found else None
+
+    def values(self, name: str) -> List[Any]:
+        """Distinct values of one key"""
+        return list(self.build(name))
+
+    def __len__(self):
+        return len(self._courses)
+
+
+def _names(index_name):
+    return index_name if isinstance(index_name, tuple) else (index_name,)
+
+def _normalized(value, normalize):
+    return normalize(value) if normalize and value is not None else value
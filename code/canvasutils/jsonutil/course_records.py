@@ -0,0 +1,87 @@
+import sys
+from collections.abc import Mapping
+from typing import Any, Dict
+
+class CompactRecord(Mapping):
+    """
+    Fixed-field record stored in __slots__, read through the dict API.
+
+    A Canvas course dict costs a few KB (a hash table plus its own copy of
+    every value); a record of a few slots costs about a tenth of that, and
+    the string fields listed in INTERNED share one string object across
+    every record that has the same value (semester, course code, dates...).
+
+    Records are read-only Mappings: record['name'], record.get('name'),
+    'name' in record, dict(record) and == with a dict work as for the dict
+    they were built from. A field missing from that dict is left unset and
+    is missing from the record too.
+
+    Subclasses set __slots__ = FIELDS = (...) and optionally INTERNED.
+    """
+    __slots__ = ()
+    FIELDS = ()
+    INTERNED = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._FIELD_SET = frozenset(cls.FIELDS)
+        cls._INTERNED_SET = frozenset(cls.INTERNED)
+
+    def __init__(self, **values):
+        for name, value in values.items():
+            if name not in self._FIELD_SET:
+                raise TypeError(f"{type(self).__name__} has no field {name!r}")
+            if name in self._INTERNED_SET and isinstance(value, str):
+                value = sys.intern(value)
+            object.__setattr__(self, name, value)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]):
+        """Record of the FIELDS present in data; every other key is dropped"""
+        return cls(**{name: data[name] for name in cls.FIELDS if name in data})
+
+    def __getitem__(self, name):
+        if name not in self._FIELD_SET:
+            raise KeyError(name)
+        try:
+            return getattr(self, name)
+        except AttributeError:
+            raise KeyError(name) from None
+
+    def __iter__(self):
+        for name in self.FIELDS:
+            if hasattr(self, name):
+                yield name
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __reduce__(self):
+        return (_rebuild, (type(self), dict(self)))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict copy (for json.dump and code that mutates courses)"""
+        return dict(self)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({dict(self)!r})"
+
+
+def _rebuild(cls, values):
+    return cls(**values)
+
+
+class CourseRecord(CompactRecord):
+    """The course fields JsonProcessor's filters, indexes and summaries read"""
+    __slots__ = FIELDS = ('id', 'name', 'course_code', 'workflow_state', 'enrollment_term_id',
+                          'account_id', 'start_at', 'end_at')
+    INTERNED = ('course_code', 'workflow_state', 'start_at', 'end_at')
+
+
+class CourseDetails(CompactRecord):
+    """One entry of CanvasCourseMapper's course mapping"""
+    __slots__ = FIELDS = ('course_name', 'course_code', 'title', 'year', 'semester')
+    INTERNED = ('course_code', 'title', 'year', 'semester')
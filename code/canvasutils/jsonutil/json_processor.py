@@ -1,12 +1,18 @@
 # Handle both relative and absolute imports for testing
 try:
     from . import json_util
+    from .course_index import CourseIndex
+    from .course_records import CourseRecord
+    from .semester_index import SemesterIndex
 except ImportError:
     # Fallback for direct execution
     import sys
     import os
     sys.path.insert(0, os.path.dirname(__file__))
     import json_util
+    from course_index import CourseIndex
+    from course_records import CourseRecord
+    from semester_index import SemesterIndex
 
 import re
 from typing import List, Dict, Any
@@ -22,10 +28,217 @@ class JsonProcessor(object):
     # \) - literal closing parenthesis
     SEMESTER_PATTERN = re.compile(r'\((\d{4})\s+(\w+)(?:\s+[^)]*)?\)', re.IGNORECASE)
 
-    def __init__(self, file_name):
+    # The only course fields the filters and summaries read
+    SUMMARY_FIELDS = ('id', 'name', 'course_code')
+
+    def __init__(self, file_name, fields=None, course_filter=None, compact=False, sidecar=False):
+        """
+        The file is parsed with one backend.loads call and the semester map
+        is built in a single pass over the courses. With course_filter, fields
+        or compact the courses are streamed from the file one at a time
+        instead, so the raw JSON text is never held in memory and courses
+        rejected by course_filter are never kept. A file that cannot be read
+        or parsed (e.g. a truncated export) raises OSError or ValueError.
+
+        With sidecar=True the semester map is kept in a SemesterIndex file next
+        to the JSON (file_name + ".semidx"), written on the first run. Later
+        runs only check that the JSON is unchanged (size and mtime; sha256 of
+        the content only if the mtime moved, see SemesterIndex) and load the
+        index: courses are read when first used, and
+        get_courses_by_semester reads only that semester's courses.
+
+        Args:
+            file_name: JSON file with a list of courses
+            fields: Course fields to keep in memory (e.g. SUMMARY_FIELDS);
+                    None keeps the full course objects
+            course_filter: Optional function course -> bool; only courses it
+                           accepts are kept (e.g. semester_filter("2025", "Fall"))
+            compact: Keep each course as a read-only CourseRecord (the fields
+                     of CourseRecord.FIELDS in slots, repeated strings shared)
+                     instead of a dict; fields is then ignored
+            sidecar: Use (and create) the persisted semester index
+        """
         self.file_name = file_name
-        self.courses: List[Dict[Any, Any]] = json_util.load_json_file(file_name) 
-        self.semester_courses: Dict[str, List[Dict[Any, Any]]] = self.analyze_available_semesters()
+        self.fields = fields
+        self.course_filter = course_filter
+        self.compact = compact
+        self._courses: List[Dict[Any, Any]] | None = None
+        self._semester_courses: Dict[str, List[Dict[Any, Any]]] | None = None
+        self._index: CourseIndex | None = None
+        # "year semester" of the loaded courses by id(), when the sidecar knows it
+        self._semester_keys: Dict[int, str] = {}
+
+        self.sidecar = SemesterIndex.load(file_name, self.SEMESTER_PATTERN.pattern) if sidecar else None
+        if self.sidecar is None:
+            self._load_courses(build_sidecar=sidecar)
+
+    def _keep(self, course):
+        """The course as this processor keeps it, or None if course_filter rejects it"""
+        if self.course_filter and not self.course_filter(course):
+            return None
+        if self.compact:
+            return CourseRecord.from_dict(course)
+        if self.fields:
+            return {key: course[key] for key in self.fields if key in course}
+        return course
+
+    def _read_courses(self):
+        """
+        The courses of the file: streamed when only some of each is kept,
+        else one backend.loads of the whole file, much faster than streaming
+        """
+        if self.course_filter or self.fields or self.compact:
+            return json_util.iter_json_items(self.file_name)
+        with open(self.file_name, 'rb') as f:
+            courses = json_util.backend.loads(f.read())
+        if not isinstance(courses, list):
+            raise ValueError(f"{self.file_name}: not a JSON array")
+        return courses
+
+    def _load_courses(self, build_sidecar=False):
+        """Read every course from the file and build the semester map"""
+        courses = []
+        semester_courses = {}
+        if self.sidecar is not None:
+            # Semesters come from the index; SEMESTER_PATTERN is not run
+            semester_of = self.sidecar.semester_of_position()
+            for position, course in enumerate(self._read_courses()):
+                course = self._keep(course)
+                if course is not None:
+                    courses.append(course)
+                    key = semester_of.get(position)
+                    if key is not None:
+                        semester_courses.setdefault(key, []).append(course)
+                        self._semester_keys[id(course)] = key
+        elif build_sidecar:
+            # Byte spans need the streaming parser. A parse error propagates
+            # before save(), so no sidecar of a partial file is written
+            index, positions = SemesterIndex.build(self.file_name, self.SEMESTER_PATTERN.pattern,
+                                                   json_util.iter_json_spans(self.file_name),
+                                                   self._semester_key)
+            for position, course in positions:
+                course = self._keep(course)
+                if course is not None:
+                    courses.append(course)
+                    self._add_to_semester(semester_courses, course)
+            if index.save():
+                self.sidecar = index
+        else:
+            for course in self._read_courses():
+                course = self._keep(course)
+                if course is not None:
+                    courses.append(course)
+                    self._add_to_semester(semester_courses, course)
+        self._courses = courses
+        self._semester_courses = semester_courses
+
+    @property
+    def courses(self) -> List[Dict[Any, Any]]:
+        if self._courses is None:
+            self._load_courses()
+        return self._courses
+
+    @courses.setter
+    def courses(self, courses: List[Dict[Any, Any]]):
+        self._courses = courses
+        # Indexes of the previous courses would answer for the new ones;
+        # add_course/remove_course update them instead
+        self._index = None
+        self._semester_keys = {}
+
+    @property
+    def semester_courses(self) -> Dict[str, List[Dict[Any, Any]]]:
+        if self._semester_courses is None:
+            self._load_courses()
+        return self._semester_courses
+
+    @semester_courses.setter
+    def semester_courses(self, semester_courses: Dict[str, List[Dict[Any, Any]]]):
+        self._semester_courses = semester_courses
+
+    @property
+    def index(self) -> CourseIndex:
+        """Secondary indexes (see index_keys), each built on its first query"""
+        if self._index is None:
+            self._index = CourseIndex(self.courses, self.index_keys())
+        return self._index
+
+    @classmethod
+    def semester_filter(cls, year: str, semester: str):
+        """course_filter keeping only the courses of one semester (case-insensitive)"""
+        def accept(course):
+            match = cls.SEMESTER_PATTERN.search(course.get('name', ''))
+            return bool(match) and match.group(1) == year and match.group(2).lower() == semester.lower()
+        return accept
+
+    def index_keys(self) -> Dict[str, Any]:
+        """
+        Index keys of self.index: function course -> value, or a (function,
+        normalize) pair. Combine them in find_courses, or add more with
+        self.index.add_key(name, function).
+        """
+        def semester_part(group):
+            def key(course):
+                year_semester = self._semester_keys.get(id(course)) or self._semester_key(course)
+                return year_semester.split(' ', 1)[group] if year_semester else None
+            return key
+
+        return {
+            'id': lambda course: course.get('id'),
+            'course_code': lambda course: course.get('course_code'),
+            'year': semester_part(0),
+            'semester': (semester_part(1), str.lower),
+            'term_id': lambda course: course.get('enrollment_term_id'),
+            'workflow_state': lambda course: course.get('workflow_state'),
+        }
+
+    def add_course(self, course: Dict[Any, Any]):
+        """
+        Add a course to the course list, the semester map and the built indexes,
+        kept like the loaded ones (course_filter, fields, compact). Returns the
+        object kept (pass it to remove_course), or None if course_filter rejects it.
+        """
+        course = self._keep(course)
+        if course is None:
+            return None
+        self.courses.append(course)
+        self._add_to_semester(self.semester_courses, course)
+        if self._index is not None:
+            self._index.add(course)
+        return course
+
+    def remove_course(self, course: Dict[Any, Any]):
+        """Remove a course (the object held by this processor) everywhere it is kept"""
+        courses = self.courses
+        for position, kept in enumerate(courses):
+            if kept is course:
+                # In place: assigning self.courses would drop the built indexes
+                del courses[position]
+                break
+        for year_semester, courses_list in list(self.semester_courses.items()):
+            if any(c is course for c in courses_list):
+                remaining = [c for c in courses_list if c is not course]
+                if remaining:
+                    self.semester_courses[year_semester] = remaining
+                else:
+                    del self.semester_courses[year_semester]
+        if self._index is not None:
+            self._index.remove(course)
+        self._semester_keys.pop(id(course), None)
+
+    def find_courses(self, **criteria) -> List[Dict[Any, Any]]:
+        """
+        Courses matching every criterion, answered from the indexes without a scan.
+        Keys: id, course_code, year, semester (case-insensitive), term_id,
+        workflow_state.
+
+        Example: find_courses(year="2025", semester="Fall", workflow_state="available")
+        """
+        return self.index.find(**criteria)
+
+    def get_course(self, course_id) -> Dict[Any, Any] | None:
+        """The course with this id, or None"""
+        return self.index.first(id=course_id)
 
     def get_courses(self) -> List[Dict[Any, Any]]:
         return self.courses
@@ -37,30 +250,17 @@ class JsonProcessor(object):
         """
         Filter courses using the consolidated class regex pattern.
         Now uses SEMESTER_PATTERN and checks captured groups for exact matching.
+        The regex runs once per course, when the year and semester indexes are
+        built; every call after that is a lookup.
         
         Args:
             year: Target year (e.g., "2025")
-            semester: Target semester (e.g., "Fall", "Spring")
+            semester: Target semester (e.g., "Fall", "Spring"; case-insensitive)
         
         Returns:
             List of filtered courses
         """
-        filtered_courses = []
-        
-        for course in self.courses:
-            course_name = course.get('name', '')
-            match = self.SEMESTER_PATTERN.search(course_name)
-            if match:
-                # Extract year and semester from capture groups
-                course_year = match.group(1)
-                course_semester = match.group(2)
-                
-                # Case-insensitive comparison for semester
-                if (course_year == year and 
-                    course_semester.lower() == semester.lower()):
-                    filtered_courses.append(course)
-        
-        return filtered_courses
+        return self.find_courses(year=year, semester=semester)
 
     def analyze_available_semesters(self) -> Dict[str, List[Dict[Any, Any]]]:
         """
@@ -74,20 +274,29 @@ class JsonProcessor(object):
         semester_courses = {}
     
         for course in self.courses:
-            course_name = course.get('name', '')
-            match = self.SEMESTER_PATTERN.search(course_name)
-            if match:
-                year = match.group(1)      # First capture group: year (e.g., "2025")
-                semester = match.group(2)  # Second capture group: semester (e.g., "Fall")
-                year_semester = f"{year} {semester}"  # Combine: "2025 Fall"
-                
-                # Initialize list if key doesn't exist, then append
-                if year_semester not in semester_courses:
-                    semester_courses[year_semester] = []
-                semester_courses[year_semester].append(course)
+            self._add_to_semester(semester_courses, course)
         
         return semester_courses
 
+    def _semester_key(self, course) -> str | None:
+        """The "year semester" of a course (e.g. "2025 Fall"), or None if its name has none"""
+        course_name = course.get('name', '')
+        match = self.SEMESTER_PATTERN.search(course_name)
+        if match:
+            year = match.group(1)      # First capture group: year (e.g., "2025")
+            semester = match.group(2)  # Second capture group: semester (e.g., "Fall")
+            return f"{year} {semester}"  # Combine: "2025 Fall"
+        return None
+
+    def _add_to_semester(self, semester_courses, course):
+        """Append a course to its "year semester" list, if its name has one"""
+        year_semester = self._semester_key(course)
+        if year_semester:
+            # Initialize list if key doesn't exist, then append
+            if year_semester not in semester_courses:
+                semester_courses[year_semester] = []
+            semester_courses[year_semester].append(course)
+
     def extract_semester_info(self, course_name: str) -> tuple[str, str] | None:
         """
         Helper method to extract year and semester from a course name.
@@ -117,8 +326,19 @@ class JsonProcessor(object):
             List of courses for the specified semester
         """
         year_semester = f"{year} {semester}"
+        if self._semester_courses is None and self.sidecar is not None:
+            # Courses not loaded yet: read just this semester's courses from the file
+            spans = self.sidecar.spans(self.sidecar.semesters.get(year_semester, []))
+            courses = (self._keep(course) for course in json_util.read_json_spans(self.file_name, spans))
+            return [course for course in courses if course is not None]
         return self.semester_courses.get(year_semester, [])
 
+    def semester_counts(self) -> Dict[str, int]:
+        """Number of courses of every "year semester" (from the sidecar if the courses are not loaded)"""
+        if self._semester_courses is None and self.sidecar is not None and not self.course_filter:
+            return {key: len(positions) for key, positions in self.sidecar.semesters.items()}
+        return {key: len(courses_list) for key, courses_list in self.semester_courses.items()}
+
     def print_course_summary(self, title: str, count=10):
         """
         Print a summary of courses.
@@ -147,12 +367,13 @@ class JsonProcessor(object):
         Args:
             max_semesters: Maximum number of semesters to display
         """
+        semester_counts = self.semester_counts()
         print(f"\n=== Available Semesters ===")
-        print(f"Total semesters found: {len(self.semester_courses)}")
+        print(f"Total semesters found: {len(semester_counts)}")
         
-        sorted_semesters = sorted(self.semester_courses.items())
-        for i, (year_semester, courses_list) in enumerate(sorted_semesters[:max_semesters]):
-            print(f"  {year_semester}: {len(courses_list)} courses")
+        sorted_semesters = sorted(semester_counts.items())
+        for i, (year_semester, course_count) in enumerate(sorted_semesters[:max_semesters]):
+            print(f"  {year_semester}: {course_count} courses")
         
         if len(sorted_semesters) > max_semesters:
             print(f"  ... and {len(sorted_semesters) - max_semesters} more semesters")
@@ -1,42 +1,654 @@
+import contextlib
+import itertools
 import json
+import os
+import re
+import secrets
+from collections.abc import Iterator, Mapping
 
-def store_json_string(json_string, file_name='output.json'):
+# fcntl (POSIX) locks JSON Lines appends against concurrent appenders
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# orjson is optional: a much faster encoder/decoder, used when it is installed
+# wherever its output is the same as json's (loading, compact output)
+try:
+    import orjson # type: ignore
+except ImportError:
+    orjson = None
+
+def _json_default(obj):
+    """Serialize read-only Mappings (e.g. course_records.CourseRecord) as JSON objects"""
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class StdlibBackend(object):
+    """JSON backend on the standard json module"""
+    name = 'json'
+
+    def __init__(self, indent=4):
+        self.indent = indent
+
+    def _encoder(self, compact):
+        if compact:
+            return json.JSONEncoder(ensure_ascii=False, separators=(',', ':'), default=_json_default)
+        return json.JSONEncoder(indent=self.indent, ensure_ascii=False, default=_json_default)
+
+    def dumps(self, obj, compact=False):
+        """UTF-8 JSON bytes, pretty-printed with self.indent unless compact"""
+        return self._encoder(compact).encode(obj).encode('utf-8')
+
+    def dump(self, obj, f, compact=False):
+        """Write the bytes of dumps() to the binary file f piece by piece, never all at once"""
+        for chunk in self._encoder(compact).iterencode(obj):
+            f.write(chunk.encode('utf-8'))
+
+    def loads(self, data):
+        return json.loads(data)
+
+
+class OrjsonBackend(object):
+    """JSON backend on orjson (several times faster; pretty-prints with 2 spaces only)"""
+    name = 'orjson'
+    indent = 2
+
+    def __init__(self):
+        # What orjson cannot encode (e.g. integers beyond 64 bits) goes through json
+        self.fallback = StdlibBackend(indent=self.indent)
+
+    def dumps(self, obj, compact=False):
+        option = orjson.OPT_NON_STR_KEYS if compact else orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=_json_default, option=option)
+        except orjson.JSONEncodeError:
+            return self.fallback.dumps(obj, compact)
+
+    def loads(self, data):
+        return orjson.loads(data)
+
+
+BACKENDS = {'json': StdlibBackend()}
+if orjson is not None:
+    BACKENDS['orjson'] = OrjsonBackend()
+
+
+class DefaultBackend(object):
+    """
+    The backend used until set_backend is called: pretty output always comes
+    from json (indent 4), so installing orjson never changes the layout of
+    stored files; orjson, if installed, loads and writes compact output
+    """
+    name = 'default'
+    indent = 4
+
+    def __init__(self):
+        self.pretty = BACKENDS['json']
+        self.fast = BACKENDS.get('orjson', self.pretty)
+
+    def for_output(self, compact):
+        """The backend that encodes pretty or compact output"""
+        return self.fast if compact else self.pretty
+
+    def dumps(self, obj, compact=False):
+        return self.for_output(compact).dumps(obj, compact)
+
+    def loads(self, data):
+        return self.fast.loads(data)
+
+
+# The backend every store/load function of this module uses
+backend = DefaultBackend()
+
+def set_backend(name_or_backend):
+    """
+    Select the JSON backend: 'json', 'orjson' (if installed) or any object
+    with name, indent, dumps(obj, compact) -> bytes and loads(data), and
+    optionally dump(obj, f, compact) streaming into a binary file.
+    Until then DefaultBackend is used. Returns the previous backend.
+    """
+    global backend
+    previous = backend
+    if isinstance(name_or_backend, str):
+        if name_or_backend not in BACKENDS:
+            raise ValueError(f"Unknown or unavailable JSON backend: {name_or_backend}")
+        name_or_backend = BACKENDS[name_or_backend]
+    backend = name_or_backend
+    return previous
+
+def get_backend():
+    return backend
+
+def store_json_string(json_string, file_name='output.json', compact=False):
     """Store a JSON string to a file with pretty formatting"""
     # Ensure the input is a valid JSON string
     try:
-        data = json.loads(json_string)  # Parse JSON string to Python object
-    except json.JSONDecodeError as e:
+        data = backend.loads(json_string)  # Parse JSON string to Python object
+    except ValueError as e:
         print(f"❌ Invalid JSON string: {e}")
         return None
 
-    return store_json_object(data, file_name)
+    return store_json_object(data, file_name, compact)
+
+
+@contextlib.contextmanager
+def atomic_write(file_name):
+    """
+    Open a binary file that replaces file_name only once it is complete.
+
+    The data goes to a temporary file in the same directory, which is
+    fsynced and renamed over file_name (os.replace) when the block exits
+    normally; on an error it is removed. A crash at any point leaves either
+    the old file or the new one, never a truncated file (at worst a stray
+    .<name>.<random>.tmp file next to it).
+    """
+    directory = os.path.dirname(os.path.abspath(file_name))
+    temp_name = os.path.join(directory, f".{os.path.basename(file_name)}.{secrets.token_hex(4)}.tmp")
+    # Created like open(file_name, 'wb') would (umask applies), never reused
+    fd = os.open(temp_name, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0), 0o666)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        if os.path.exists(file_name):
+            os.chmod(temp_name, os.stat(file_name).st_mode & 0o7777)  # keep its permissions
+        os.replace(temp_name, file_name)
+    except BaseException:
+        if os.path.exists(temp_name):
+            os.remove(temp_name)
+        raise
+    _fsync_directory(directory)
+
+def _fsync_directory(directory):
+    """Persist a rename in directory (POSIX; not possible everywhere)"""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+def store_json_object(json_object, file_name='output.json', compact=False, write_count=False):
+    """
+    Store a JSON object to a file with pretty formatting.
 
+    compact=True drops the indentation and spaces, for files only programs
+    read: smaller and faster to write and to load.
+    write_count=True also records the number of elements in a metadata
+    sidecar, so count_elements_in_json does not have to read the file.
 
-def store_json_object(json_object, file_name='output.json'):
-    """Store a JSON object to a file with pretty formatting"""
+    The JSON text is streamed into the file (_write_json_value), never held
+    whole in memory, and the file is replaced atomically (atomic_write): a
+    failed or interrupted write leaves the previous file as it was. An
+    iterator (e.g. a generator of courses) is streamed as a JSON array by
+    store_json_items instead of being built in memory.
+    """
+    if isinstance(json_object, Iterator):
+        return store_json_items(json_object, file_name, compact, write_count)
     try:
         # Write to a file with pretty formatting
-        with open(file_name, 'w', encoding='utf-8') as f:
-            json.dump(json_object, f, indent=4, ensure_ascii=False)
+        with atomic_write(file_name) as f:
+            count = _write_json_value(json_object, f, compact)
+        if write_count and count is not None:
+            write_count_metadata(file_name, count)
         print(f"✅ Successfully saved to {file_name}")
     except Exception as e:
         print(f"❌ Error writing to {file_name}: {e}")
 
     return file_name
 
+# Items of a JSON array encoded per backend call by the store functions
+JSON_BATCH_SIZE = 256
+
+def _write_json_value(value, f, compact=False):
+    """
+    Write value to the binary file f exactly as backend.dumps would, without
+    building its whole text: a list JSON_BATCH_SIZE items at a time (with any
+    backend), anything else streamed by backend.dump (json:
+    JSONEncoder.iterencode) or, for a backend that cannot stream (orjson), a
+    mapping one pair at a time.
+    Returns the number of elements of a list or mapping, else None.
+    """
+    if isinstance(value, (list, tuple)):
+        return _write_json_array(value, f, compact)
+    count = len(value) if isinstance(value, Mapping) else None
+    dump = getattr(_output_backend(compact), 'dump', None)
+    if dump is not None:
+        dump(value, f, compact)
+    elif isinstance(value, Mapping):
+        _write_json_object(value.items(), f, compact)
+    else:
+        f.write(backend.dumps(value, compact))
+    return count
+
+def _output_backend(compact):
+    """The backend that encodes output: DefaultBackend picks one per mode"""
+    for_output = getattr(backend, 'for_output', None)
+    return for_output(compact) if for_output else backend
+
+def _write_json_array(items, f, compact=False):
+    """
+    Write items from any iterable as a JSON array laid out like
+    backend.dumps(list(items)); returns the number of items.
+
+    Items are encoded JSON_BATCH_SIZE at a time: a batch encoded as a list
+    has its items laid out as in the whole array, so only its brackets are
+    replaced by the separators between batches.
+    """
+    items = iter(items)
+    # Pretty arrays end with a newline before the closing bracket
+    tail = 1 if compact else 2
+    count = 0
+    while True:
+        batch = list(itertools.islice(items, JSON_BATCH_SIZE))
+        if not batch:
+            break
+        f.write(b'[' if count == 0 else b',')
+        f.write(backend.dumps(batch, compact)[1:-tail])
+        count += len(batch)
+    f.write((b']' if compact else b'\n]') if count else b'[]')
+    return count
+
+def _pair_formatter(compact):
+    colon = b':' if compact else b': '
+    def format_pair(pair):
+        key, value = pair
+        return backend.dumps(_json_key(key), compact) + colon + backend.dumps(value, compact)
+    return format_pair
+
+def _json_key(key):
+    """An object key as JSON writes it: true/false/null, numbers as JSON numbers"""
+    if isinstance(key, str):
+        return key
+    if key is True or key is False or key is None:
+        return json.dumps(key)
+    if isinstance(key, (int, float)):
+        return backend.dumps(key, True).decode('utf-8')
+    return str(key)
+
+def _write_json_object(pairs, f, compact=False):
+    """Write (key, value) pairs as a JSON object laid out like backend.dumps(dict(pairs))"""
+    return _write_json_stream(pairs, f, b'{', b'}', _pair_formatter(compact), compact)
+
+def _write_json_stream(entries, f, opening, closing, format_entry, compact=False):
+    """Write entries between opening/closing brackets, laid out like backend.dumps of all of them"""
+    if compact:
+        first, separator, end = opening, b',', closing
+    else:
+        pad = b'\n' + b' ' * backend.indent
+        first, separator, end = opening + pad, b',' + pad, b'\n' + closing
+    count = 0
+    for entry in entries:
+        f.write(first if count == 0 else separator)
+        text = format_entry(entry)
+        f.write(text if compact else text.replace(b'\n', pad))
+        count += 1
+    f.write(end if count else opening + closing)
+    return count
+
+def _store_json_stream(entries, file_name, write_entries, compact=False, write_count=False):
+    try:
+        # Never leave a truncated file behind: file_name is only replaced
+        # once every entry is written
+        with atomic_write(file_name) as f:
+            count = write_entries(entries, f, compact)
+        if write_count:
+            write_count_metadata(file_name, count)
+        print(f"✅ Successfully saved {count} items to {file_name}")
+    except Exception as e:
+        print(f"❌ Error writing to {file_name}: {e}")
+        return None
+
+    return file_name
+
+def store_json_items(items, file_name='output.json', compact=False, write_count=False):
+    """
+    Store items from any iterable (e.g. a generator of API pages) as a JSON array,
+    writing items as they arrive (JSON_BATCH_SIZE at a time) instead of
+    building the whole list first.
+    The output matches store_json_object(list(items), compact=compact);
+    write_count=True records the item count as store_json_object does.
+
+    Returns:
+        file_name, or None if writing failed (file_name is left as it was)
+    """
+    return _store_json_stream(items, file_name, _write_json_array, compact, write_count)
+
+def store_json_pairs(pairs, file_name='output.json', compact=False, write_count=False):
+    """
+    Store (key, value) pairs from any iterable as a JSON object, one pair at a time.
+    The output matches store_json_object(dict(pairs), compact=compact);
+    write_count=True records the pair count as store_json_object does.
+
+    Returns:
+        file_name, or None if writing failed (file_name is left as it was)
+    """
+    return _store_json_stream(pairs, file_name, _write_json_object, compact, write_count)
+
 def load_json_file(file_name='output.json'):
     """Load a JSON object from a file"""
     try:
-        with open(file_name, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(file_name, 'rb') as f:
+            data = backend.loads(f.read())
         return data
     except Exception as e:
         print(f"❌ Error reading {file_name}: {e}")
         return None
 
-def count_elements_in_json(file_name='output.json'):
-    """Count elements in a JSON file"""
-    data = load_json_file(file_name)
-    if data:
-        return len(data)
-    return 0
\ No newline at end of file
+# Characters read from the file at a time by iter_json_items
+STREAM_CHUNK_SIZE = 64 * 1024
+NUMBER_CHARS = frozenset('0123456789.eE+-')
+WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+def iter_json_items(file_name='output.json', chunk_size=STREAM_CHUNK_SIZE):
+    """
+    Yield the elements of a JSON array file one at a time.
+
+    Only the element being parsed and one chunk of text are in memory, so a
+    multi-hundred-MB export can be processed without json.load of the whole
+    file. A file that cannot be read or parsed (e.g. a truncated export)
+    raises OSError or ValueError (json.JSONDecodeError) where the error is
+    found, after the elements before it; it never just ends early.
+    """
+    return _iter_json_array(file_name, chunk_size, spans=False)
+
+def iter_json_spans(file_name='output.json', chunk_size=STREAM_CHUNK_SIZE):
+    """
+    Like iter_json_items, but yield (element, offset, length): where the
+    element's text starts in the file and how many bytes it takes, so it can
+    be read back alone with read_json_spans.
+    """
+    return _iter_json_array(file_name, chunk_size, spans=True)
+
+def read_json_spans(file_name, spans):
+    """Yield the JSON values stored at (offset, length) byte spans of a file"""
+    with open(file_name, 'rb') as f:
+        for offset, length in spans:
+            f.seek(offset)
+            yield backend.loads(f.read(length))
+
+def _iter_json_array(file_name, chunk_size, spans):
+    decoder = json.JSONDecoder()
+    # json.load reuses one string per distinct key across the whole document;
+    # raw_decode forgets them after every element, so they are shared here
+    keys = {}
+    # newline='' keeps \r\n as is, so character counts add up to byte offsets
+    with open(file_name, 'r', encoding='utf-8', newline='') as f:
+        buffer = f.read(chunk_size)
+        eof = not buffer
+        pos = _skip_whitespace(buffer, 0)
+        if buffer[pos:pos + 1] != '[':
+            raise ValueError(f"{file_name}: not a JSON array")
+        pos += 1
+        # Byte offset of buffer[pos] in the file; whitespace and ,[ are one byte each
+        offset = pos
+        count = 0
+        after_item = False
+        while True:
+            start = pos
+            pos = _skip_whitespace(buffer, pos)
+            offset += pos - start
+            if pos == len(buffer):
+                if eof:
+                    raise ValueError(f"{file_name}: unexpected end of file")
+                # Keep only the unparsed text, then read the next chunk
+                buffer, pos = buffer[pos:], 0
+                more = f.read(chunk_size)
+                eof = not more
+                buffer += more
+                continue
+
+            char = buffer[pos]
+            if char == ']' and (after_item or count == 0):
+                return
+            if after_item:
+                if char != ',':
+                    raise ValueError(f"{file_name}: expected ',' or ']', found {char!r}")
+                pos += 1
+                offset += 1
+                after_item = False
+                continue
+
+            try:
+                item, end = decoder.raw_decode(buffer, pos)
+                # A number cut off by the chunk (1|.5e3) decodes too early
+                complete = eof or (end < len(buffer) and buffer[end] not in NUMBER_CHARS)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                complete = False
+            if not complete:
+                # Element cut off by the chunk: read more (at least doubling the
+                # unparsed text, so a huge element is not re-parsed too often)
+                buffer, pos = buffer[pos:], 0
+                more = f.read(max(chunk_size, len(buffer)))
+                eof = not more
+                buffer += more
+                continue
+
+            if isinstance(item, (dict, list)):
+                item = _share_keys(item, keys)
+            if spans:
+                length = len(buffer[pos:end].encode('utf-8'))
+                yield item, offset, length
+                offset += length
+            else:
+                yield item
+            count += 1
+            pos = end
+            after_item = True
+
+def _share_keys(value, keys):
+    """Copy of a decoded dict or list whose dict keys are taken from keys"""
+    if isinstance(value, dict):
+        return {keys.setdefault(k, k): _share_keys(v, keys) if isinstance(v, (dict, list)) else v
+                for k, v in value.items()}
+    return [_share_keys(v, keys) if isinstance(v, (dict, list)) else v for v in value]
+
+def _skip_whitespace(text, pos):
+    return WHITESPACE.match(text, pos).end()
+
+# Bytes read at a time by count_elements_in_json
+COUNT_CHUNK_SIZE = 1024 * 1024
+# Every byte but quotes and the structure that matters for counting
+NON_STRUCTURAL = bytes(set(range(256)) - set(b'"[]{},'))
+# A string once its escapes are gone: its brackets and commas are not structure
+JSON_STRING = re.compile(rb'"[^"]*"')
+# A nested array or object with only its own commas left inside
+CLOSED_GROUP = re.compile(rb'\[,*\]|\{,*\}')
+BRACKET = re.compile(rb'[\[\]{}]')
+# Sidecar holding the element count written at store time
+METADATA_SUFFIX = '.meta'
+
+def count_elements_in_json(file_name='output.json', use_metadata=True):
+    """
+    Count elements in a JSON file: the items of a top-level array, or the
+    members of a top-level object.
+
+    A count stored with write_count=True is returned if the file has not
+    changed since (same size and mtime). Otherwise the file is scanned chunk
+    by chunk without building any Python object: strings are skipped and
+    only the commas at the top level are counted, in constant memory. The
+    file is not validated.
+    """
+    if use_metadata:
+        count = read_count_metadata(file_name)
+        if count is not None:
+            return count
+    try:
+        with open(file_name, 'rb') as f:
+            return _count_top_level(f)
+    except Exception as e:
+        print(f"❌ Error reading {file_name}: {e}")
+        return 0
+
+def _count_top_level(f):
+    # Read up to the first byte after the opening bracket
+    head = b''
+    while True:
+        chunk = f.read(COUNT_CHUNK_SIZE)
+        head += chunk
+        stripped = head.lstrip()
+        if not chunk or stripped[1:].lstrip():
+            break
+    body = stripped[1:]
+    if stripped[:1] not in (b'[', b'{') or body.lstrip()[:1] in (b']', b'}', b''):
+        return 0  # an empty container, or not a container at all
+
+    commas = 0
+    backslashes = b''  # may escape the first byte of the next chunk
+    carry = b''        # an unterminated string, finished by the next chunk
+    pending = b''      # structure of the element being read: its unclosed groups
+    data = body
+    while data:
+        data = backslashes + data
+        chunk = data.rstrip(b'\\')
+        backslashes = data[len(chunk):]
+        # Drop the escapes, then keep quotes and structure only: what is
+        # left of a string is its quotes and the brackets/commas inside
+        text = chunk.replace(b'\\\\', b'').replace(b'\\"', b'').translate(None, NON_STRUCTURAL)
+        # Most strings hold no structure: dropping any two adjacent quotes
+        # first is cheap, and keeps every other quote's parity
+        text = JSON_STRING.sub(b'', (carry + text).replace(b'""', b''))
+        # Only the string cut off by the chunk end can have a quote left
+        quote = text.find(b'"')
+        text, carry = (text[:quote], text[quote:]) if quote >= 0 else (text, b'')
+        pending += text
+
+        # Drop the closed groups, innermost first: only top-level commas and
+        # the groups still open are left
+        reduced = CLOSED_GROUP.sub(b'', pending)
+        while reduced != pending:
+            pending, reduced = reduced, CLOSED_GROUP.sub(b'', reduced)
+
+        bracket = BRACKET.search(pending)
+        if bracket is None:
+            commas += pending.count(b',')
+            pending = b''
+        else:
+            commas += pending.count(b',', 0, bracket.start())
+            if pending[bracket.start()] in b']}':
+                return commas + 1  # the top-level container is closed
+            pending = pending[bracket.start():]
+        data = f.read(COUNT_CHUNK_SIZE)
+    return commas + 1
+
+def metadata_path(file_name):
+    """The metadata sidecar of a JSON file"""
+    return file_name + METADATA_SUFFIX
+
+def write_count_metadata(file_name, count):
+    """Record the element count of a JSON file next to it, for count_elements_in_json"""
+    stat = os.stat(file_name)
+    metadata = {'count': count, 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+    with atomic_write(metadata_path(file_name)) as f:
+        f.write(json.dumps(metadata).encode('utf-8'))
+
+def read_count_metadata(file_name):
+    """The stored element count of a JSON file, or None if missing or out of date"""
+    try:
+        with open(metadata_path(file_name), 'r', encoding='utf-8') as f:
+            metadata = json.load(f)
+        stat = os.stat(file_name)
+        if metadata['size'] != stat.st_size or metadata['mtime_ns'] != stat.st_mtime_ns:
+            return None
+        return metadata['count']
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+# JSON Lines: one compact JSON value per line, so a file can be appended to
+# without rewriting it and a single record read back from its byte span
+
+def dump_json_line(obj):
+    """obj as one line of JSON Lines: compact, newline-terminated bytes"""
+    return backend.dumps(obj, True) + b'\n'
+
+def store_json_lines(items, file_name='output.jsonl'):
+    """
+    Store items as a JSON Lines file, replacing it atomically (atomic_write);
+    returns the (offset, length) of every line, or None on error.
+    """
+    spans = []
+    offset = 0
+    try:
+        with atomic_write(file_name) as f:
+            for item in items:
+                line = dump_json_line(item)
+                f.write(line)
+                spans.append((offset, len(line)))
+                offset += len(line)
+        print(f"✅ Successfully saved {len(spans)} lines to {file_name}")
+        return spans
+    except Exception as e:
+        print(f"❌ Error saving to {file_name}: {e}")
+        return None
+
+def append_json_lines(items, file_name='output.jsonl'):
+    """
+    Append items to a JSON Lines file; returns the (offset, length) of every
+    line written, or None on error.
+
+    The batch is written in one go under an exclusive lock (where fcntl is
+    available) and fsynced, so concurrent appenders do not interleave. A torn
+    last line left by a crash during an earlier append (no newline) is cut
+    off first: a record is either wholly in the file or not at all.
+    """
+    lines = [dump_json_line(item) for item in items]
+    try:
+        fd = os.open(file_name, os.O_RDWR | os.O_APPEND | os.O_CREAT | getattr(os, 'O_BINARY', 0), 0o644)
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+            offset = _end_of_last_line(fd)
+            if offset < os.fstat(fd).st_size:
+                os.ftruncate(fd, offset)
+            data = memoryview(b''.join(lines))
+            while data:
+                data = data[os.write(fd, data):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)  # also releases the lock
+    except OSError as e:
+        print(f"❌ Error appending to {file_name}: {e}")
+        return None
+    spans = []
+    for line in lines:
+        spans.append((offset, len(line)))
+        offset += len(line)
+    return spans
+
+def _end_of_last_line(fd):
+    """Byte offset just past the last newline of an open file (0 if none)"""
+    end = os.fstat(fd).st_size
+    while end > 0:
+        start = max(0, end - STREAM_CHUNK_SIZE)
+        os.lseek(fd, start, os.SEEK_SET)
+        newline = os.read(fd, end - start).rfind(b'\n')
+        if newline >= 0:
+            return start + newline + 1
+        end = start
+    return 0
+
+def iter_json_lines(file_name='output.jsonl', start=0):
+    """
+    Yield (item, byte offset, byte length) for every line of a JSON Lines
+    file from byte offset start; stops at a torn last line (no newline).
+    """
+    with open(file_name, 'rb') as f:
+        f.seek(start)
+        offset = start
+        for line in f:
+            if not line.endswith(b'\n'):
+                break
+            if line.strip():
+                yield backend.loads(line), offset, len(line)
+            offset += len(line)
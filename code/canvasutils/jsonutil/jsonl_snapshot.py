@@ -0,0 +1,212 @@
+# Handle both relative and absolute imports for testing
+try:
+    from . import json_util
+except ImportError:
+    # Fallback for direct execution
+    import sys
+    import os
+    sys.path.insert(0, os.path.dirname(__file__))
+    import json_util
+
+import mmap
+import operator
+import os
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple, Union
+
+INDEX_SUFFIX = '.idx'
+
+def index_path(file_name: str) -> str:
+    """The offset index file kept next to a JSON Lines snapshot"""
+    return file_name + INDEX_SUFFIX
+
+
+class JsonlSnapshot(object):
+    """
+    JSON Lines file of records with an id -> byte offset index, to read one
+    record without loading the file.
+
+    Records are appended to the file (json_util.append_json_lines) instead of
+    rewriting it, and read back through a memory map of it. When a key is
+    appended again the latest record wins, so appending is also how records
+    are updated.
+
+    The index is kept next to the file (file_name.idx) as JSON Lines of
+    [key, offset, length] and appended to along with it. On open it is caught
+    up with lines it misses (e.g. a crash between the two appends, or another
+    process appending), and rebuilt if it does not match the file. A line
+    without a usable key (written by another tool) is reported and skipped.
+    """
+
+    def __init__(self, file_name: str, key: Union[str, int, Callable[[Any], Any]] = 'id'):
+        """
+        Args:
+            file_name: The JSON Lines file, created on the first append
+            key: Field (or position) of a record holding its key, or a
+                 function record -> key; keys must be JSON strings or numbers
+        """
+        self.file_name = file_name
+        self.key = key if callable(key) else operator.itemgetter(key)
+        self.offsets: Dict[Any, Tuple[int, int]] = {}
+        self.end = 0  # bytes of the file covered by the index
+        self._map = None
+        self._load_index()
+
+    def _load_index(self):
+        entries = []
+        try:
+            with open(index_path(self.file_name), 'rb') as f:
+                index = f.read()
+            # Whole lines only: a line torn by a crash is caught up below.
+            # Parsed as one array, much faster than line by line
+            lines = index[:index.rfind(b'\n') + 1].splitlines()
+            entries = json_util.backend.loads(b'[' + b','.join(lines) + b']')
+            self.offsets = {key: (offset, length) for key, offset, length in entries}
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, TypeError):
+            entries = None
+        if entries is None or not self._index_matches(entries[-1] if entries else None):
+            self._rebuild_index()
+        else:
+            self.refresh()
+
+    def _index_matches(self, last) -> bool:
+        """
+        Whether the last index entry (the index follows the file order) is
+        still where the index says; sets end to the bytes the index covers
+        """
+        if last is None:
+            return True
+        key, offset, length = last
+        self.end = offset + length
+        try:
+            if offset + length > os.path.getsize(self.file_name):
+                return False
+            record, = json_util.read_json_spans(self.file_name, [(offset, length)])
+            return self.key(record) == key
+        except (OSError, ValueError, LookupError, TypeError):
+            return False
+
+    def _rebuild_index(self):
+        self.offsets = {}
+        self.end = 0
+        if os.path.exists(index_path(self.file_name)):
+            os.remove(index_path(self.file_name))
+        self.refresh()
+
+    def _record_key(self, record):
+        """The key of record; LookupError/TypeError if it has no JSON string or number key"""
+        key = self.key(record)
+        if isinstance(key, bool) or not isinstance(key, (str, int, float)):
+            raise TypeError(f"key {key!r} is not a JSON string or number")
+        return key
+
+    def _add(self, keys, spans):
+        """Record the spans of new lines, in memory and in the index file"""
+        entries = [(key, offset, length) for key, (offset, length) in zip(keys, spans)]
+        if entries:
+            json_util.append_json_lines(entries, index_path(self.file_name))
+        for key, offset, length in entries:
+            self.offsets[key] = (offset, length)
+            self.end = max(self.end, offset + length)
+
+    def refresh(self) -> int:
+        """Index lines appended to the file since it was indexed; returns how many"""
+        if not os.path.exists(self.file_name) or os.path.getsize(self.file_name) <= self.end:
+            return 0
+        keys, spans = [], []
+        end = self.end
+        for record, offset, length in json_util.iter_json_lines(self.file_name, self.end):
+            end = offset + length
+            try:
+                keys.append(self._record_key(record))
+            except (LookupError, TypeError) as e:
+                print(f"❌ Skipping line at byte {offset} of {self.file_name}: no key ({e!r})")
+                continue
+            spans.append((offset, length))
+        self._add(keys, spans)
+        self.end = max(self.end, end)
+        return len(keys)
+
+    def append(self, records: Iterable[Any]) -> Optional[int]:
+        """
+        Append records to the snapshot; returns how many, or None on error.
+        Every key is checked first: if one record has none, nothing is written.
+        """
+        records = list(records)
+        try:
+            keys = [self._record_key(record) for record in records]
+        except (LookupError, TypeError) as e:
+            print(f"❌ Error appending to {self.file_name}: record without a key ({e!r})")
+            return None
+        self.refresh()  # lines another process appended come first
+        spans = json_util.append_json_lines(records, self.file_name)
+        if spans is None:
+            return None
+        self._add(keys, spans)
+        return len(spans)
+
+    def write(self, records: Iterable[Any]) -> Optional[int]:
+        """Replace the snapshot with records; returns how many, or None on error"""
+        keys = []
+
+        def keyed():
+            for record in records:
+                keys.append(self._record_key(record))
+                yield record
+
+        self.close()  # the file is truncated under the map otherwise
+        spans = json_util.store_json_lines(keyed(), self.file_name)
+        self.offsets = {}
+        self.end = 0
+        if os.path.exists(index_path(self.file_name)):
+            os.remove(index_path(self.file_name))
+        if spans is None:
+            return None
+        self._add(keys, spans)
+        return len(spans)
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """The latest record with key, read alone from the file"""
+        span = self.offsets.get(key)
+        if span is None and self.refresh():
+            span = self.offsets.get(key)
+        if span is None:
+            return default
+        offset, length = span
+        return json_util.backend.loads(self._mapping(offset + length)[offset:offset + length])
+
+    def _mapping(self, end: int):
+        """Read-only map of the file, remapped if it no longer covers end"""
+        if self._map is None or len(self._map) < end:
+            self.close()
+            with open(self.file_name, 'rb') as f:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._map
+
+    def __getitem__(self, key: Any) -> Any:
+        missing = object()
+        record = self.get(key, missing)
+        if record is missing:
+            raise KeyError(key)
+        return record
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self.offsets
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def keys(self):
+        return self.offsets.keys()
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -0,0 +1,146 @@
+# Handle both relative and absolute imports for testing
+try:
+    from . import json_util
+except ImportError:
+    # Fallback for direct execution
+    import sys
+    import os
+    sys.path.insert(0, os.path.dirname(__file__))
+    import json_util
+
+import hashlib
+import json
+import os
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+# Bump when the sidecar layout changes; older sidecars are rebuilt
+SIDECAR_VERSION = 1
+SIDECAR_SUFFIX = '.semidx'
+
+def sidecar_path(file_name: str) -> str:
+    """The sidecar index file kept next to a JSON file"""
+    return file_name + SIDECAR_SUFFIX
+
+def file_stat(file_name: str) -> Dict[str, int]:
+    stat = os.stat(file_name)
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+def file_hash(file_name: str) -> str:
+    """sha256 of a file's content"""
+    with open(file_name, 'rb') as f:
+        return hashlib.file_digest(f, 'sha256').hexdigest()
+
+
+class SemesterIndex(object):
+    """
+    Semester map of a JSON array of courses, persisted next to the file.
+
+    Holds where every course is in the file (byte offset and length) and the
+    positions of the courses of every "year semester", so a JsonProcessor can
+    start without parsing the file or running SEMESTER_PATTERN, and read one
+    semester's courses alone.
+
+    The sidecar is only used while the JSON file has the same content as
+    when it was indexed, and the same semester pattern was used. Loading it
+    costs a stat of the file while its size and mtime are unchanged; only
+    when the mtime moved (e.g. the file was copied or touched) is the whole
+    file read and sha256-hashed, once, and the new mtime recorded.
+    """
+
+    def __init__(self, file_name: str, pattern: str, offsets: List[int], lengths: List[int],
+                 semesters: Dict[str, List[int]], source: Optional[Dict[str, Any]] = None):
+        self.file_name = file_name
+        self.pattern = pattern
+        self.offsets = offsets
+        self.lengths = lengths
+        self.semesters = semesters
+        self.source = source
+
+    @classmethod
+    def build(cls, file_name: str, pattern: str, spans: Iterator,
+              semester_of: Callable[[Dict[Any, Any]], Optional[str]]):
+        """
+        Index a file while it is being read.
+
+        Args:
+            spans: (course, offset, length) for every course, e.g.
+                   json_util.iter_json_spans(file_name); each one is yielded
+                   back by courses() as the index is built
+            semester_of: Function course -> "year semester" key, or None
+        """
+        index = cls(file_name, pattern, [], [], {}, source=file_stat(file_name))
+
+        def courses():
+            for position, (course, offset, length) in enumerate(spans):
+                index.offsets.append(offset)
+                index.lengths.append(length)
+                key = semester_of(course)
+                if key is not None:
+                    index.semesters.setdefault(key, []).append(position)
+                yield position, course
+
+        return index, courses()
+
+    @classmethod
+    def load(cls, file_name: str, pattern: str):
+        """The sidecar of file_name if it exists and is still valid, else None"""
+        try:
+            with open(sidecar_path(file_name), 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            source = data['source']
+            stat = file_stat(file_name)
+            if (data['version'] != SIDECAR_VERSION or data['pattern'] != pattern
+                    or source['size'] != stat['size']):
+                return None
+            index = cls(file_name, pattern, data['offsets'], data['lengths'], data['semesters'], source)
+            if source['mtime_ns'] != stat['mtime_ns']:
+                # Same size, new mtime: hash the content (O(file)) to tell an
+                # edit from a copy or touch, and remember the new mtime
+                if source['sha256'] != file_hash(file_name):
+                    return None
+                index.source = {**stat, 'sha256': source['sha256']}
+                index._write()
+            return index
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def save(self):
+        """
+        Write the sidecar; returns its path, or None if it was not written
+        (the file changed while it was being indexed, or a write error)
+        """
+        stat = file_stat(self.file_name)
+        if {key: self.source.get(key) for key in stat} != stat:
+            return None
+        self.source = {**stat, 'sha256': file_hash(self.file_name)}
+        return self._write()
+
+    def _write(self):
+        """Replace the sidecar file atomically (json_util.atomic_write); returns its path or None"""
+        path = sidecar_path(self.file_name)
+        data = {
+            'version': SIDECAR_VERSION,
+            'source': self.source,
+            'pattern': self.pattern,
+            'offsets': self.offsets,
+            'lengths': self.lengths,
+            'semesters': self.semesters,
+        }
+        try:
+            with json_util.atomic_write(path) as f:
+                f.write(json.dumps(data, separators=(',', ':')).encode('utf-8'))
+        except OSError as e:
+            print(f"❌ Error writing {path}: {e}")
+            return None
+        return path
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def spans(self, positions: List[int]):
+        """(offset, length) of the courses at the given positions"""
+        return [(self.offsets[p], self.lengths[p]) for p in positions]
+
+    def semester_of_position(self) -> Dict[int, str]:
+        """{position: "year semester"} of every course that has a semester"""
+        return {position: key for key, positions in self.semesters.items() for position in positions}
@@ -0,0 +1,40 @@
+from itertools import islice
+
+from canvasapi.paginated_list import PaginatedList # type: ignore
+
+# Canvas caps per_page at 100
+MAX_PER_PAGE = 100
+
+def with_per_page(paginated_list, per_page):
+    """Unfetched copy of a canvasapi PaginatedList that asks for per_page items per page"""
+    params = dict(paginated_list._first_params)
+    params['_kwargs'] = [(key, value) for key, value in params.get('_kwargs') or []
+                         if key != 'per_page']
+    params['per_page'] = per_page
+    return PaginatedList(paginated_list._content_class, paginated_list._requester,
+                         paginated_list._request_method, paginated_list._first_url,
+                         extra_attribs=paginated_list._extra_attribs, _root=paginated_list._root,
+                         _url_override=paginated_list._url_override, **params)
+
+def take(listing, n):
+    """
+    The first n items of a listing, fetching no more pages than needed.
+
+    A canvasapi PaginatedList (e.g. course.get_users()) is requested with
+    per_page=n (at most 100) instead of its default page size; any other
+    iterable, such as CanvasManager.iter_items(), is just cut off after n items.
+    """
+    if n <= 0:
+        return []
+    if isinstance(listing, PaginatedList):
+        listing = with_per_page(listing, min(n, MAX_PER_PAGE))
+    return list(islice(listing, n))
+
+def first(listing, default=None):
+    """The first item of a listing (one per_page=1 request), or default if it is empty"""
+    items = take(listing, 1)
+    return items[0] if items else default
+
+def exists(listing):
+    """True if a listing has at least one item"""
+    return bool(take(listing, 1))
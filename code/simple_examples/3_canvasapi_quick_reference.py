@@ -7,10 +7,14 @@ A condensed script showing the most common Canvas API operations
 from turtle import title
 from canvasapi import Canvas
 import os
+import sys
 from dotenv import load_dotenv
 from datetime import datetime, timedelta
 import markdown
 
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from canvasutils import analytics, counting, listing # type: ignore
+
 def get_env_variables():
   load_dotenv()
   api_key = os.getenv('API_KEY')
@@ -20,10 +24,9 @@ def get_env_variables():
 # 1. GET COURSE INFO
 def get_course_info(course):
   name = course.name;
-  students = list(course.get_users(enrollment_type=['student']))
-  assignments = list(course.get_assignments())
-  print(f"Students: {len(students)}")
-  print(f"Assignments: {len(assignments)}")
+  # Totals without downloading every student and assignment
+  print(f"Students: {counting.count_students(course)}")
+  print(f"Assignments: {counting.count_paginated(course.get_assignments())}")
   print(f"Course Name: {name}")
 
 def t1_get_course_info_demo(course):
@@ -209,8 +212,11 @@ def get_assignment_submission(course, assignment_name):
     print(f"❌ Assignment '{assignment_name}' not found")
     return []
 
-  # Get submissions
-  submission = list(target_assignment.get_submissions())[0]
+  # Get the first submission only (one per_page=1 request)
+  submission = listing.first(target_assignment.get_submissions())
+  if not submission:
+    print(f"❌ No submissions for '{assignment_name}'")
+    return []
   return submission.__dict__
 
 def download_assignment_submissions(course, assignment_name, download_folder="downloads"):
@@ -252,21 +258,21 @@ def t7_download_assignment_submissions_demo(course, assignment_name, download_fo
 
 # 8. STUDENT ANALYTICS
 def show_course_analytics(course):
-  students = list(course.get_users(enrollment_type=['student']))
-  assignments = list(course.get_assignments())
-  
+  assignments = sorted(course.get_assignments(per_page=100), key=lambda a: (a.due_at or ""), reverse=True)
+  student_count = counting.count_students(course)
+
+  # One paginated stream of the whole submission matrix (every student x every assignment)
+  # instead of one submissions listing per assignment; student_ids=['all'] is sent as student_ids[]=all
+  submissions = course.get_multiple_submissions(student_ids=['all'], per_page=analytics.SUBMISSIONS_PER_PAGE)
+  rates = analytics.submission_rates(submissions, assignments, student_count)
+
   print(f"📊 Course Analytics:")
-  print(f"   Total students: {len(students)}")
+  print(f"   Total students: {student_count}")
   print(f"   Total assignments: {len(assignments)}")
-  
-  # Show submission rates for recent assignments
-  assignments = sorted(course.get_assignments(), key=lambda a: (a.due_at or ""), reverse=True)
-  recent_assignments = assignments[:3] if len(assignments) >= 3 else assignments
-  for assignment in recent_assignments:
-    submissions = list(assignment.get_submissions())
-    submitted_count = sum(1 for s in submissions if s.submitted_at)
-    percentage = (submitted_count / len(students)) * 100 if students else 0
-    print(f"   {assignment.name}: {submitted_count}/{len(students)} ({percentage:.1f}%)")
+
+  # Show submission rates for every assignment, most recent first
+  for rate in rates:
+    print(f"   {rate['name']}: {rate['submitted']}/{rate['students']} ({rate['rate']:.1f}%)")
 
 def t8_show_course_analytics_demo(course):
   print("\n8. 📈 STUDENT ANALYTICS")
@@ -0,0 +1,51 @@
+import json
+import os
+import sys
+
+import requests
+from requests.adapters import BaseAdapter
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from canvasutils.httputil import http_session # type: ignore
+from canvasutils.httputil.cassette import Cassette, install_cassette, RECORD, REPLAY, ZERO_LATENCY # type: ignore
+
+TOKEN = 'Bearer secret-token'
+
+class CookieAdapter(BaseAdapter):
+    """Answers every request like Canvas does, with session cookies and the credentials echoed"""
+
+    def send(self, request, **kwargs):
+        return http_session.build_response(request, 200, {
+            'Content-Type': 'application/json',
+            'Set-Cookie': '_csrf_token=abc123; path=/, canvas_session=s3cr3t; path=/; HttpOnly',
+            'Cookie': 'canvas_session=s3cr3t',
+            'Authorization': TOKEN,
+            'X-Rate-Limit-Remaining': '700.0',
+        }, b'[{"id": 1}]')
+
+    def close(self):
+        pass
+
+def session_with(cassette):
+    session = requests.Session()
+    session.mount('https://', CookieAdapter())
+    session.headers['Authorization'] = TOKEN
+    return install_cassette(session, cassette)
+
+def test_record_never_writes_cookies_or_credentials(tmp_path):
+    path = str(tmp_path / 'cassette.jsonl')
+    cassette = Cassette(path, mode=RECORD)
+    session_with(cassette).get('https://canvas.test/api/v1/courses')
+    cassette.close()
+
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    headers = {k.lower() for k in json.loads(text)['headers']}
+    assert not headers & {'set-cookie', 'cookie', 'authorization'}
+    assert 's3cr3t' not in text and 'abc123' not in text and 'secret-token' not in text
+    assert 'x-rate-limit-remaining' in headers
+
+    replayed = session_with(Cassette(path, mode=REPLAY, timing=ZERO_LATENCY)).get(
+        'https://canvas.test/api/v1/courses')
+    assert replayed.json() == [{'id': 1}]
+    assert 'Set-Cookie' not in replayed.headers